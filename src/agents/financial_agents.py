@@ -2,86 +2,500 @@
 금융 관련 에이전트들
 Financial Agents
 """
+import functools
 import json
 import logging
-from typing import Dict, Any
+import time
+from typing import Callable, Dict, Any, Optional
 import os
 import google.generativeai as genai
+from langgraph.config import get_config, get_stream_writer
 
 try:
     from ..workflows.state import FinancialAgentState
-    from ..tools.stock_tools import StockDataTool, FinancialNewsTool
+    from ..tools.stock_tools import FUNDAMENTAL_FIELDS, QUOTE_TIER, StockDataTool, FinancialNewsTool
     from ..tools.calculator_tool import CalculatorTool
+    from ..tools.llm_client import LLMClient, get_default_llm_client
+    from ..tools.registry import ToolRegistry, get_tool_registry
+    from ..tools.llm_cache import LLMResponseCache, get_default_llm_cache, llm_cache_key
+    from ..tools.ohlcv_store import OHLCVStore
+    from ..tools.symbol_universe import SymbolUniverse
+    from ..tools.news_archive import NewsArchive
+    from ..tools.disk_cache import get_default_disk_cache
+    from ..tools.resilience import GEMINI, allow_attempt, backoff_seconds, get_circuit_breaker
     from ..utils.data_normalizer import DataNormalizer
+    from ..utils.indicator_state import IndicatorState
+    from ..utils.records import QuoteRecord, NewsRecord, CalculationRecord, as_dict, json_default
+    from ..utils.blob_store import BlobStore, ensure_run_store, run_store_scope
+    from ..utils.analysis_reuse import (
+        ANALYSIS, RECOMMENDATIONS, AnalysisReuseCache, fingerprint_inputs, get_default_reuse_cache, reuse_marker
+    )
 except ImportError:
     # 테스트 환경에서 절대 import 사용
     from src.workflows.state import FinancialAgentState
-    from src.tools.stock_tools import StockDataTool, FinancialNewsTool
+    from src.tools.stock_tools import FUNDAMENTAL_FIELDS, QUOTE_TIER, StockDataTool, FinancialNewsTool
     from src.tools.calculator_tool import CalculatorTool
+    from src.tools.llm_client import LLMClient, get_default_llm_client
+    from src.tools.registry import ToolRegistry, get_tool_registry
+    from src.tools.llm_cache import LLMResponseCache, get_default_llm_cache, llm_cache_key
+    from src.tools.ohlcv_store import OHLCVStore
+    from src.tools.symbol_universe import SymbolUniverse
+    from src.tools.news_archive import NewsArchive
+    from src.tools.disk_cache import get_default_disk_cache
+    from src.tools.resilience import GEMINI, allow_attempt, backoff_seconds, get_circuit_breaker
     from src.utils.data_normalizer import DataNormalizer
+    from src.utils.indicator_state import IndicatorState
+    from src.utils.records import QuoteRecord, NewsRecord, CalculationRecord, as_dict, json_default
+    from src.utils.blob_store import BlobStore, ensure_run_store, run_store_scope
+    from src.utils.analysis_reuse import (
+        ANALYSIS, RECOMMENDATIONS, AnalysisReuseCache, fingerprint_inputs, get_default_reuse_cache, reuse_marker
+    )
 
 logger = logging.getLogger(__name__)
 
+# 워크플로우 stream 실행 설정(configurable)의 토큰 스트리밍 플래그
+STREAM_TOKENS = "stream_tokens"
+
+# 지표 상태 체크포인트용 디스크 캐시 네임스페이스
+INDICATOR_NAMESPACE = "indicator_state"
+
+# 시세 계층에는 없고 펀더멘털 조회로만 채워지는 필드 (normalize_stock_data 기준)
+FUNDAMENTAL_SUMMARY_FIELDS = (
+    ("valuation_summary", "pe_ratio"), ("valuation_summary", "market_cap"),
+    ("range_summary", "high_52w"), ("range_summary", "low_52w")
+)
+
+
+def _has_fundamentals(stock_fields: Dict) -> bool:
+    """정규화된 시세에 PER/시가총액/52주 범위 중 하나라도 값이 있는지"""
+    return any(
+        stock_fields.get(section, {}).get(field) not in (None, "N/A")
+        for section, field in FUNDAMENTAL_SUMMARY_FIELDS
+    )
+
+
+def _in_run_store_scope(node):
+    """노드를 run_store_scope 안에서 실행 (워크플로우 밖에서 직접 호출해도 저장소가 열린 채 남지 않음)"""
+    @functools.wraps(node)
+    def wrapper(self, state: FinancialAgentState) -> FinancialAgentState:
+        with run_store_scope(state):
+            return node(self, state)
+    return wrapper
+
 
 class FinancialAgent:
     """기본 금융 에이전트"""
     
-    def __init__(self, google_ai_api_key: str, tavily_api_key: str = None):
-        # Google AI 설정
-        genai.configure(api_key=google_ai_api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash-exp')  # Gemini 2.0 Flash (최신 모델)
-        self.stock_tool = StockDataTool()
-        self.news_tool = FinancialNewsTool(tavily_api_key)
-        self.calculator_tool = CalculatorTool()
+    def __init__(self, google_ai_api_key: str, tavily_api_key: str = None,
+                 llm_client: Optional[LLMClient] = None,
+                 tool_registry: Optional[ToolRegistry] = None,
+                 llm_cache: Optional[LLMResponseCache] = None):
+        # LLM 클라이언트와 도구는 프로세스 단위로 공유 (모델/도구는 처음 쓸 때 생성)
+        self.llm_client = llm_client if llm_client is not None else get_default_llm_client(google_ai_api_key)
+        self.tool_registry = tool_registry if tool_registry is not None else get_tool_registry(tavily_api_key)
+        self._llm_cache = llm_cache
+        self._reuse_cache: Optional[AnalysisReuseCache] = None
     
-    def _call_llm(self, messages: list, temperature: float = 0.1) -> str:
-        """LLM 호출 - Google Gemini 사용"""
-        try:
-            # Gemini API 형식으로 메시지 변환
-            prompt_text = ""
-            for msg in messages:
-                role = msg.get("role", "user")
-                content = msg.get("content", "")
-                if role == "system":
-                    prompt_text += f"System: {content}\n\n"
-                elif role == "user":
-                    prompt_text += f"User: {content}\n\n"
-                elif role == "assistant":
-                    prompt_text += f"Assistant: {content}\n\n"
-            
-            # Google AI 생성 설정
-            generation_config = genai.types.GenerationConfig(
-                temperature=temperature,
-                max_output_tokens=1000,
-                top_p=0.8,
-                top_k=40
-            )
-            
-            response = self.model.generate_content(
-                prompt_text,
-                generation_config=generation_config
-            )
-            
-            return response.text
-        except Exception as e:
-            error_msg = str(e)
-            logger.error(f"LLM 호출 실패: {error_msg}")
+    @property
+    def model(self):
+        return self.llm_client.model
+    
+    @property
+    def llm_cache(self) -> Optional[LLMResponseCache]:
+        return self._llm_cache if self._llm_cache is not None else get_default_llm_cache()
+    
+    @property
+    def reuse_cache(self) -> Optional[AnalysisReuseCache]:
+        return self._reuse_cache if self._reuse_cache is not None else get_default_reuse_cache()
+    
+    def _lookup_reusable(self, kind: str, state: FinancialAgentState):
+        """
+        입력 지문이 최근 결과와 허용 범위 안에서 같으면 그 LLM 결과를 재사용
+        
+        Returns:
+            (지문, 재사용 결과, 나이(초)) - 재사용할 결과가 없으면 결과/나이는 None
+        """
+        cache = self.reuse_cache
+        if cache is None:
+            return None, None, None
+        fingerprint = fingerprint_inputs(
+            state.get("stock_data"), state.get("news_data"), state.get("user_query", ""), cache.tolerance
+        )
+        output, age = cache.lookup(kind, fingerprint)
+        return fingerprint, output, age
+    
+    @staticmethod
+    def _mark_reuse(state: FinancialAgentState, kind: str, age: Optional[float]) -> None:
+        reuse_info = dict(state.get("reuse_info") or {})
+        reuse_info[kind] = reuse_marker(age)
+        state["reuse_info"] = reuse_info
+    
+    @staticmethod
+    def _record_tool_use(state: FinancialAgentState, tool_history: list, tool: str,
+                         tool_input: Dict, result: Dict) -> None:
+        """도구 사용 기록: 원시 결과는 실행 저장소에 한 번만 저장하고 핸들만 남김"""
+        tool_history.append({
+            "tool": tool,
+            "input": tool_input,
+            "status": result.get("status"),
+            "output_ref": ensure_run_store(state).put(result),
+            "timestamp": result.get("timestamp", "")
+        })
+    
+    def _with_fundamentals(self, state: FinancialAgentState) -> Any:
+        """
+        시세 계층만 수집된 경우 펀더멘털(PER, 시가총액, 52주 범위)을 조회해 상태의 stock_data 에 반영
+        
+        분석/추천 노드가 재사용 지문을 만들기 전에 호출합니다. 두 노드가 같은 데이터(시세 + 펀더멘털)로
+        지문을 만들어야 서로의 결과를 재사용할 수 있습니다. 펀더멘털은 긴 TTL 로 캐시되므로
+        같은 실행의 다음 노드나 최근 실행에서는 업스트림 호출이 없습니다.
+        
+        Returns:
+            펀더멘털이 채워진 stock_data (조회 실패 시 기존 값 그대로)
+        """
+        stock_data = state.get("stock_data")
+        # src.utils / utils 처럼 다른 경로로 import 된 레코드도 허용
+        stock_fields = stock_data.to_dict() if hasattr(stock_data, "to_dict") else stock_data
+        if not stock_fields or stock_fields.get("status") != "success" or _has_fundamentals(stock_fields):
+            return stock_data
+        
+        symbol = stock_fields.get("symbol")
+        fundamentals = self.stock_tool.fundamentals(symbol)
+        self._record_tool_use(
+            state, state.setdefault("tool_history", []), "stock_data_tool",
+            {"symbol": symbol, "tier": "fundamentals"}, fundamentals
+        )
+        if fundamentals.get("status") != "success":
+            logger.warning({
+                "agent": self.__class__.__name__,
+                "action": "fundamentals_failed",
+                "symbol": symbol,
+                "error": fundamentals.get("error", "Unknown error")
+            })
+            return stock_data
+        
+        price = stock_fields.get("price_summary", {})
+        trading = stock_fields.get("trading_summary", {})
+        normalized = DataNormalizer.normalize_stock_data(
+            {
+                "status": "success",
+                "symbol": symbol,
+                "current_price": price.get("current"),
+                "change": price.get("change"),
+                "change_percent": price.get("change_percent"),
+                "volume": trading.get("volume"),
+                **{field: fundamentals.get(field, "N/A") for field in FUNDAMENTAL_FIELDS}
+            },
+            technical_summary=stock_fields.get("technical_summary")
+        )
+        # 시세 수집 시각과 원시 시세 핸들은 그대로 유지
+        normalized["timestamp"] = stock_fields.get("timestamp", normalized["timestamp"])
+        normalized["_raw_ref"] = stock_fields.get("_raw_ref")
+        stock_data = QuoteRecord.from_normalized(normalized)
+        state["stock_data"] = stock_data
+        return stock_data
+    
+    @property
+    def stock_tool(self) -> StockDataTool:
+        return self.tool_registry.stock_tool
+    
+    @property
+    def news_tool(self) -> FinancialNewsTool:
+        return self.tool_registry.news_tool
+    
+    @property
+    def calculator_tool(self) -> CalculatorTool:
+        return self.tool_registry.calculator_tool
+    
+    def _call_llm(self, messages: list, temperature: float = 0.1, max_retries: int = 2,
+                  on_token: Optional[Callable[[str], None]] = None) -> str:
+        """
+        LLM 호출 - Google Gemini 사용
+        
+        Gemini 서킷 브레이커가 열려 있으면 바로 대체 메시지를 반환하고,
+        일시적 오류의 재시도는 도구들과 공유하는 재시도 예산 안에서만 수행합니다.
+        같은 프롬프트/모델/생성 설정의 정상 응답은 LLM 응답 캐시에서 바로 반환합니다.
+        (할당량/오류 대체 메시지는 캐시하지 않음)
+        
+        on_token 이 주어지면 stream=True 로 호출해 받은 텍스트 조각을 바로 넘기고,
+        캐시 히트는 전체 응답을 한 조각으로 넘깁니다. 반환값은 항상 전체 응답입니다.
+        """
+        # Gemini API 형식으로 메시지 변환
+        prompt_text = ""
+        for msg in messages:
+            role = msg.get("role", "user")
+            content = msg.get("content", "")
+            if role == "system":
+                prompt_text += f"System: {content}\n\n"
+            elif role == "user":
+                prompt_text += f"User: {content}\n\n"
+            elif role == "assistant":
+                prompt_text += f"Assistant: {content}\n\n"
+        
+        # Google AI 생성 설정
+        config_fields = {
+            "temperature": temperature,
+            "max_output_tokens": 1000,
+            "top_p": 0.8,
+            "top_k": 40
+        }
+        generation_config = genai.types.GenerationConfig(**config_fields)
+        
+        cache = self.llm_cache
+        cache_key = None
+        if cache is not None:
+            cache_key = llm_cache_key(prompt_text, self.llm_client.model_name, config_fields)
+            cached, _ = cache.get(cache_key)
+            if cached is not None:
+                if on_token is not None:
+                    on_token(cached)
+                return cached
+        
+        breaker = get_circuit_breaker(GEMINI)
+        error_msg = None
+        for attempt in range(max_retries):
+            if not allow_attempt(breaker, attempt):
+                break
             
-            # 할당량 초과 오류인 경우 특별 처리
-            if "quota" in error_msg.lower() or "429" in error_msg or "quota" in error_msg.lower():
-                return "API 할당량이 부족하여 LLM 분석을 수행할 수 없습니다. 주식 데이터와 뉴스 정보만으로 분석을 제공합니다."
-            elif "rate limit" in error_msg.lower():
-                return "API 호출 한도에 도달했습니다. 잠시 후 다시 시도해주세요."
-            else:
-                return f"LLM 호출 중 오류가 발생했습니다: {error_msg}"
+            streamed_parts = []
+            try:
+                if on_token is None:
+                    response = self.llm_client.generate_content(
+                        prompt_text,
+                        generation_config=generation_config
+                    )
+                    text = response.text
+                    usage = getattr(response, "usage_metadata", None)
+                else:
+                    usage = self._stream_llm(prompt_text, generation_config, on_token, streamed_parts)
+                    text = "".join(streamed_parts)
+                breaker.record_success()
+                if cache_key is not None and text:
+                    cache.set(cache_key, text, tokens=getattr(usage, "total_token_count", 0) or 0)
+                return text
+            except Exception as e:
+                breaker.record_failure()
+                error_msg = str(e)
+                logger.error(f"LLM 호출 실패: {error_msg}")
+                
+                # 할당량 초과는 재시도해도 같은 결과, 이미 내보낸 토큰이 있으면 재시도 시 중복됨
+                if "quota" in error_msg.lower() or streamed_parts or attempt == max_retries - 1:
+                    break
+                time.sleep(backoff_seconds(attempt))
+        
+        if error_msg is None:
+            # 서킷 오픈: 대체 응답 판별 문구("LLM 호출 중 오류")를 유지
+            error_msg = "Gemini 업스트림 장애로 호출이 일시 중단되었습니다. (서킷 오픈)"
+        
+        # 할당량 초과 오류인 경우 특별 처리
+        if "quota" in error_msg.lower() or "429" in error_msg:
+            return "API 할당량이 부족하여 LLM 분석을 수행할 수 없습니다. 주식 데이터와 뉴스 정보만으로 분석을 제공합니다."
+        elif "rate limit" in error_msg.lower():
+            return "API 호출 한도에 도달했습니다. 잠시 후 다시 시도해주세요."
+        else:
+            return f"LLM 호출 중 오류가 발생했습니다: {error_msg}"
+
+
+    def _stream_llm(self, prompt_text: str, generation_config, on_token: Callable[[str], None],
+                    parts: list):
+        """
+        스트리밍 호출: 받은 텍스트 조각을 parts 에 모으며 on_token 으로 전달
+        
+        Returns:
+            마지막 조각의 usage_metadata (없으면 None)
+        """
+        started = time.perf_counter()
+        first_token_ms = None
+        usage = None
+        for chunk in self.llm_client.stream_content(prompt_text, generation_config=generation_config):
+            usage = getattr(chunk, "usage_metadata", None) or usage
+            try:
+                text = chunk.text
+            except ValueError:
+                # 마지막 STOP/MAX_TOKENS 조각처럼 Part 가 없는 조각은 .text 접근 시 ValueError
+                continue
+            if not text:
+                continue
+            if first_token_ms is None:
+                first_token_ms = (time.perf_counter() - started) * 1000
+            parts.append(text)
+            on_token(text)
+        
+        logger.info({
+            "llm": self.llm_client.model_name,
+            "mode": "stream",
+            "first_token_ms": round(first_token_ms, 1) if first_token_ms is not None else None,
+            "total_ms": round((time.perf_counter() - started) * 1000, 1),
+            "chunks": len(parts)
+        })
+        return usage
+    
+    @staticmethod
+    def _token_emitter(node: str) -> Optional[Callable[[str], None]]:
+        """
+        FinancialWorkflow.stream(stream_tokens=True) 실행 중이면 토큰을 LangGraph custom 스트림으로
+        내보내는 콜백, 그 외(run, 노드 직접 호출)에는 None
+        """
+        try:
+            config = get_config()
+        except RuntimeError:
+            return None
+        if not config.get("configurable", {}).get(STREAM_TOKENS):
+            return None
+        writer = get_stream_writer()
+        return lambda text: writer({"node": node, "token": text})
 
 
 class ResearchAgent(FinancialAgent):
     """데이터 수집 전문 에이전트"""
     
-    def __init__(self, google_ai_api_key: str, tavily_api_key: str = None):
-        super().__init__(google_ai_api_key, tavily_api_key)
+    def __init__(self, google_ai_api_key: str, tavily_api_key: str = None,
+                 ohlcv_store: Optional[OHLCVStore] = None, history_interval: str = "1d",
+                 symbol_universe: Optional[SymbolUniverse] = None,
+                 news_archive: Optional[NewsArchive] = None, news_refresh_seconds: float = 900.0,
+                 news_archive_items: int = 10, llm_client: Optional[LLMClient] = None,
+                 tool_registry: Optional[ToolRegistry] = None,
+                 llm_cache: Optional[LLMResponseCache] = None, news_query_fanout: int = 1):
+        super().__init__(google_ai_api_key, tavily_api_key, llm_client, tool_registry, llm_cache)
+        self.ohlcv_store = ohlcv_store
+        # 실행당 Tavily 검색 쿼리 수 (1 이면 티커 쿼리만, 최대 3: 티커/회사명/실적)
+        self.news_query_fanout = max(1, news_query_fanout)
+        # 뉴스 아카이브: 마지막 수집 후 news_refresh_seconds 동안은 Tavily 대신 최근 기사 사용
+        self.news_archive = news_archive
+        self.news_refresh_seconds = news_refresh_seconds
+        self.news_archive_items = news_archive_items
+        # 유니버스가 없으면 형식 검사만 수행
+        self.symbol_universe = symbol_universe if symbol_universe is not None else SymbolUniverse()
+        self.history_interval = history_interval
+        self._indicator_states: Dict[str, IndicatorState] = {}
     
+    def load_price_history(self, symbol: str, start: Optional[int] = None,
+                           end: Optional[int] = None) -> Optional[Dict]:
+        """
+        저장소의 과거 OHLCV 를 메모리 매핑 뷰로 반환 (복사 없음)
+        
+        Args:
+            symbol: 주식 심볼
+            start: 시작 시각 (epoch 초, 포함)
+            end: 종료 시각 (epoch 초, 포함)
+            
+        Returns:
+            컬럼명 → numpy 배열 뷰, 저장소가 없거나 데이터가 없으면 None
+        """
+        if self.ohlcv_store is None:
+            return None
+        return self.ohlcv_store.range(symbol, self.history_interval, start, end)
+    
+    def _collect_news(self, stock_symbol: str, news_queries: list, blob_store: Optional[BlobStore] = None):
+        """
+        뉴스 수집 및 정규화
+        
+        1. 정규화 결과 캐시 (재시도 엣지로 다시 들어온 경우 등): HTTP 호출/정규화 모두 생략
+        2. 아카이브가 최근에 수집된 상태면 Tavily 없이 아카이브의 최근 기사로 요약
+        3. 그 외에는 검색 후 아카이브에 없는 새 기사만 감성 점수를 매겨 저장
+        
+        blob_store 가 있으면 정규화 결과에는 원시 검색 결과 대신 핸들(_raw_ref)을 기록합니다.
+        
+        Returns:
+            (뉴스 도구 결과 또는 캐시/아카이브 표시, 정규화된 뉴스 데이터 또는 None)
+        """
+        news_query = " | ".join(news_queries)
+        normalized_news = self.news_tool.cached_normalized(news_query, max_results=3)
+        if normalized_news is not None:
+            return {"status": "success", "query": news_query, "cached": True}, normalized_news
+        
+        archive = self.news_archive
+        if archive is not None and archive.is_fresh(stock_symbol, self.news_refresh_seconds):
+            items = archive.latest(stock_symbol, self.news_archive_items)
+            if items:
+                news_result = {"status": "success", "query": news_query, "archived": True}
+                return news_result, DataNormalizer.summarize_news_items(items)
+        
+        news_result = self.news_tool.run_many(news_queries, max_results=3)
+        if news_result.get("status") != "success":
+            return news_result, None
+        
+        if archive is None:
+            normalized_news = DataNormalizer.normalize_news_data(news_result, blob_store=blob_store)
+        else:
+            # 이미 저장된 기사는 다시 점수 매기지 않음
+            new_items = archive.unseen(stock_symbol, news_result.get("results", []))
+            scored = DataNormalizer.normalize_news_data({"status": "success", "results": new_items})
+            archive.append(stock_symbol, scored.get("news_items", []))
+            normalized_news = DataNormalizer.summarize_news_items(
+                archive.latest(stock_symbol, self.news_archive_items),
+                news_result,
+                total_count=news_result.get("total_results"),
+                blob_store=blob_store
+            )
+        
+        self.news_tool.store_normalized(news_query, 3, normalized_news)
+        return news_result, normalized_news
+    
+    def _news_queries(self, stock_symbol: str) -> list:
+        """뉴스 검색 쿼리 목록: 티커, 회사명(상장 목록에 있으면), 실적 중 앞의 news_query_fanout 개"""
+        queries = [f"{stock_symbol} stock news"]
+        company = (self.symbol_universe.name(stock_symbol) or "").split(" - ")[0].strip()
+        if company:
+            queries.append(f"{company} news")
+        queries.append(f"{stock_symbol} earnings")
+        return queries[:self.news_query_fanout]
+    
+    def _update_price_history(self, stock_symbol: str, state: FinancialAgentState,
+                              tool_history: list) -> Optional[Dict]:
+        """과거 시세를 저장소에 증분 적재하고 지표 요약을 반환 (저장소가 없으면 None)"""
+        if self.ohlcv_store is None:
+            return None
+        
+        history_result = self.stock_tool.update_history(
+            stock_symbol, self.ohlcv_store, interval=self.history_interval
+        )
+        self._record_tool_use(
+            state, tool_history, "stock_data_tool",
+            {"symbol": stock_symbol, "history_interval": self.history_interval}, history_result
+        )
+        state["market_data"] = history_result
+        
+        # 네트워크 갱신이 실패해도 이미 저장된 이력으로 지표 계산
+        return self._update_indicators(stock_symbol)
+    
+    def _update_indicators(self, stock_symbol: str) -> Optional[Dict]:
+        """
+        지표 상태에 새 봉만 반영하고 요약을 반환합니다.
+        
+        마지막 봉은 아직 진행 중일 수 있으므로 상태에 확정하지 않고 미리보기로만 반영합니다.
+        상태는 디스크 캐시에 체크포인트되어 재시작 후에도 이어서 갱신됩니다.
+        """
+        key = f"{stock_symbol.upper()}_{self.history_interval}"
+        disk = get_default_disk_cache()
+        
+        indicator_state = self._indicator_states.get(key)
+        if indicator_state is None and disk is not None:
+            checkpoint, _ = disk.get(INDICATOR_NAMESPACE, key, max_age=float("inf"))
+            if checkpoint is not None:
+                indicator_state = IndicatorState.from_dict(checkpoint)
+        if indicator_state is None:
+            indicator_state = IndicatorState()
+        
+        start = indicator_state.last_timestamp + 1 if indicator_state.last_timestamp is not None else None
+        bars = self.load_price_history(stock_symbol, start=start)
+        if not bars or len(bars["close"]) == 0:
+            self._indicator_states[key] = indicator_state
+            return indicator_state.snapshot() if indicator_state.bars else None
+        
+        added = indicator_state.update_many(
+            bars["timestamp"][:-1], bars["high"][:-1], bars["low"][:-1], bars["close"][:-1]
+        )
+        self._indicator_states[key] = indicator_state
+        if added and disk is not None:
+            disk.set(INDICATOR_NAMESPACE, key, indicator_state.to_dict())
+        
+        return indicator_state.preview(
+            int(bars["timestamp"][-1]), float(bars["high"][-1]),
+            float(bars["low"][-1]), float(bars["close"][-1])
+        )
+    
+    @_in_run_store_scope
     def research_node(self, state: FinancialAgentState) -> FinancialAgentState:
         """연구 단계 - 주식 데이터와 뉴스 수집"""
         logger.info({
@@ -109,18 +523,23 @@ class ResearchAgent(FinancialAgent):
             "symbol": stock_symbol
         })
         
-        stock_result = self.stock_tool.run(stock_symbol)
-        tool_history.append({
-            "tool": "stock_data_tool",
-            "input": {"symbol": stock_symbol},
-            "output": stock_result,
-            "timestamp": stock_result.get("timestamp", "")
-        })
+        # 시세만 먼저 조회 (펀더멘털은 분석/추천 단계에서 _with_fundamentals 로 조회)
+        # 상장 목록에 없는 심볼은 네트워크 호출 없이 바로 실패
+        stock_result = self.symbol_universe.validate(stock_symbol)
+        if stock_result["status"] == "success":
+            stock_result = self.stock_tool.run(stock_symbol, tier=QUOTE_TIER)
+        self._record_tool_use(
+            state, tool_history, "stock_data_tool", {"symbol": stock_symbol, "tier": QUOTE_TIER}, stock_result
+        )
         
         if stock_result.get("status") == "success":
-            # 데이터 정규화 및 요약
-            normalized_stock = DataNormalizer.normalize_stock_data(stock_result)
-            state["stock_data"] = normalized_stock
+            # 과거 시세 증분 적재 후 데이터 정규화 및 요약 (기술적 지표 포함)
+            technical_summary = self._update_price_history(stock_symbol, state, tool_history)
+            normalized_stock = DataNormalizer.normalize_stock_data(
+                stock_result, technical_summary=technical_summary, blob_store=ensure_run_store(state)
+            )
+            # 상태에는 원시 응답(_raw)을 뺀 불변 레코드만 보관 (원시 응답은 tool_history 에 있음)
+            state["stock_data"] = QuoteRecord.from_normalized(normalized_stock)
             
             # 구조적 로깅
             logger.info({
@@ -140,6 +559,8 @@ class ResearchAgent(FinancialAgent):
             })
         else:
             error_msg = f"주식 데이터 수집 실패: {stock_result.get('error', 'Unknown error')}"
+            if stock_result.get("suggestions"):
+                error_msg += f" (비슷한 심볼: {', '.join(stock_result['suggestions'])})"
             errors.append(error_msg)
             
             logger.error({
@@ -155,8 +576,9 @@ class ResearchAgent(FinancialAgent):
                 "content": error_msg
             })
         
-        # 뉴스 데이터 수집
-        news_query = f"{stock_symbol} stock news"
+        # 뉴스 데이터 수집 (티커/회사명/실적 쿼리를 동시에 검색해 병합)
+        news_queries = self._news_queries(stock_symbol)
+        news_query = " | ".join(news_queries)
         
         logger.info({
             "agent": "ResearchAgent",
@@ -164,18 +586,15 @@ class ResearchAgent(FinancialAgent):
             "query": news_query
         })
         
-        news_result = self.news_tool.run(news_query, max_results=3)
-        tool_history.append({
-            "tool": "financial_news_tool",
-            "input": {"query": news_query, "max_results": 3},
-            "output": news_result,
-            "timestamp": news_result.get("timestamp", "")
-        })
+        news_result, normalized_news = self._collect_news(stock_symbol, news_queries, ensure_run_store(state))
+        
+        self._record_tool_use(
+            state, tool_history, "financial_news_tool",
+            {"queries": news_queries, "max_results": 3}, news_result
+        )
         
         if news_result.get("status") == "success":
-            # 뉴스 데이터 정규화 및 요약
-            normalized_news = DataNormalizer.normalize_news_data(news_result)
-            state["news_data"] = normalized_news
+            state["news_data"] = NewsRecord.from_normalized(normalized_news)
             
             # 구조적 로깅
             news_overview = normalized_news.get("news_overview", {})
@@ -186,6 +605,8 @@ class ResearchAgent(FinancialAgent):
                 "total_count": news_overview.get("total_count", 0),
                 "sentiment": news_overview.get("overall_sentiment", "unknown"),
                 "sentiment_breakdown": news_overview.get("sentiment_breakdown", {}),
+                "cached": news_result.get("cached", False),
+                "archived": news_result.get("archived", False),
                 "status": "success"
             })
             
@@ -231,9 +652,15 @@ class ResearchAgent(FinancialAgent):
 class AnalysisAgent(FinancialAgent):
     """분석 전문 에이전트"""
     
-    def __init__(self, google_ai_api_key: str, tavily_api_key: str = None):
-        super().__init__(google_ai_api_key, tavily_api_key)
+    def __init__(self, google_ai_api_key: str, tavily_api_key: str = None,
+                 llm_client: Optional[LLMClient] = None,
+                 tool_registry: Optional[ToolRegistry] = None,
+                 llm_cache: Optional[LLMResponseCache] = None,
+                 reuse_cache: Optional[AnalysisReuseCache] = None):
+        super().__init__(google_ai_api_key, tavily_api_key, llm_client, tool_registry, llm_cache)
+        self._reuse_cache = reuse_cache
     
+    @_in_run_store_scope
     def analyze_node(self, state: FinancialAgentState) -> FinancialAgentState:
         """분석 단계 - 수집된 데이터 분석"""
         logger.info({
@@ -242,29 +669,39 @@ class AnalysisAgent(FinancialAgent):
             "status": "starting"
         })
         
-        stock_data = state.get("stock_data")
+        # 재사용 지문과 분석 프롬프트 모두 PER/52주 범위를 쓰므로 먼저 펀더멘털을 채움 (캐시)
+        stock_data = self._with_fundamentals(state)
         news_data = state.get("news_data", [])
         messages = state.get("messages", [])
         
-        # 분석 프롬프트 생성
-        analysis_prompt = self._create_analysis_prompt(stock_data, news_data, state.get("user_query", ""))
-        
-        llm_messages = [
-            {"role": "system", "content": "당신은 전문적인 주식 분석가입니다. 주어진 데이터를 바탕으로 객관적이고 전문적인 분석을 제공하세요."},
-            {"role": "user", "content": analysis_prompt}
-        ]
-        
-        # LLM으로 분석 수행
-        analysis_result = self._call_llm(llm_messages)
-        
-        # LLM 호출 실패시 기본 분석 제공
-        if "API 할당량이 부족" in analysis_result or "LLM 호출 중 오류" in analysis_result:
-            analysis_result = self._create_fallback_analysis(stock_data, news_data)
+        on_token = self._token_emitter("analyze")
+        fingerprint, analysis_result, reused_age = self._lookup_reusable(ANALYSIS, state)
+        if analysis_result is not None and on_token is not None:
+            on_token(analysis_result)
+        if analysis_result is None:
+            # 분석 프롬프트 생성
+            analysis_prompt = self._create_analysis_prompt(stock_data, news_data, state.get("user_query", ""))
+            
+            llm_messages = [
+                {"role": "system", "content": "당신은 전문적인 주식 분석가입니다. 주어진 데이터를 바탕으로 객관적이고 전문적인 분석을 제공하세요."},
+                {"role": "user", "content": analysis_prompt}
+            ]
+            
+            # LLM으로 분석 수행
+            analysis_result = self._call_llm(llm_messages, on_token=on_token)
+            
+            # LLM 호출 실패시 기본 분석 제공 (대체 분석은 재사용하지 않음)
+            if "API 할당량이 부족" in analysis_result or "LLM 호출 중 오류" in analysis_result:
+                analysis_result = self._create_fallback_analysis(stock_data, news_data)
+            elif self.reuse_cache is not None:
+                self.reuse_cache.store(ANALYSIS, fingerprint, analysis_result)
         
         state["analysis"] = analysis_result
+        self._mark_reuse(state, ANALYSIS, reused_age)
+        reused_note = f" (입력 변화 없음, {reused_age:.0f}초 전 분석 재사용)" if reused_age is not None else ""
         messages.append({
             "role": "assistant",
-            "content": f"분석 완료: {analysis_result[:200]}..."
+            "content": f"분석 완료{reused_note}: {analysis_result[:200]}..."
         })
         
         state.update({
@@ -281,27 +718,35 @@ class AnalysisAgent(FinancialAgent):
     
     def _create_analysis_prompt(self, stock_data: Dict, news_data: list, user_query: str) -> str:
         """분석을 위한 프롬프트 생성"""
+        stock_fields = stock_data.to_dict() if hasattr(stock_data, "to_dict") else stock_data
+        if stock_fields and _has_fundamentals(stock_fields):
+            indicator_item = "2. 주요 지표 분석 (PER, 거래량, 52주 고저점 등)"
+        else:
+            indicator_item = "2. 주요 지표 분석 (거래량 등, PER/52주 고저점 데이터는 없으므로 추정하지 마세요)"
         prompt = f"""
 사용자 질문: {user_query}
 
 주식 데이터:
-{json.dumps(stock_data, indent=2, ensure_ascii=False) if stock_data else "주식 데이터를 가져올 수 없었습니다."}
+{json.dumps(stock_data, indent=2, ensure_ascii=False, default=json_default) if stock_data else "주식 데이터를 가져올 수 없었습니다."}
 
 뉴스 데이터:
-{json.dumps(news_data, indent=2, ensure_ascii=False) if news_data else "뉴스 데이터를 가져올 수 없었습니다."}
+{json.dumps(news_data, indent=2, ensure_ascii=False, default=json_default) if news_data else "뉴스 데이터를 가져올 수 없었습니다."}
 
 위 데이터를 바탕으로 다음을 분석해주세요:
 1. 현재 주가 상황과 트렌드
-2. 주요 지표 분석 (PER, 거래량, 52주 고저점 등)
+{indicator_item}
 3. 최신 뉴스의 영향 분석
 4. 기술적/기본적 분석 결론
 
+기술적 지표(SMA, EMA, RSI, MACD, 볼린저 밴드, ATR, 변동성)는 주식 데이터의 technical_summary 에
+미리 계산된 값을 그대로 사용하고, 값이 없으면 추정하지 마세요.
 분석은 객관적이고 전문적으로 작성해주세요.
 """
         return prompt
     
     def _create_fallback_analysis(self, stock_data: Dict, news_data: list) -> str:
         """LLM 호출 실패시 기본 분석 제공"""
+        stock_data, news_data = as_dict(stock_data), as_dict(news_data)
         if not stock_data:
             return "주식 데이터를 가져올 수 없어 분석을 수행할 수 없습니다."
         
@@ -362,9 +807,15 @@ class AnalysisAgent(FinancialAgent):
 class RecommendationAgent(FinancialAgent):
     """추천 전문 에이전트"""
     
-    def __init__(self, google_ai_api_key: str, tavily_api_key: str = None):
-        super().__init__(google_ai_api_key, tavily_api_key)
+    def __init__(self, google_ai_api_key: str, tavily_api_key: str = None,
+                 llm_client: Optional[LLMClient] = None,
+                 tool_registry: Optional[ToolRegistry] = None,
+                 llm_cache: Optional[LLMResponseCache] = None,
+                 reuse_cache: Optional[AnalysisReuseCache] = None):
+        super().__init__(google_ai_api_key, tavily_api_key, llm_client, tool_registry, llm_cache)
+        self._reuse_cache = reuse_cache
     
+    @_in_run_store_scope
     def recommend_node(self, state: FinancialAgentState) -> FinancialAgentState:
         """추천 단계 - 투자 추천사항 생성"""
         logger.info({
@@ -374,14 +825,16 @@ class RecommendationAgent(FinancialAgent):
         })
         
         analysis = state.get("analysis", "")
-        stock_data = state.get("stock_data")
+        # 분석 단계와 같은 데이터로 지문을 만들도록 펀더멘털을 채움 (분석 단계에서 채웠으면 그대로)
+        stock_data = self._with_fundamentals(state)
         messages = state.get("messages", [])
         tool_history = state.get("tool_history", [])
+        stock_fields = as_dict(stock_data)
         
         # 계산이 필요한 경우 계산기 도구 사용
-        if stock_data and stock_data.get("current_price") != "N/A":
-            current_price = stock_data.get("current_price")
-            pe_ratio = stock_data.get("pe_ratio")
+        if stock_fields and stock_fields.get("current_price") != "N/A":
+            current_price = stock_fields.get("current_price")
+            pe_ratio = stock_fields.get("pe_ratio")
             
             if pe_ratio != "N/A" and pe_ratio:
                 # 예시: PER 기반 가치 평가 계산
@@ -390,31 +843,42 @@ class RecommendationAgent(FinancialAgent):
                 tool_history.append({
                     "tool": "calculator_tool",
                     "input": {"expression": calc_expression},
-                    "output": calc_result
+                    "output": CalculationRecord.from_result(calc_result)
                 })
         
-        # 추천 프롬프트 생성
-        recommendation_prompt = self._create_recommendation_prompt(analysis, stock_data)
-        
-        llm_messages = [
-            {"role": "system", "content": "당신은 신중하고 책임감 있는 투자 자문가입니다. 리스크와 보수를 균형있게 고려한 추천을 제공하세요. 모든 추천은 면책조항과 함께 제공하세요."},
-            {"role": "user", "content": recommendation_prompt}
-        ]
-        
-        # LLM으로 추천 생성
-        recommendation_result = self._call_llm(llm_messages)
-        
-        # LLM 호출 실패시 기본 추천 제공
-        if "API 할당량이 부족" in recommendation_result or "LLM 호출 중 오류" in recommendation_result:
-            recommendations = self._create_fallback_recommendations(stock_data, analysis)
+        on_token = self._token_emitter("recommend")
+        fingerprint, reused, reused_age = self._lookup_reusable(RECOMMENDATIONS, state)
+        if reused is not None:
+            recommendations = list(reused)
+            if on_token is not None:
+                on_token("\n".join(recommendations))
         else:
-            # 추천사항을 리스트로 파싱
-            recommendations = self._parse_recommendations(recommendation_result)
+            # 추천 프롬프트 생성
+            recommendation_prompt = self._create_recommendation_prompt(analysis, stock_data)
+            
+            llm_messages = [
+                {"role": "system", "content": "당신은 신중하고 책임감 있는 투자 자문가입니다. 리스크와 보수를 균형있게 고려한 추천을 제공하세요. 모든 추천은 면책조항과 함께 제공하세요."},
+                {"role": "user", "content": recommendation_prompt}
+            ]
+            
+            # LLM으로 추천 생성
+            recommendation_result = self._call_llm(llm_messages, on_token=on_token)
+            
+            # LLM 호출 실패시 기본 추천 제공 (대체 추천은 재사용하지 않음)
+            if "API 할당량이 부족" in recommendation_result or "LLM 호출 중 오류" in recommendation_result:
+                recommendations = self._create_fallback_recommendations(stock_data, analysis)
+            else:
+                # 추천사항을 리스트로 파싱
+                recommendations = self._parse_recommendations(recommendation_result)
+                if self.reuse_cache is not None:
+                    self.reuse_cache.store(RECOMMENDATIONS, fingerprint, tuple(recommendations))
         
         state["recommendations"] = recommendations
+        self._mark_reuse(state, RECOMMENDATIONS, reused_age)
+        reused_note = f" ({reused_age:.0f}초 전 추천 재사용)" if reused_age is not None else ""
         messages.append({
             "role": "assistant",
-            "content": f"추천사항 생성 완료: {len(recommendations)}개의 추천사항을 제공합니다."
+            "content": f"추천사항 생성 완료{reused_note}: {len(recommendations)}개의 추천사항을 제공합니다."
         })
         
         state.update({
@@ -440,7 +904,7 @@ class RecommendationAgent(FinancialAgent):
 {analysis}
 
 주식 데이터:
-{json.dumps(stock_data, indent=2, ensure_ascii=False) if stock_data else "주식 데이터 없음"}
+{json.dumps(stock_data, indent=2, ensure_ascii=False, default=json_default) if stock_data else "주식 데이터 없음"}
 
 다음 형식으로 추천사항을 작성해주세요:
 1. [매수/매도/보유] - 간단한 추천
@@ -469,6 +933,7 @@ class RecommendationAgent(FinancialAgent):
     def _create_fallback_recommendations(self, stock_data: Dict, analysis: str) -> list:
         """LLM 호출 실패시 기본 추천 제공"""
         recommendations = []
+        stock_data = as_dict(stock_data)
         
         if not stock_data:
             return ["데이터 부족으로 추천을 제공할 수 없습니다."]
@@ -504,8 +969,11 @@ class RecommendationAgent(FinancialAgent):
 class ReviewAgent(FinancialAgent):
     """검토 및 최종 보고서 생성 에이전트"""
     
-    def __init__(self, google_ai_api_key: str, tavily_api_key: str = None):
-        super().__init__(google_ai_api_key, tavily_api_key)
+    def __init__(self, google_ai_api_key: str, tavily_api_key: str = None,
+                 llm_client: Optional[LLMClient] = None,
+                 tool_registry: Optional[ToolRegistry] = None,
+                 llm_cache: Optional[LLMResponseCache] = None):
+        super().__init__(google_ai_api_key, tavily_api_key, llm_client, tool_registry, llm_cache)
     
     def review_node(self, state: FinancialAgentState) -> FinancialAgentState:
         """검토 단계 - 최종 보고서 생성"""
@@ -532,7 +1000,7 @@ class ReviewAgent(FinancialAgent):
         ]
         
         # LLM으로 최종 보고서 생성
-        final_report = self._call_llm(llm_messages)
+        final_report = self._call_llm(llm_messages, on_token=self._token_emitter("review"))
         
         # LLM 호출 실패시 기본 보고서 생성
         if "API 할당량이 부족" in final_report or "LLM 호출 중 오류" in final_report:
@@ -565,7 +1033,7 @@ class ReviewAgent(FinancialAgent):
 모든 분석 결과를 종합하여 전문적인 투자 보고서를 작성해주세요:
 
 주식 데이터:
-{json.dumps(stock_data, indent=2, ensure_ascii=False) if stock_data else "주식 데이터 없음"}
+{json.dumps(stock_data, indent=2, ensure_ascii=False, default=json_default) if stock_data else "주식 데이터 없음"}
 
 분석 결과:
 {analysis}
@@ -588,6 +1056,7 @@ class ReviewAgent(FinancialAgent):
     def _create_fallback_report(self, user_query: str, stock_data: Dict, analysis: str, recommendations: list) -> str:
         """LLM 호출 실패시 기본 보고서 생성"""
         report = "=== 투자 분석 보고서 ===\n\n"
+        stock_data = as_dict(stock_data)
         
         # 1. 요약
         report += "1. 요약 (Executive Summary)\n"
@@ -6,17 +6,28 @@ import os
 import sys
 import logging
 import json
+import time
 from datetime import datetime
 from dotenv import load_dotenv
 
 # 환경 변수 로드
 load_dotenv()
 
-# 경로 설정
-sys.path.insert(0, os.path.dirname(__file__))
+# 경로 설정 (에이전트/워크플로우와 같은 src 패키지로 import 해야 전역 캐시/풀 설정이 공유됨)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from workflows.financial_workflow import FinancialWorkflow
-from utils.config import Config
+from src.workflows.financial_workflow import FinancialWorkflow
+from src.utils.config import Config
+from src.tools.disk_cache import MarketDataDiskCache, set_default_disk_cache
+from src.tools.http_client import HTTPClientPool, set_default_http_pool
+from src.tools.llm_client import LLMClient, set_default_llm_client
+from src.tools.llm_cache import LLMResponseCache, get_default_llm_cache, set_default_llm_cache
+from src.tools.stock_tools import StockDataTool, set_tavily_search_url
+from src.tools.ohlcv_store import OHLCVStore
+from src.tools.news_archive import NewsArchive
+from src.tools.symbol_universe import SymbolUniverse, load_symbol_universe
+from src.utils.analysis_reuse import AnalysisReuseCache, ReuseTolerance, set_default_reuse_cache
+from src.utils.sentiment import SentimentScorer, load_lexicon, set_default_sentiment_scorer
 
 # 로깅 설정 (구조적 로그)
 logging.basicConfig(
@@ -109,6 +120,12 @@ def print_result_summary(result: dict):
         print(f"   - 부정: {sentiment_breakdown.get('negative', 0)}개")
         print(f"   - 중립: {sentiment_breakdown.get('neutral', 0)}개")
     
+    # 재사용된 분석/추천 (입력 변화가 허용 범위 이내)
+    for kind, label in (("analysis", "분석"), ("recommendations", "추천")):
+        reuse = (result.get("reuse_info") or {}).get(kind, {})
+        if reuse.get("reused"):
+            print(f"\n♻️ {label}: {reuse['age_seconds']:.0f}초 전 결과 재사용 (입력 변화 없음)")
+    
     # 추천사항
     recommendations = result.get("recommendations", [])
     if recommendations:
@@ -132,8 +149,22 @@ def print_result_summary(result: dict):
     print("\n" + "="*70 + "\n")
 
 
+def print_symbol_suggestions(universe: SymbolUniverse, prefix: str):
+    """접두사로 시작하는 심볼 후보 출력"""
+    suggestions = universe.suggest(prefix)
+    if not suggestions:
+        print(f"⚠️ '{prefix}'(으)로 시작하는 심볼이 없습니다.\n")
+        return
+    
+    print(f"\n🔎 '{prefix}' 후보:")
+    for item in suggestions:
+        print(f"   - {item['symbol']}  {item['name']}".rstrip())
+    print()
+
+
 def run_interactive_mode(workflow: FinancialWorkflow):
     """대화형 모드 실행"""
+    universe = workflow.research_agent.symbol_universe
     StructuredLogger.log("INFO", {
         "mode": "interactive",
         "status": "started"
@@ -142,7 +173,7 @@ def run_interactive_mode(workflow: FinancialWorkflow):
     while True:
         try:
             # 사용자 입력
-            stock_symbol = input("🔍 분석할 주식 심볼을 입력하세요 (종료: 'quit'): ").strip().upper()
+            stock_symbol = input("🔍 분석할 주식 심볼을 입력하세요 (후보 검색: 'AA*', 종료: 'quit'): ").strip().upper()
             
             if stock_symbol in ["QUIT", "EXIT", "Q"]:
                 StructuredLogger.log("INFO", {
@@ -156,6 +187,18 @@ def run_interactive_mode(workflow: FinancialWorkflow):
                 print("⚠️ 주식 심볼을 입력해주세요.\n")
                 continue
             
+            if stock_symbol.endswith("*"):
+                print_symbol_suggestions(universe, stock_symbol.rstrip("*"))
+                continue
+            
+            validation = universe.validate(stock_symbol)
+            if validation["status"] != "success":
+                print(f"⚠️ {validation['error']}")
+                if validation.get("suggestions"):
+                    print(f"   비슷한 심볼: {', '.join(validation['suggestions'])}")
+                print()
+                continue
+            
             # 워크플로우 실행
             StructuredLogger.log("INFO", {
                 "mode": "interactive",
@@ -186,6 +229,11 @@ def run_interactive_mode(workflow: FinancialWorkflow):
                 "errors_count": len(result.get("errors", []))
             })
             
+            llm_cache = get_default_llm_cache()
+            if llm_cache is not None:
+                # 캐시 히트 지연/절약 토큰 누적치
+                StructuredLogger.log("INFO", {"mode": "interactive", "llm_cache": llm_cache.stats()})
+            
         except KeyboardInterrupt:
             StructuredLogger.log("WARNING", {
                 "mode": "interactive",
@@ -221,22 +269,45 @@ def run_streaming_mode(workflow: FinancialWorkflow, stock_symbol: str):
         "max_iterations": 3
     }
     
+    # 노드별 이모지
+    node_emojis = {
+        "research": "🔍",
+        "analyze": "📊",
+        "recommend": "💡",
+        "human_approval": "✋",
+        "review": "📝",
+        "error": "❌"
+    }
+    
+    started = time.perf_counter()
+    first_token_logged = False
+    streaming_node = None
+    
     try:
         for event in workflow.stream(initial_state):
             node = event.get("node", "unknown")
             status = event.get("status", "running")
+            emoji = node_emojis.get(node, "⚙️")
             
-            # 노드별 이모지
-            node_emojis = {
-                "research": "🔍",
-                "analyze": "📊",
-                "recommend": "💡",
-                "human_approval": "✋",
-                "review": "📝",
-                "error": "❌"
-            }
+            # LLM 토큰은 도착하는 대로 이어서 출력
+            if event.get("type") == "token":
+                if streaming_node != node:
+                    print(f"{emoji} {node.upper()} ▶ ", end="", flush=True)
+                    streaming_node = node
+                print(event.get("token", ""), end="", flush=True)
+                
+                if not first_token_logged:
+                    first_token_logged = True
+                    StructuredLogger.log("INFO", {
+                        "mode": "streaming",
+                        "node": node,
+                        "first_token_ms": round((time.perf_counter() - started) * 1000, 1)
+                    })
+                continue
             
-            emoji = node_emojis.get(node, "⚙️")
+            if streaming_node is not None:
+                print("\n")
+                streaming_node = None
             
             print(f"{emoji} {node.upper()} - {status}")
             
@@ -263,6 +334,96 @@ def run_streaming_mode(workflow: FinancialWorkflow, stock_symbol: str):
         print(f"\n❌ 스트리밍 오류: {str(e)}\n")
 
 
+def setup_http_pool():
+    """모든 FinancialNewsTool 이 공유할 keep-alive HTTP 연결 풀 설정"""
+    set_default_http_pool(HTTPClientPool(
+        pool_size=Config.HTTP_POOL_SIZE,
+        connect_timeout=Config.HTTP_CONNECT_TIMEOUT,
+        read_timeout=Config.HTTP_READ_TIMEOUT
+    ))
+    if Config.TAVILY_SEARCH_URL:
+        # 부하 테스트: 로컬 Tavily 호환 서버(tools/tavily_stand_in.py)로 뉴스 검색을 보냄
+        set_tavily_search_url(Config.TAVILY_SEARCH_URL)
+        StructuredLogger.log("INFO", {
+            "action": "tavily_search_url_override",
+            "url": Config.TAVILY_SEARCH_URL
+        })
+
+
+def setup_llm_client(google_ai_api_key: str):
+    """모든 에이전트가 공유할 Gemini 클라이언트 등록 (모델은 첫 호출 때 초기화)"""
+    set_default_llm_client(LLMClient(google_ai_api_key, max_concurrency=Config.LLM_MAX_CONCURRENCY))
+
+
+def setup_llm_cache():
+    """LLM 응답 캐시 설정 (디스크 계층은 LLM_CACHE_DISK 이고 디스크 캐시가 열려 있을 때만 사용)"""
+    if Config.LLM_CACHE_TTL <= 0:
+        set_default_llm_cache(None)
+        return
+    set_default_llm_cache(LLMResponseCache(
+        ttl_seconds=Config.LLM_CACHE_TTL,
+        max_entries=Config.LLM_CACHE_MAX_ENTRIES,
+        use_disk=Config.LLM_CACHE_DISK
+    ))
+
+
+def setup_analysis_reuse():
+    """입력 지문 기반 분석/추천 재사용 허용 범위 설정"""
+    if Config.ANALYSIS_REUSE_MAX_AGE <= 0:
+        set_default_reuse_cache(None)
+        return
+    set_default_reuse_cache(AnalysisReuseCache(ReuseTolerance(
+        price_percent=Config.ANALYSIS_REUSE_PRICE_PERCENT,
+        position_points=Config.ANALYSIS_REUSE_POSITION_POINTS,
+        pe_bucket=Config.ANALYSIS_REUSE_PE_BUCKET,
+        max_age_seconds=Config.ANALYSIS_REUSE_MAX_AGE
+    )))
+
+
+def setup_sentiment_lexicon():
+    """사용자 감성 어휘가 지정되어 있으면 한 번 컴파일해 전역 점수기로 등록"""
+    if not Config.SENTIMENT_LEXICON_PATH:
+        return
+    
+    try:
+        scorer = SentimentScorer(load_lexicon(Config.SENTIMENT_LEXICON_PATH))
+        set_default_sentiment_scorer(scorer)
+        StructuredLogger.log("INFO", {
+            "action": "sentiment_lexicon_loaded",
+            "path": Config.SENTIMENT_LEXICON_PATH,
+            "terms": len(scorer)
+        })
+    except (OSError, ValueError) as e:
+        # 어휘 파일 문제로 실행이 막히지 않도록 내장 어휘로 계속 진행
+        StructuredLogger.log("WARNING", {
+            "action": "sentiment_lexicon_loaded",
+            "status": "failed",
+            "error": str(e)
+        })
+
+
+def setup_market_cache():
+    """디스크 캐시를 열고 최근 시세를 메모리에 미리 적재 (웜 스타트)"""
+    if not Config.MARKET_CACHE_PATH:
+        return
+    
+    try:
+        set_default_disk_cache(MarketDataDiskCache(Config.MARKET_CACHE_PATH))
+        loaded = StockDataTool().warm_start()
+        StructuredLogger.log("INFO", {
+            "action": "market_cache_warm_start",
+            "path": Config.MARKET_CACHE_PATH,
+            "loaded_quotes": loaded
+        })
+    except Exception as e:
+        # 캐시 문제로 실행이 막히지 않도록 경고만 남김
+        StructuredLogger.log("WARNING", {
+            "action": "market_cache_warm_start",
+            "status": "failed",
+            "error": str(e)
+        })
+
+
 def main():
     """메인 함수"""
     # 환영 메시지
@@ -289,9 +450,17 @@ def main():
         "status": "success"
     })
     
+    # 디스크 캐시 웜 스타트
+    setup_http_pool()
+    setup_sentiment_lexicon()
+    setup_market_cache()
+    
     # API 키 가져오기
     google_ai_api_key = os.getenv("GOOGLE_AI_API_KEY")
     tavily_api_key = os.getenv("TAVILY_API_KEY")
+    setup_llm_client(google_ai_api_key)
+    setup_llm_cache()
+    setup_analysis_reuse()
     
     # 워크플로우 초기화
     StructuredLogger.log("INFO", {
@@ -300,7 +469,14 @@ def main():
     })
     
     try:
-        workflow = FinancialWorkflow(google_ai_api_key, tavily_api_key)
+        ohlcv_store = OHLCVStore(Config.OHLCV_STORE_DIR) if Config.OHLCV_STORE_DIR else None
+        symbol_universe = load_symbol_universe(Config.SYMBOL_UNIVERSE_PATH)
+        news_archive = NewsArchive(Config.NEWS_ARCHIVE_DIR) if Config.NEWS_ARCHIVE_DIR else None
+        workflow = FinancialWorkflow(
+            google_ai_api_key, tavily_api_key,
+            ohlcv_store=ohlcv_store, symbol_universe=symbol_universe,
+            news_archive=news_archive, news_query_fanout=Config.NEWS_QUERY_FANOUT
+        )
         StructuredLogger.log("INFO", {
             "action": "workflow_initialization",
             "status": "success"
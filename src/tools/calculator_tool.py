@@ -130,5 +130,17 @@ class CalculatorTool:
                 "expression": expression,
                 "retry_hint": "올바른 수식을 입력해주세요."
             }
-
-
+    
+    async def arun(self, expression: str) -> Dict[str, Any]:
+        """
+        수학 계산을 수행합니다. (비동기 인터페이스, run 과 동일한 결과 형태)
+        
+        계산은 입력 검증이 끝난 짧은 수식만 평가하므로 이벤트 루프에서 바로 실행합니다.
+        
+        Args:
+            expression: 계산할 수식 문자열
+            
+        Returns:
+            Dict: 계산 결과 또는 에러 정보
+        """
+        return self.run(expression)
@@ -0,0 +1,142 @@
+"""
+디스크 기반 시장 데이터 캐시 (SQLite)
+Persistent Market Data Cache (SQLite)
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class MarketDataDiskCache:
+    """
+    프로세스 재시작 후에도 유지되는 도구 결과 캐시
+
+    - (namespace, key) 별로 JSON 값과 저장 시각(epoch 초)을 보관합니다.
+    - WAL 모드 + busy_timeout 으로 같은 호스트의 여러 워커 프로세스가
+      하나의 파일을 안전하게 공유할 수 있습니다.
+    - sqlite3 연결은 스레드 간 공유할 수 없으므로 스레드별로 연결을 엽니다.
+    """
+
+    def __init__(self, path: str, busy_timeout_ms: int = 5000):
+        self.path = path
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    stored_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_entries_stored_at ON entries (namespace, stored_at)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout_ms / 1000)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            self._local.conn = conn
+        return conn
+
+    def get(self, namespace: str, key: str, max_age: float) -> Tuple[Optional[Any], Optional[float]]:
+        """
+        캐시 조회
+
+        Returns:
+            (값, 경과 시간(초)) - 없거나 max_age 보다 오래되었으면 (None, None)
+        """
+        try:
+            row = self._connection().execute(
+                "SELECT value, stored_at FROM entries WHERE namespace = ? AND key = ?",
+                (namespace, key)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.error({"cache": "disk", "action": "get", "namespace": namespace, "error": str(e)})
+            return None, None
+
+        if row is None:
+            return None, None
+
+        age = time.time() - row[1]
+        if age > max_age:
+            return None, None
+        return json.loads(row[0]), age
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        """캐시 저장 (같은 키는 덮어씀)"""
+        try:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (namespace, key, value, stored_at) VALUES (?, ?, ?, ?)",
+                    (namespace, key, json.dumps(value, ensure_ascii=False, default=str), time.time())
+                )
+        except sqlite3.Error as e:
+            logger.error({"cache": "disk", "action": "set", "namespace": namespace, "error": str(e)})
+
+    def load_recent(self, namespace: str, max_age: float) -> List[Tuple[str, Any, float]]:
+        """
+        웜 스타트용: max_age 이내에 저장된 항목 전체 반환
+
+        Returns:
+            [(키, 값, 경과 시간(초)), ...]
+        """
+        now = time.time()
+        try:
+            rows = self._connection().execute(
+                "SELECT key, value, stored_at FROM entries WHERE namespace = ? AND stored_at >= ?",
+                (namespace, now - max_age)
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.error({"cache": "disk", "action": "load_recent", "namespace": namespace, "error": str(e)})
+            return []
+
+        return [(key, json.loads(value), now - stored_at) for key, value, stored_at in rows]
+
+    def purge(self, max_age: float) -> int:
+        """max_age 보다 오래된 항목 삭제, 삭제된 개수 반환"""
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute("DELETE FROM entries WHERE stored_at < ?", (time.time() - max_age,))
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """현재 스레드의 연결 종료"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+_default_disk_cache: Optional[MarketDataDiskCache] = None
+
+
+def set_default_disk_cache(cache: Optional[MarketDataDiskCache]) -> None:
+    """도구들이 기본으로 사용할 프로세스 전역 디스크 캐시 지정 (None 이면 비활성화)"""
+    global _default_disk_cache
+    _default_disk_cache = cache
+
+
+def get_default_disk_cache() -> Optional[MarketDataDiskCache]:
+    """프로세스 전역 디스크 캐시 반환 (설정되지 않았으면 None)"""
+    return _default_disk_cache
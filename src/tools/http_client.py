@@ -0,0 +1,138 @@
+"""
+프로세스 공유 HTTP 연결 풀
+Shared Keep-Alive HTTP Connection Pool
+"""
+import asyncio
+import threading
+from typing import Dict, Optional
+import logging
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPClientPool:
+    """
+    keep-alive 연결을 재사용하는 동기/비동기 HTTP 클라이언트
+
+    - 동기: pool_size 크기의 HTTPAdapter 를 장착한 requests.Session 하나를 스레드 간 공유합니다.
+    - 비동기: httpx.AsyncClient 는 이벤트 루프에 묶이므로 루프마다 하나씩 만들어 재사용합니다.
+    - 새 연결 수와 전체 요청 수를 세어 연결 재사용률을 보고합니다.
+    """
+
+    def __init__(self, pool_size: int = 10, connect_timeout: float = 3.05, read_timeout: float = 10.0):
+        self.pool_size = pool_size
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+
+        self._lock = threading.Lock()
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._adapters = [adapter]
+
+        self._async_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+        self._requests = 0
+        self._async_requests = 0
+        self._async_new_connections = 0
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """동기 POST (기본 타임아웃: (connect, read))"""
+        kwargs.setdefault("timeout", (self.connect_timeout, self.read_timeout))
+        with self._lock:
+            self._requests += 1
+        return self._session.post(url, **kwargs)
+
+    def _async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            # 닫힌 루프의 클라이언트는 더 이상 쓸 수 없으므로 참조만 정리
+            for closed in [l for l in self._async_clients if l.is_closed()]:
+                del self._async_clients[closed]
+
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = httpx.AsyncClient(
+                    timeout=httpx.Timeout(self.read_timeout, connect=self.connect_timeout),
+                    limits=httpx.Limits(
+                        max_connections=self.pool_size,
+                        max_keepalive_connections=self.pool_size
+                    )
+                )
+                self._async_clients[loop] = client
+            return client
+
+    async def _trace(self, event_name: str, info: Dict) -> None:
+        """httpcore trace 훅: TCP 연결이 새로 맺어질 때만 호출되는 이벤트를 집계"""
+        if event_name == "connection.connect_tcp.complete":
+            with self._lock:
+                self._async_new_connections += 1
+
+    async def apost(self, url: str, **kwargs) -> httpx.Response:
+        """비동기 POST (현재 이벤트 루프의 공유 클라이언트 사용)"""
+        client = self._async_client()
+        with self._lock:
+            self._async_requests += 1
+        return await client.post(url, extensions={"trace": self._trace}, **kwargs)
+
+    def _sync_new_connections(self) -> int:
+        """urllib3 연결 풀들이 새로 연 연결 수 합계"""
+        total = 0
+        for adapter in self._adapters:
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is not None:
+                    total += pool.num_connections
+        return total
+
+    def stats(self) -> Dict:
+        """요청 수, 새 연결 수, 재사용 연결 수, 재사용률"""
+        with self._lock:
+            requests_count = self._requests + self._async_requests
+            new_connections = self._async_new_connections
+        new_connections += self._sync_new_connections()
+        reused = max(requests_count - new_connections, 0)
+        return {
+            "pool_size": self.pool_size,
+            "requests": requests_count,
+            "new_connections": new_connections,
+            "reused_connections": reused,
+            "reuse_ratio": reused / requests_count if requests_count else 0.0
+        }
+
+    def close(self) -> None:
+        """동기 세션 종료 (비동기 클라이언트는 aclose 로 현재 루프의 것을 종료)"""
+        self._session.close()
+
+    async def aclose(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+
+_default_http_pool: Optional[HTTPClientPool] = None
+_default_lock = threading.Lock()
+
+
+def set_default_http_pool(pool: Optional[HTTPClientPool]) -> None:
+    """도구들이 기본으로 사용할 프로세스 전역 HTTP 풀 지정"""
+    global _default_http_pool
+    with _default_lock:
+        _default_http_pool = pool
+
+
+def get_default_http_pool() -> HTTPClientPool:
+    """프로세스 전역 HTTP 풀 반환 (없으면 기본 설정으로 생성)"""
+    global _default_http_pool
+    with _default_lock:
+        if _default_http_pool is None:
+            _default_http_pool = HTTPClientPool()
+        return _default_http_pool
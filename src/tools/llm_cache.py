@@ -0,0 +1,137 @@
+"""
+LLM 응답 캐시 (정확히 같은 프롬프트 재사용)
+Exact-Match LLM Response Cache
+"""
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+import logging
+
+from .quote_cache import TTLCache
+from .disk_cache import MarketDataDiskCache, get_default_disk_cache
+
+logger = logging.getLogger(__name__)
+
+LLM_NAMESPACE = "llm_response"
+
+MEMORY = "memory"
+DISK = "disk"
+
+
+def llm_cache_key(prompt: str, model_name: str, generation_config: Dict[str, Any]) -> str:
+    """렌더링된 프롬프트 + 모델명 + 생성 설정의 해시"""
+    payload = json.dumps(
+        {"prompt": prompt, "model": model_name, "config": generation_config},
+        sort_keys=True, ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    메모리(LRU) + 선택적 디스크 2단계 LLM 응답 캐시
+
+    - 정상 응답만 저장합니다. 할당량/오류 대체 메시지는 호출자가 저장하지 않아야 합니다.
+    - 디스크 계층은 use_disk=True 일 때만 사용하며, 디스크에서 찾은 응답은 메모리로 올립니다.
+    - 히트 조회 지연과 절약한 토큰 수(저장 시점의 usage_metadata 기준)를 집계합니다.
+    """
+
+    def __init__(self, ttl_seconds: float = 900.0, max_entries: int = 256,
+                 max_bytes: int = 4 * 1024 * 1024, use_disk: bool = False,
+                 disk_cache: Optional[MarketDataDiskCache] = None):
+        self.ttl_seconds = ttl_seconds
+        self.use_disk = use_disk
+        self.memory = TTLCache(
+            max_entries=max_entries, max_bytes=max_bytes,
+            ttl_seconds=ttl_seconds, stale_ttl_seconds=0.0
+        )
+        self._disk_cache = disk_cache
+        self._lock = threading.Lock()
+        self._hits = {MEMORY: 0, DISK: 0}
+        self._misses = 0
+        self._stores = 0
+        self._hit_seconds = 0.0
+        self._saved_tokens = 0
+
+    @property
+    def disk_cache(self) -> Optional[MarketDataDiskCache]:
+        if not self.use_disk:
+            return None
+        return self._disk_cache if self._disk_cache is not None else get_default_disk_cache()
+
+    def get(self, key: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        캐시 조회
+
+        Returns:
+            (응답 텍스트, 계층) - 계층은 "memory", "disk" 또는 None(미스)
+        """
+        started = time.perf_counter()
+        entry, _ = self.memory.get(key)
+        tier = MEMORY if entry is not None else None
+
+        if entry is None and self.disk_cache is not None:
+            entry, _ = self.disk_cache.get(LLM_NAMESPACE, key, max_age=self.ttl_seconds)
+            if entry is not None:
+                tier = DISK
+                self.memory.set(key, entry)
+
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            if entry is None:
+                self._misses += 1
+                return None, None
+            self._hits[tier] += 1
+            self._hit_seconds += elapsed
+            self._saved_tokens += entry.get("tokens", 0)
+
+        logger.info({
+            "cache": "llm_response",
+            "action": "hit",
+            "tier": tier,
+            "latency_ms": round(elapsed * 1000, 3),
+            "saved_tokens": entry.get("tokens", 0)
+        })
+        return entry["text"], tier
+
+    def set(self, key: str, text: str, tokens: int = 0) -> None:
+        """정상 응답 저장 (tokens: 프롬프트 + 응답 토큰 수)"""
+        entry = {"text": text, "tokens": tokens}
+        self.memory.set(key, entry)
+        if self.disk_cache is not None:
+            self.disk_cache.set(LLM_NAMESPACE, key, entry)
+        with self._lock:
+            self._stores += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """계층별 히트, 미스, 평균 히트 지연, 절약한 토큰 수"""
+        with self._lock:
+            hits = self._hits[MEMORY] + self._hits[DISK]
+            lookups = hits + self._misses
+            return {
+                "memory_hits": self._hits[MEMORY],
+                "disk_hits": self._hits[DISK],
+                "misses": self._misses,
+                "stores": self._stores,
+                "hit_ratio": hits / lookups if lookups else 0.0,
+                "avg_hit_latency_ms": self._hit_seconds / hits * 1000 if hits else 0.0,
+                "saved_tokens": self._saved_tokens,
+                "entries": len(self.memory)
+            }
+
+
+# 기본 비활성화: main.setup_llm_cache 가 설정값으로 켬 (라이브러리/테스트에서는 명시적으로 전달)
+_default_llm_cache: Optional[LLMResponseCache] = None
+
+
+def set_default_llm_cache(cache: Optional[LLMResponseCache]) -> None:
+    """에이전트들이 기본으로 사용할 프로세스 전역 LLM 응답 캐시 지정 (None 이면 비활성화)"""
+    global _default_llm_cache
+    _default_llm_cache = cache
+
+
+def get_default_llm_cache() -> Optional[LLMResponseCache]:
+    """프로세스 전역 LLM 응답 캐시 반환 (비활성화되었으면 None)"""
+    return _default_llm_cache
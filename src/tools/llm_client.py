@@ -0,0 +1,110 @@
+"""
+프로세스 공유 LLM 클라이언트
+Shared Lazily-Initialized Gemini Client
+"""
+import threading
+from typing import Dict, Iterator, Optional, Tuple
+import logging
+
+import google.generativeai as genai
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "gemini-2.0-flash-exp"  # Gemini 2.0 Flash (최신 모델)
+
+# genai.configure 는 모듈 전역 설정이므로 마지막으로 설정한 키를 기억해 중복 설정을 피함
+_configured_api_key: Optional[str] = None
+_configure_lock = threading.Lock()
+
+
+def _configure(api_key: str) -> None:
+    global _configured_api_key
+    with _configure_lock:
+        if _configured_api_key != api_key:
+            genai.configure(api_key=api_key)
+            _configured_api_key = api_key
+
+
+class LLMClient:
+    """
+    여러 에이전트가 공유하는 Gemini 클라이언트
+
+    - genai.configure 와 GenerativeModel 생성은 첫 호출 때 한 번만 수행합니다 (지연 초기화).
+    - genai 가 관리하는 전송 채널 하나를 모든 에이전트가 재사용하고,
+      동시에 진행되는 요청 수는 max_concurrency 로 제한합니다 (연결 풀 크기).
+    """
+
+    def __init__(self, api_key: str, model_name: str = DEFAULT_MODEL, max_concurrency: int = 8):
+        self.api_key = api_key
+        self.model_name = model_name
+        self.max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._model = None
+        self._requests = 0
+
+    @property
+    def model(self):
+        """GenerativeModel (첫 접근 시 생성)"""
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    _configure(self.api_key)
+                    self._model = genai.GenerativeModel(self.model_name)
+                    logger.info({"llm_client": self.model_name, "action": "initialized"})
+        return self._model
+
+    def generate_content(self, prompt, **kwargs):
+        """model.generate_content 와 같은 인터페이스 (동시 요청 수 제한)"""
+        model = self.model
+        with self._slots:
+            with self._lock:
+                self._requests += 1
+            return model.generate_content(prompt, **kwargs)
+
+    def stream_content(self, prompt, **kwargs) -> Iterator:
+        """
+        generate_content(stream=True) 의 응답 조각(chunk.text, chunk.usage_metadata)을 순서대로 반환
+
+        응답을 모두 읽을 때까지 동시 요청 슬롯을 점유합니다.
+        """
+        model = self.model
+        with self._slots:
+            with self._lock:
+                self._requests += 1
+            yield from model.generate_content(prompt, stream=True, **kwargs)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "model": self.model_name,
+                "initialized": self._model is not None,
+                "max_concurrency": self.max_concurrency,
+                "requests": self._requests
+            }
+
+
+_llm_clients: Dict[Tuple[Optional[str], str], LLMClient] = {}
+_clients_lock = threading.Lock()
+
+
+def set_default_llm_client(client: Optional[LLMClient], api_key: Optional[str] = None,
+                           model_name: str = DEFAULT_MODEL) -> None:
+    """(api_key, model_name) 에 대해 에이전트들이 공유할 클라이언트 지정 (None 이면 해제)"""
+    key = (client.api_key, client.model_name) if client is not None else (api_key, model_name)
+    with _clients_lock:
+        if client is None:
+            _llm_clients.pop(key, None)
+        else:
+            _llm_clients[key] = client
+
+
+def get_default_llm_client(api_key: Optional[str], model_name: str = DEFAULT_MODEL) -> LLMClient:
+    """(api_key, model_name) 별 프로세스 전역 클라이언트 반환 (없으면 생성, 모델은 첫 호출 때 초기화)"""
+    key = (api_key, model_name)
+    with _clients_lock:
+        client = _llm_clients.get(key)
+        if client is None:
+            client = LLMClient(api_key, model_name)
+            _llm_clients[key] = client
+        return client
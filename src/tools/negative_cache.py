@@ -0,0 +1,108 @@
+"""
+실패 결과(네거티브) 캐시와 에러 분류
+Negative Result Cache and Error Classification
+"""
+import threading
+from typing import Dict, Hashable, Optional
+import logging
+
+from .quote_cache import TTLCache, FRESH
+
+logger = logging.getLogger(__name__)
+
+PERMANENT = "permanent"
+TRANSIENT = "transient"
+
+# 예외 메시지에 포함되면 재시도해도 같은 결과가 나오는 실패로 간주
+_PERMANENT_MARKERS = (
+    "delisted",
+    "not found",
+    "no data found",
+    "no timezone found",
+    "찾을 수 없습니다",
+    "가져올 수 없습니다",
+)
+
+# 4xx 중 재시도하면 성공할 수 있는 상태 코드 (408 타임아웃, 425 Too Early, 429 요청 한도)
+_TRANSIENT_CLIENT_STATUS = {408, 425, 429}
+
+
+class PermanentToolError(ValueError):
+    """재시도해도 같은 결과가 나오는 실패 (잘못된/상장폐지 심볼 등)"""
+
+
+def classify_status(status_code: int) -> str:
+    """HTTP 상태 코드 분류: 4xx 는 영구(408/425/429 제외), 그 외는 일시적"""
+    if 400 <= status_code < 500 and status_code not in _TRANSIENT_CLIENT_STATUS:
+        return PERMANENT
+    return TRANSIENT
+
+
+def classify_error(error: Exception) -> str:
+    """예외 분류: PermanentToolError 또는 알려진 '없음' 메시지는 영구, 나머지는 일시적"""
+    if isinstance(error, PermanentToolError):
+        return PERMANENT
+    message = str(error).lower()
+    if any(marker in message for marker in _PERMANENT_MARKERS):
+        return PERMANENT
+    return TRANSIENT
+
+
+class NegativeCache:
+    """
+    영구 실패 결과를 짧은 TTL 동안 보관하는 캐시
+
+    error_class 가 "permanent" 인 에러 응답만 저장하며, 캐시 히트는
+    업스트림 호출(재시도 포함)을 한 번 절약한 것으로 집계합니다.
+    """
+
+    def __init__(self, ttl_seconds: float = 600.0, max_entries: int = 1024):
+        self._cache = TTLCache(
+            max_entries=max_entries,
+            max_bytes=512 * 1024,
+            ttl_seconds=ttl_seconds,
+            stale_ttl_seconds=0.0
+        )
+        self._lock = threading.Lock()
+        self._saved_calls = 0
+        self._stored = 0
+
+    def get(self, key: Hashable) -> Optional[Dict]:
+        """캐시된 에러 응답 (없으면 None)"""
+        value, state = self._cache.get(key)
+        if state != FRESH:
+            return None
+        with self._lock:
+            self._saved_calls += 1
+        return dict(value)
+
+    def put(self, key: Hashable, result: Dict) -> bool:
+        """영구 실패만 저장, 저장 여부 반환"""
+        if result.get("status") != "error" or result.get("error_class") != PERMANENT:
+            return False
+        self._cache.set(key, dict(result))
+        with self._lock:
+            self._stored += 1
+        return True
+
+    def __contains__(self, key: Hashable) -> bool:
+        """저장된 영구 실패가 있는지 (절약 호출 수에는 집계하지 않음)"""
+        return self._cache.get(key)[1] == FRESH
+
+    def invalidate(self, key: Hashable) -> None:
+        self._cache.invalidate(key)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def stats(self) -> Dict:
+        """절약한 업스트림 호출 수, 저장 횟수, 현재 항목 수"""
+        with self._lock:
+            return {
+                "saved_calls": self._saved_calls,
+                "stored": self._stored,
+                "entries": len(self._cache)
+            }
@@ -0,0 +1,164 @@
+"""
+심볼별 뉴스 아카이브 (증분 적재 + 본 URL 필터)
+Per-Symbol News Archive with Seen-URL Filter
+"""
+import json
+import os
+import re
+import struct
+import threading
+import time
+from typing import Dict, List, Set
+import logging
+
+from .news_merge import url_fingerprint
+
+logger = logging.getLogger(__name__)
+
+_OFFSET = struct.Struct("<q")  # 레코드 시작 위치 (8바이트)
+
+
+class NewsArchive:
+    """
+    심볼별 추가 전용 뉴스 기록
+
+    심볼마다 파일 세 개를 둡니다.
+        - SYMBOL.jsonl: 기사 레코드 (한 줄에 하나, 추가만 함)
+        - SYMBOL.idx: 각 레코드의 시작 바이트 위치 (8바이트씩) → 최근 N개를 O(N) 으로 읽음
+        - SYMBOL.seen: 저장한 기사의 정규화 URL 해시 (본 URL 필터, 한 줄에 하나)
+    index.json 에는 심볼별 기사 수와 마지막 수집 시각을 기록합니다.
+    """
+
+    def __init__(self, root_dir: str):
+        self.root_dir = root_dir
+        self._lock = threading.Lock()
+        self._index_path = os.path.join(root_dir, "index.json")
+        self._seen: Dict[str, Set[str]] = {}
+
+        os.makedirs(root_dir, exist_ok=True)
+        if os.path.exists(self._index_path):
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                self._index = json.load(f)
+        else:
+            self._index = {}
+
+    def _path(self, symbol: str, suffix: str) -> str:
+        safe_symbol = re.sub(r"[^A-Za-z0-9._=^-]", "_", symbol.upper())
+        return os.path.join(self.root_dir, f"{safe_symbol}.{suffix}")
+
+    def _save_index(self) -> None:
+        tmp_path = self._index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, self._index_path)
+
+    def _seen_set(self, symbol: str) -> Set[str]:
+        """본 URL 해시 집합 (처음 접근 시 디스크에서 로드)"""
+        key = symbol.upper()
+        seen = self._seen.get(key)
+        if seen is None:
+            seen = set()
+            path = self._path(symbol, "seen")
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    seen.update(line.strip() for line in f if line.strip())
+            self._seen[key] = seen
+        return seen
+
+    @staticmethod
+    def _fingerprint(item: Dict) -> str:
+        url = item.get("url") or ""
+        if url and url != "N/A":
+            return url_fingerprint(url)
+        # URL 이 없으면 제목으로 대신 식별
+        return url_fingerprint("title:" + " ".join((item.get("title") or "").lower().split()))
+
+    def unseen(self, symbol: str, items: List[Dict]) -> List[Dict]:
+        """아카이브에 없는 기사만 반환 (입력 내 중복도 제거)"""
+        with self._lock:
+            seen = self._seen_set(symbol)
+            fresh, batch = [], set()
+            for item in items:
+                fingerprint = self._fingerprint(item)
+                if fingerprint in seen or fingerprint in batch:
+                    continue
+                batch.add(fingerprint)
+                fresh.append(item)
+            return fresh
+
+    def append(self, symbol: str, items: List[Dict]) -> int:
+        """
+        기사 추가 (이미 본 URL 은 건너뜀) 및 마지막 수집 시각 갱신
+
+        새 기사가 없어도 수집 시각은 갱신되어 is_fresh() 판단에 쓰입니다.
+
+        Returns:
+            int: 새로 저장한 기사 수
+        """
+        now = time.time()
+        with self._lock:
+            seen = self._seen_set(symbol)
+            records, fingerprints = [], {}
+            for item in items:
+                fingerprint = self._fingerprint(item)
+                if fingerprint in seen or fingerprint in fingerprints:
+                    continue
+                fingerprints[fingerprint] = None
+                records.append({**item, "fingerprint": fingerprint, "archived_at": now})
+
+            if records:
+                offsets = []
+                with open(self._path(symbol, "jsonl"), "ab") as f:
+                    for record in records:
+                        offsets.append(f.tell())
+                        f.write(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n")
+                with open(self._path(symbol, "idx"), "ab") as f:
+                    f.write(b"".join(_OFFSET.pack(offset) for offset in offsets))
+                with open(self._path(symbol, "seen"), "a", encoding="utf-8") as f:
+                    f.write("".join(fingerprint + "\n" for fingerprint in fingerprints))
+                seen.update(fingerprints)
+
+            meta = self._index.get(symbol.upper(), {"count": 0, "last_fetched_at": None})
+            self._index[symbol.upper()] = {
+                "count": meta["count"] + len(records),
+                "last_fetched_at": now
+            }
+            self._save_index()
+
+        logger.info({
+            "store": "news_archive",
+            "action": "append",
+            "symbol": symbol,
+            "added": len(records),
+            "skipped": len(items) - len(records)
+        })
+        return len(records)
+
+    def count(self, symbol: str) -> int:
+        meta = self._index.get(symbol.upper())
+        return meta["count"] if meta else 0
+
+    def is_fresh(self, symbol: str, max_age: float) -> bool:
+        """마지막 수집이 max_age 초 이내인지"""
+        meta = self._index.get(symbol.upper())
+        if not meta or meta["last_fetched_at"] is None:
+            return False
+        return time.time() - meta["last_fetched_at"] <= max_age
+
+    def latest(self, symbol: str, n: int = 10) -> List[Dict]:
+        """최근 저장된 기사 n개 (최신순)"""
+        count = self.count(symbol)
+        if count == 0 or n <= 0:
+            return []
+
+        n = min(n, count)
+        with open(self._path(symbol, "idx"), "rb") as f:
+            f.seek(-n * _OFFSET.size, os.SEEK_END)
+            offsets = [value for (value,) in _OFFSET.iter_unpack(f.read(n * _OFFSET.size))]
+
+        records = []
+        with open(self._path(symbol, "jsonl"), "rb") as f:
+            for offset in reversed(offsets):
+                f.seek(offset)
+                records.append(json.loads(f.readline()))
+        return records
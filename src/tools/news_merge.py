@@ -0,0 +1,99 @@
+"""
+여러 뉴스 검색 결과 병합 (URL 해시 + 제목 유사 중복 제거)
+News Result Merging with URL and Near-Duplicate Title Dedupe
+"""
+import hashlib
+import re
+from typing import Dict, List, Optional, Sequence, Set
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 추적용 쿼리 파라미터 (같은 기사를 다른 URL 로 만드는 요소)
+_TRACKING_PREFIX = "utm_"
+_TRACKING_PARAMS = {"cmpid", "ref", "fbclid", "gclid", "mod"}
+_TITLE_TOKEN = re.compile(r"[0-9a-z가-힣]+")
+
+# 역순위 융합(RRF) 상수: 한 쿼리의 상위 결과가 지나치게 우세하지 않도록 완화
+RRF_K = 60
+
+
+def url_fingerprint(url: str) -> str:
+    """
+    URL 정규화 후 해시
+
+    스킴/호스트 소문자화, www. 제거, 프래그먼트/추적 파라미터/끝 슬래시 제거
+    """
+    parts = urlsplit((url or "").strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parts.query)
+        if not (k.lower().startswith(_TRACKING_PREFIX) or k.lower() in _TRACKING_PARAMS)
+    ))
+    normalized = urlunsplit(("", host, parts.path.rstrip("/"), query, ""))
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+def title_tokens(title: str) -> Set[str]:
+    """제목 단어 집합 (소문자, 구두점 제거)"""
+    return set(_TITLE_TOKEN.findall((title or "").lower()))
+
+
+def _similar(a: Set[str], b: Set[str], threshold: float) -> bool:
+    if not a or not b:
+        return False
+    return len(a & b) / len(a | b) >= threshold
+
+
+def merge_ranked(result_lists: Sequence[List[Dict]], title_similarity: float = 0.8,
+                 limit: Optional[int] = None) -> Dict:
+    """
+    쿼리별 결과 목록을 하나의 순위 목록으로 병합
+
+    - 같은 URL(정규화 해시) 또는 제목 단어 Jaccard 유사도가 title_similarity 이상이면 중복으로 봅니다.
+    - 순위는 역순위 융합(RRF): 여러 쿼리에서 상위에 나온 기사일수록 앞에 옵니다.
+      중복으로 제거된 항목의 점수는 남은 항목에 더해집니다.
+
+    Returns:
+        {"results": 병합된 목록, "duplicates_removed": 제거된 중복 수}
+    """
+    kept: List[Dict] = []
+    scores: List[float] = []
+    tokens: List[Set[str]] = []
+    by_url: Dict[str, int] = {}
+    duplicates = 0
+
+    for results in result_lists:
+        for rank, item in enumerate(results):
+            score = 1.0 / (RRF_K + rank + 1)
+            url = item.get("url") or ""
+            fingerprint = url_fingerprint(url) if url and url != "N/A" else None
+            item_tokens = title_tokens(item.get("title", ""))
+
+            index = by_url.get(fingerprint) if fingerprint else None
+            if index is None:
+                index = next(
+                    (i for i, other in enumerate(tokens) if _similar(item_tokens, other, title_similarity)),
+                    None
+                )
+
+            if index is not None:
+                scores[index] += score
+                if fingerprint:
+                    by_url.setdefault(fingerprint, index)
+                duplicates += 1
+                continue
+
+            if fingerprint:
+                by_url[fingerprint] = len(kept)
+            kept.append(item)
+            scores.append(score)
+            tokens.append(item_tokens)
+
+    # 점수 내림차순, 동점이면 먼저 나온 순서
+    order = sorted(range(len(kept)), key=lambda i: (-scores[i], i))
+    merged = [kept[i] for i in order]
+    if limit is not None:
+        merged = merged[:limit]
+
+    return {"results": merged, "duplicates_removed": duplicates}
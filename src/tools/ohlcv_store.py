@@ -0,0 +1,239 @@
+"""
+메모리 매핑 기반 과거 OHLCV 저장소
+Memory-Mapped Historical OHLCV Store
+"""
+import json
+import os
+import re
+import threading
+from typing import Dict, Optional, Sequence
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+_DTYPES = {
+    "timestamp": np.int64,
+    "open": np.float64,
+    "high": np.float64,
+    "low": np.float64,
+    "close": np.float64,
+    "volume": np.float64,
+}
+_ITEM_SIZE = 8  # 모든 컬럼은 8바이트
+
+
+class OHLCVStore:
+    """
+    심볼/주기별 컬럼형 OHLCV 저장소
+
+    파일 하나에 컬럼 블록 6개(timestamp, open, high, low, close, volume)를
+    capacity 크기로 미리 잡아 두고 np.memmap 으로 읽고 씁니다.
+
+    - 추가(append): 남은 capacity 안에서는 새 봉만 기록하며 파일을 다시 쓰지 않습니다.
+      가득 차면 capacity 를 두 배로 늘린 새 파일을 임시 파일 + os.replace 로 만들고,
+      인덱스가 새 파일을 가리키도록 원자적으로 바꾼 뒤 이전 파일을 지웁니다 (분할 상환 O(1)).
+      도중에 중단되어도 인덱스는 항상 완전한 파일을 가리키며, 이미 반환한 뷰는 이전 매핑을 계속 봅니다.
+    - 조회(read/range): 메모리 매핑 뷰를 그대로 반환하므로 복사가 없고,
+      날짜 범위 조회는 정렬된 timestamp 컬럼에 대한 이진 탐색(O(log n))입니다.
+    - 인덱스(index.json)에는 키별 데이터 파일명, 행 수, capacity, 첫/마지막 timestamp 를 기록합니다.
+    """
+
+    def __init__(self, root_dir: str, initial_capacity: int = 4096):
+        self.root_dir = root_dir
+        self.initial_capacity = initial_capacity
+        self._lock = threading.Lock()
+        self._index_path = os.path.join(root_dir, "index.json")
+
+        os.makedirs(root_dir, exist_ok=True)
+        if os.path.exists(self._index_path):
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                self._index = json.load(f)
+        else:
+            self._index = {}
+
+    @staticmethod
+    def _key(symbol: str, interval: str) -> str:
+        return f"{symbol.upper()}_{interval}"
+
+    @staticmethod
+    def _file_name(key: str, capacity: Optional[int] = None) -> str:
+        """capacity 별 데이터 파일명 (capacity 가 없으면 인덱스에 파일명이 없던 이전 형식)"""
+        safe_key = re.sub(r"[^A-Za-z0-9._=^-]", "_", key)
+        return f"{safe_key}.ohlcv" if capacity is None else f"{safe_key}.c{capacity}.ohlcv"
+
+    def _path(self, key: str, meta: Optional[Dict] = None) -> str:
+        file_name = (meta or {}).get("file") or self._file_name(key)
+        return os.path.join(self.root_dir, file_name)
+
+    def _save_index(self) -> None:
+        tmp_path = self._index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._index_path)
+
+    @staticmethod
+    def _open(path: str, capacity: int, mode: str) -> np.memmap:
+        return np.memmap(path, dtype=np.uint8, mode=mode,
+                         shape=(len(COLUMNS) * capacity * _ITEM_SIZE,))
+
+    @staticmethod
+    def _column(buffer: np.memmap, name: str, capacity: int) -> np.ndarray:
+        offset = COLUMNS.index(name) * capacity * _ITEM_SIZE
+        return buffer[offset:offset + capacity * _ITEM_SIZE].view(_DTYPES[name])
+
+    def _grow(self, key: str, meta: Dict, new_capacity: int) -> str:
+        """
+        capacity 확장: 컬럼 블록을 재배치한 새 파일을 만들어 파일명 반환
+
+        임시 파일에 쓴 뒤 os.replace 로 완성하므로 기존 파일과 그 위의 메모리 매핑 뷰는 건드리지 않습니다.
+        """
+        rows, old_capacity = meta["rows"], meta["capacity"]
+        file_name = self._file_name(key, new_capacity)
+        path = os.path.join(self.root_dir, file_name)
+        tmp_path = path + ".tmp"
+
+        new = self._open(tmp_path, new_capacity, "w+")
+        if old_capacity:
+            old = self._open(self._path(key, meta), old_capacity, "r")
+            for name in COLUMNS:
+                self._column(new, name, new_capacity)[:rows] = self._column(old, name, old_capacity)[:rows]
+            del old
+        new.flush()
+        del new
+
+        os.replace(tmp_path, path)
+        return file_name
+
+    def append(self, symbol: str, interval: str, timestamps: Sequence[int],
+               open_: Sequence[float], high: Sequence[float], low: Sequence[float],
+               close: Sequence[float], volume: Sequence[float]) -> int:
+        """
+        새 봉 추가
+
+        마지막 timestamp 보다 이전 봉은 무시하고, 같은 timestamp 는 덮어씁니다
+        (진행 중인 봉 갱신).
+
+        Returns:
+            int: 새로 추가된 봉 수
+        """
+        key = self._key(symbol, interval)
+        incoming = {
+            "timestamp": np.asarray(timestamps, dtype=np.int64),
+            "open": np.asarray(open_, dtype=np.float64),
+            "high": np.asarray(high, dtype=np.float64),
+            "low": np.asarray(low, dtype=np.float64),
+            "close": np.asarray(close, dtype=np.float64),
+            "volume": np.asarray(volume, dtype=np.float64),
+        }
+
+        order = np.argsort(incoming["timestamp"], kind="stable")
+        incoming = {name: values[order] for name, values in incoming.items()}
+
+        with self._lock:
+            meta = self._index.get(key, {"rows": 0, "capacity": 0, "first_ts": None, "last_ts": None})
+            rows, capacity = meta["rows"], meta["capacity"]
+            file_name = meta.get("file") or self._file_name(key)
+            replaced_path = None
+
+            start_row = rows
+            if rows and len(incoming["timestamp"]):
+                keep = incoming["timestamp"] >= meta["last_ts"]
+                incoming = {name: values[keep] for name, values in incoming.items()}
+                if len(incoming["timestamp"]) and incoming["timestamp"][0] == meta["last_ts"]:
+                    start_row = rows - 1
+
+            count = len(incoming["timestamp"])
+            if count == 0:
+                return 0
+
+            needed = start_row + count
+            if needed > capacity:
+                new_capacity = max(capacity * 2, self.initial_capacity)
+                while new_capacity < needed:
+                    new_capacity *= 2
+                new_file_name = self._grow(key, meta, new_capacity)
+                if capacity and new_file_name != file_name:
+                    replaced_path = self._path(key, meta)
+                file_name, capacity = new_file_name, new_capacity
+
+            buffer = self._open(os.path.join(self.root_dir, file_name), capacity, "r+")
+            for name in COLUMNS:
+                self._column(buffer, name, capacity)[start_row:needed] = incoming[name]
+            buffer.flush()
+            del buffer
+
+            added = needed - rows
+            self._index[key] = {
+                "file": file_name,
+                "rows": needed,
+                "capacity": capacity,
+                "first_ts": int(meta["first_ts"] if meta["first_ts"] is not None else incoming["timestamp"][0]),
+                "last_ts": int(incoming["timestamp"][-1]),
+            }
+            self._save_index()
+
+            # 인덱스가 새 파일을 가리킨 뒤에만 이전 파일 삭제 (열려 있는 매핑은 그대로 유효)
+            if replaced_path is not None:
+                try:
+                    os.remove(replaced_path)
+                except OSError as e:
+                    logger.warning({"store": "ohlcv", "action": "remove_old_file", "key": key, "error": str(e)})
+
+        logger.info({
+            "store": "ohlcv",
+            "action": "append",
+            "key": key,
+            "added": added,
+            "rows": needed
+        })
+        return added
+
+    def append_frame(self, symbol: str, interval: str, frame) -> int:
+        """yfinance history() DataFrame 추가 (인덱스는 DatetimeIndex)"""
+        if frame is None or len(frame) == 0:
+            return 0
+
+        timestamps = frame.index.as_unit("s").asi8  # epoch 초 (UTC)
+        return self.append(
+            symbol, interval, timestamps,
+            frame["Open"].to_numpy(), frame["High"].to_numpy(), frame["Low"].to_numpy(),
+            frame["Close"].to_numpy(), frame["Volume"].to_numpy()
+        )
+
+    def info(self, symbol: str, interval: str) -> Optional[Dict]:
+        """인덱스 정보 (행 수, capacity, 첫/마지막 timestamp)"""
+        return self._index.get(self._key(symbol, interval))
+
+    def last_timestamp(self, symbol: str, interval: str) -> Optional[int]:
+        meta = self.info(symbol, interval)
+        return meta["last_ts"] if meta else None
+
+    def read(self, symbol: str, interval: str) -> Optional[Dict[str, np.ndarray]]:
+        """전체 컬럼을 읽기 전용 메모리 매핑 뷰로 반환 (복사 없음)"""
+        meta = self.info(symbol, interval)
+        if not meta or not meta["rows"]:
+            return None
+
+        buffer = self._open(self._path(self._key(symbol, interval), meta), meta["capacity"], "r")
+        return {name: self._column(buffer, name, meta["capacity"])[:meta["rows"]] for name in COLUMNS}
+
+    def range(self, symbol: str, interval: str, start: Optional[int] = None,
+              end: Optional[int] = None) -> Optional[Dict[str, np.ndarray]]:
+        """
+        [start, end] 구간(epoch 초) 조회
+
+        timestamp 컬럼에 대한 이진 탐색으로 경계를 찾고 뷰를 잘라 반환합니다.
+        """
+        columns = self.read(symbol, interval)
+        if columns is None:
+            return None
+
+        timestamps = columns["timestamp"]
+        lo = 0 if start is None else int(np.searchsorted(timestamps, start, side="left"))
+        hi = len(timestamps) if end is None else int(np.searchsorted(timestamps, end, side="right"))
+        return {name: values[lo:hi] for name, values in columns.items()}
@@ -0,0 +1,141 @@
+"""
+TTL + LRU 인메모리 캐시
+TTL + LRU In-Memory Cache
+"""
+import json
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+FRESH = "fresh"
+STALE = "stale"
+
+
+class TTLCache:
+    """
+    항목별 TTL과 LRU 축출을 지원하는 스레드 안전 캐시
+
+    - ttl_seconds 이내의 항목은 fresh, 이후 stale_ttl_seconds 까지는 stale 로 반환합니다.
+      (stale 항목은 호출자가 백그라운드 갱신을 트리거하는 동안 그대로 제공)
+    - 항목 수(max_entries)와 추정 바이트(max_bytes) 두 한도를 모두 넘지 않도록
+      가장 오래 사용되지 않은 항목부터 축출합니다.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 4 * 1024 * 1024,
+                 ttl_seconds: float = 30.0, stale_ttl_seconds: float = 300.0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.stale_ttl_seconds = stale_ttl_seconds
+
+        # key -> (value, stored_at, ttl, size_bytes)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float, float, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @staticmethod
+    def _estimate_size(value: Any) -> int:
+        """값의 대략적인 크기(바이트) 추정"""
+        try:
+            return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+        except (TypeError, ValueError):
+            return len(repr(value))
+
+    def get(self, key: Hashable) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        캐시 조회
+
+        Returns:
+            (값, 상태) - 상태는 "fresh", "stale" 또는 None(미스)
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None, None
+
+            value, stored_at, ttl, _ = entry
+            age = now - stored_at
+
+            if age > ttl + self.stale_ttl_seconds:
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None, None
+
+            self._entries.move_to_end(key)
+            if age <= ttl:
+                self._hits += 1
+                return value, FRESH
+
+            self._stale_hits += 1
+            return value, STALE
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """캐시 저장 (한도를 넘으면 LRU 축출)"""
+        size = self._estimate_size(value)
+        if size > self.max_bytes:
+            logger.warning({
+                "cache": "ttl_cache",
+                "action": "skip_oversized",
+                "key": str(key),
+                "size_bytes": size
+            })
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (value, time.monotonic(), ttl if ttl is not None else self.ttl_seconds, size)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """항목 삭제"""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """전체 삭제 (통계는 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """히트/미스/축출 카운터 반환"""
+        with self._lock:
+            lookups = self._hits + self._stale_hits + self._misses
+            return {
+                "hits": self._hits,
+                "stale_hits": self._stale_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hit_ratio": (self._hits + self._stale_hits) / lookups if lookups else 0.0
+            }
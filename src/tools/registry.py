@@ -0,0 +1,66 @@
+"""
+에이전트 공유 도구 레지스트리
+Shared Lazily-Constructed Tool Registry
+"""
+import threading
+from typing import Dict, Optional
+
+from .stock_tools import StockDataTool, FinancialNewsTool
+from .calculator_tool import CalculatorTool
+
+
+class ToolRegistry:
+    """
+    에이전트들이 함께 쓰는 도구 묶음
+
+    도구는 처음 요청될 때 만들어지며 이후에는 같은 인스턴스를 돌려줍니다.
+    (도구는 캐시/HTTP 풀을 이미 프로세스 단위로 공유하므로 인스턴스를 나눠 쓸 이유가 없음)
+    """
+
+    def __init__(self, tavily_api_key: Optional[str] = None):
+        self.tavily_api_key = tavily_api_key
+        self._lock = threading.Lock()
+        self._stock_tool: Optional[StockDataTool] = None
+        self._news_tool: Optional[FinancialNewsTool] = None
+        self._calculator_tool: Optional[CalculatorTool] = None
+
+    @property
+    def stock_tool(self) -> StockDataTool:
+        with self._lock:
+            if self._stock_tool is None:
+                self._stock_tool = StockDataTool()
+            return self._stock_tool
+
+    @property
+    def news_tool(self) -> FinancialNewsTool:
+        with self._lock:
+            if self._news_tool is None:
+                self._news_tool = FinancialNewsTool(self.tavily_api_key)
+            return self._news_tool
+
+    @property
+    def calculator_tool(self) -> CalculatorTool:
+        with self._lock:
+            if self._calculator_tool is None:
+                self._calculator_tool = CalculatorTool()
+            return self._calculator_tool
+
+
+_registries: Dict[Optional[str], ToolRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_tool_registry(tavily_api_key: Optional[str] = None) -> ToolRegistry:
+    """Tavily 키별 프로세스 전역 도구 레지스트리 반환 (없으면 생성)"""
+    with _registries_lock:
+        registry = _registries.get(tavily_api_key)
+        if registry is None:
+            registry = ToolRegistry(tavily_api_key)
+            _registries[tavily_api_key] = registry
+        return registry
+
+
+def reset_tool_registries() -> None:
+    """등록된 레지스트리 모두 해제 (Tavily 검색 주소 변경 후 새 도구가 필요할 때)"""
+    with _registries_lock:
+        _registries.clear()
@@ -0,0 +1,229 @@
+"""
+업스트림별 서킷 브레이커와 전역 재시도 예산
+Per-Upstream Circuit Breaker and Global Retry Budget
+"""
+import threading
+import time
+from typing import Dict
+import logging
+
+from .negative_cache import TRANSIENT
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# 업스트림 이름 (서킷 브레이커 키)
+YFINANCE = "yfinance"
+TAVILY = "tavily"
+GEMINI = "gemini"
+
+
+def backoff_seconds(attempt: int) -> float:
+    """지수 백오프 대기 시간"""
+    return 0.5 * (2 ** attempt)
+
+
+class CircuitBreaker:
+    """
+    업스트림 하나에 대한 서킷 브레이커
+
+    - closed: 정상. 연속 실패가 failure_threshold 에 도달하면 open 으로 전환
+    - open: reset_timeout 동안 호출을 즉시 거부 (빠른 실패)
+    - half_open: reset_timeout 이후 half_open_max_calls 개의 시험 호출만 허용,
+      성공하면 closed, 실패하면 다시 open
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 half_open_max_calls: int = 1):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+
+        self._rejected = 0
+        self._opened = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            return self._state
+
+    def _maybe_half_open(self, now: float) -> None:
+        if self._state == OPEN and now - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._half_open_calls = 0
+
+    def _transition(self, state: str) -> None:
+        logger.warning({
+            "circuit": self.name,
+            "from": self._state,
+            "to": state,
+            "failures": self._failures
+        })
+        self._state = state
+
+    def allow(self) -> bool:
+        """호출 허용 여부 (open 이면 False)"""
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+                self._half_open_calls += 1
+                return True
+            self._rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            if self._state != CLOSED:
+                self._transition(CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or (
+                self._state == CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._transition(OPEN)
+                self._opened_at = time.monotonic()
+                self._opened += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "rejected": self._rejected,
+                "opened": self._opened
+            }
+
+
+class RetryBudget:
+    """
+    전체 트래픽 대비 재시도 비율을 제한하는 토큰 버킷
+
+    첫 시도(record_request)마다 ratio 만큼 토큰이 쌓이고, 재시도(try_acquire)마다
+    토큰 1개를 소모합니다. 따라서 장기적으로 재시도 수는 요청 수 × ratio 를 넘지 못하며,
+    장애 시에도 업스트림 부하가 (1 + ratio) 배 이상 늘어나지 않습니다.
+    min_tokens 는 트래픽이 적을 때도 가끔의 재시도를 허용하기 위한 초기 잔액입니다.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_tokens: float = 10.0, max_tokens: float = 100.0):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._lock = threading.Lock()
+        self._tokens = min(min_tokens, max_tokens)
+
+        self._requests = 0
+        self._retries = 0
+        self._denied = 0
+
+    def record_request(self) -> None:
+        """첫 시도 기록 (토큰 적립)"""
+        with self._lock:
+            self._requests += 1
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_acquire(self) -> bool:
+        """재시도 허용 여부 (허용 시 토큰 1개 소모)"""
+        with self._lock:
+            if self._tokens >= 1.0 - 1e-9:  # ratio 누적 시 부동소수점 오차 허용
+                self._tokens -= 1.0
+                self._retries += 1
+                return True
+            self._denied += 1
+            return False
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "retries": self._retries,
+                "denied": self._denied,
+                "tokens": round(self._tokens, 2)
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+_retry_budget = RetryBudget()
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """업스트림 이름별 프로세스 전역 서킷 브레이커 (없으면 기본 설정으로 생성)"""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker(name)
+        return breaker
+
+
+def set_circuit_breaker(breaker: CircuitBreaker) -> None:
+    """업스트림 서킷 브레이커 교체 (설정 변경/테스트용)"""
+    with _breakers_lock:
+        _breakers[breaker.name] = breaker
+
+
+def get_retry_budget() -> RetryBudget:
+    """도구와 LLM 호출이 공유하는 프로세스 전역 재시도 예산"""
+    return _retry_budget
+
+
+def set_retry_budget(budget: RetryBudget) -> None:
+    global _retry_budget
+    _retry_budget = budget
+
+
+def allow_attempt(breaker: CircuitBreaker, attempt: int) -> bool:
+    """
+    attempt 번째 시도 허용 여부
+
+    첫 시도는 재시도 예산에 토큰을 적립하고, 재시도는 토큰을 소모합니다.
+    어느 쪽이든 서킷이 열려 있으면 허용하지 않습니다.
+    """
+    budget = get_retry_budget()
+    if attempt == 0:
+        budget.record_request()
+    elif not budget.try_acquire():
+        return False
+    return breaker.allow()
+
+
+def resilience_stats() -> Dict:
+    """모든 서킷 브레이커 상태와 재시도 예산 카운터"""
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {
+        "circuits": {name: breaker.stats() for name, breaker in breakers.items()},
+        "retry_budget": _retry_budget.stats()
+    }
+
+
+def circuit_open_result(upstream: str, **fields) -> Dict:
+    """서킷이 열려 호출하지 않았을 때의 에러 응답"""
+    return {
+        **fields,
+        "status": "error",
+        "error": f"{upstream} 업스트림 장애로 호출이 일시 중단되었습니다. (서킷 오픈)",
+        "retry_hint": "잠시 후 다시 시도해주세요.",
+        "error_class": TRANSIENT
+    }
+
@@ -0,0 +1,121 @@
+"""
+동일 키 동시 요청 병합 (Single-Flight)
+Single-Flight Request Coalescing
+"""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    """진행 중인 호출 하나 (스레드용)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 호출을 하나의 업스트림 호출로 합칩니다.
+
+    첫 호출자(leader)만 실제 함수를 실행하고, 나머지 호출자는 그 결과를
+    그대로 받습니다. 예외도 모든 대기자에게 동일하게 전파됩니다.
+    스레드 호출자는 do(), asyncio 호출자는 ado() 를 사용합니다.
+    """
+
+    def __init__(self, name: str = "single_flight"):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._async_calls: Dict[Any, Dict[Hashable, asyncio.Future]] = {}
+
+        self._leaders = 0
+        self._shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """스레드 호출자용: key 당 한 번만 fn 실행"""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self._shared += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._leaders += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+        if call.waiters:
+            logger.info({
+                "coalescer": self.name,
+                "key": str(key),
+                "shared_with": call.waiters
+            })
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    async def ado(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """asyncio 호출자용: 같은 이벤트 루프 안에서 key 당 한 번만 fn 실행"""
+        loop = asyncio.get_running_loop()
+        calls = self._async_calls.setdefault(loop, {})
+
+        future = calls.get(key)
+        if future is not None:
+            with self._lock:
+                self._shared += 1
+            # shield: 대기자 하나가 취소되어도 공유 호출은 계속 진행
+            return await asyncio.shield(future)
+
+        future = loop.create_future()
+        calls[key] = future
+        with self._lock:
+            self._leaders += 1
+
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # 대기자가 없을 때 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            calls.pop(key, None)
+            if not calls:
+                self._async_calls.pop(loop, None)
+
+    def stats(self) -> Dict[str, int]:
+        """실제 호출 수와 병합된(절약된) 호출 수"""
+        return {
+            "leader_calls": self._leaders,
+            "coalesced_calls": self._shared
+        }
@@ -3,25 +3,126 @@
 Stock Data Tools
 """
 import yfinance as yf
-import requests
 import time
 import json
+import math
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Dict, List, Optional
 import logging
 
+from .quote_cache import TTLCache, FRESH, STALE
+from .single_flight import SingleFlight
+from .disk_cache import MarketDataDiskCache, get_default_disk_cache
+from .ohlcv_store import OHLCVStore
+from .negative_cache import (
+    NegativeCache, PermanentToolError, PERMANENT, TRANSIENT, classify_error, classify_status
+)
+from .http_client import HTTPClientPool, get_default_http_pool
+from .news_merge import merge_ranked
+from .resilience import (
+    YFINANCE, TAVILY, allow_attempt, backoff_seconds, circuit_open_result, get_circuit_breaker
+)
+
 logger = logging.getLogger(__name__)
 
+# 조회 계층: 가벼운 시세(가격/거래량)와 느리게 변하는 펀더멘털
+QUOTE_TIER = "quote"
+FUNDAMENTALS_TIER = "fundamentals"
+FULL_TIER = "full"
+FUNDAMENTAL_FIELDS = ("market_cap", "pe_ratio", "52w_high", "52w_low")
+
+# 프로세스 전역 캐시 (StockDataTool 인스턴스 간 공유)
+_default_quote_cache = TTLCache(
+    max_entries=512,
+    max_bytes=2 * 1024 * 1024,
+    ttl_seconds=30.0,
+    stale_ttl_seconds=300.0
+)
+_default_fundamentals_cache = TTLCache(
+    max_entries=2048,
+    max_bytes=2 * 1024 * 1024,
+    ttl_seconds=6 * 3600.0,
+    stale_ttl_seconds=24 * 3600.0
+)
+
+# 영구 실패(잘못된 심볼, 4xx) 결과 캐시 (도구별, 인스턴스 간 공유)
+_default_stock_negative_cache = NegativeCache(ttl_seconds=600.0)
+_default_news_negative_cache = NegativeCache(ttl_seconds=300.0)
+
+# yfinance 는 블로킹 API 이므로 비동기 경로에서는 크기가 제한된 executor 에서 실행
+_yfinance_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="yfinance")
+
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+_tavily_search_url = TAVILY_SEARCH_URL
+DEFAULT_NEWS_DOMAINS = ("reuters.com", "bloomberg.com", "cnbc.com", "marketwatch.com")
+
+# 정규화까지 마친 뉴스 결과 캐시 (HTTP 호출과 DataNormalizer.normalize_news_data 모두 생략)
+_default_normalized_news_cache = TTLCache(
+    max_entries=128,
+    max_bytes=2 * 1024 * 1024,
+    ttl_seconds=300.0,
+    stale_ttl_seconds=0.0
+)
+
+# 디스크 캐시 네임스페이스
+QUOTE_NAMESPACE = "stock_quote"
+FUNDAMENTALS_NAMESPACE = "stock_fundamentals"
+NEWS_NAMESPACE = "financial_news"
+_TIER_NAMESPACES = {QUOTE_TIER: QUOTE_NAMESPACE, FUNDAMENTALS_TIER: FUNDAMENTALS_NAMESPACE}
+
+# 동일 (계층, 심볼)/쿼리에 대한 동시 업스트림 호출 병합 (인스턴스 간 공유)
+_quote_flight = SingleFlight("stock_quote")
+_news_flight = SingleFlight("financial_news")
+
+
+def set_tavily_search_url(url: Optional[str]) -> None:
+    """
+    FinancialNewsTool 이 기본으로 호출할 검색 엔드포인트 지정
+    
+    부하 테스트 시 로컬 Tavily 호환 서버(tools.tavily_stand_in)를 가리키게 합니다. None 이면 실제 Tavily.
+    """
+    global _tavily_search_url
+    _tavily_search_url = url or TAVILY_SEARCH_URL
+
+
+def get_tavily_search_url() -> str:
+    return _tavily_search_url
+
+
+def news_cache_key(query: str, max_results: int, domains=DEFAULT_NEWS_DOMAINS) -> tuple:
+    """뉴스 요청 키: (대소문자/공백 정규화 쿼리, 결과 수, 정렬된 도메인 목록)"""
+    return (
+        " ".join(query.lower().split()),
+        max_results,
+        tuple(sorted({domain.lower() for domain in domains}))
+    )
+
 
 class StockDataTool:
     """주식 데이터 조회 도구"""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[TTLCache] = None,
+                 disk_cache: Optional[MarketDataDiskCache] = None,
+                 fundamentals_cache: Optional[TTLCache] = None,
+                 negative_cache: Optional[NegativeCache] = None):
         self.name = "stock_data_tool"
+        self.cache = cache if cache is not None else _default_quote_cache
+        self.fundamentals_cache = (
+            fundamentals_cache if fundamentals_cache is not None else _default_fundamentals_cache
+        )
+        self.negative_cache = negative_cache if negative_cache is not None else _default_stock_negative_cache
+        self._disk_cache = disk_cache
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
         self.description = """
         주식 데이터를 조회합니다.
         
         입력: {
-            "symbol": "주식 심볼 (예: AAPL, TSLA)"
+            "symbol": "주식 심볼 (예: AAPL, TSLA)",
+            "tier": "full (기본값) 또는 quote (가격/거래량만)"
         }
         
         출력: {
@@ -38,89 +139,680 @@ class StockDataTool:
         에러: 네트워크 오류, 잘못된 심볼 등
         """
     
-    def run(self, symbol: str, max_retries: int = 3) -> Dict:
+    def run(self, symbol: str, max_retries: int = 3, tier: str = FULL_TIER) -> Dict:
         """
         주식 데이터를 조회합니다.
         
+        시세(가격/거래량)는 가벼운 fast_info 로, 펀더멘털(PER, 시가총액, 52주 범위)은
+        ticker.info 로 따로 조회해 각각 다른 TTL 로 캐시합니다. tier="quote" 이면
+        펀더멘털은 조회하지 않으며, 필요해지면 fundamentals() 로 나중에 가져옵니다.
+        "full" 이면 두 계층을 동시에 조회합니다.
+        
+        캐시에 신선한 값이 있으면 바로 반환하고, 만료된(stale) 값이 있으면
+        그 값을 반환하면서 백그라운드에서 한 번만 갱신합니다.
+        
         Args:
             symbol: 주식 심볼
             max_retries: 최대 재시도 횟수
+            tier: "full" 또는 "quote"
             
         Returns:
             Dict: 주식 데이터 또는 에러 정보
         """
-        for attempt in range(max_retries):
-            try:
-                start_time = time.time()
-                
-                ticker = yf.Ticker(symbol)
-                info = ticker.info
-                
-                # 유효하지 않은 심볼 체크
-                if not info or len(info) <= 2:  # 빈 결과 또는 기본 정보만 있는 경우
-                    raise ValueError(f"심볼 '{symbol}'에 대한 데이터를 찾을 수 없습니다.")
-                
-                # 현재 가격이 없으면 유효하지 않은 것으로 간주
-                current_price = info.get("currentPrice")
-                if current_price is None:
-                    raise ValueError(f"심볼 '{symbol}'의 현재 가격 정보를 가져올 수 없습니다.")
-                
-                # 주요 데이터 추출
-                stock_data = {
+        # 영구 실패로 캐시된 심볼은 펀더멘털을 조회할 필요가 없음
+        if tier == QUOTE_TIER or (QUOTE_TIER, symbol) in self.negative_cache:
+            return self._get(QUOTE_TIER, symbol, max_retries)
+        
+        # fast_info 와 ticker.info 를 순차로 기다리지 않도록 펀더멘털은 executor 에서 함께 조회
+        fundamentals = _yfinance_executor.submit(self._get, FUNDAMENTALS_TIER, symbol, max_retries)
+        quote = self._get(QUOTE_TIER, symbol, max_retries)
+        if quote.get("status") != "success":
+            return quote
+        
+        return self._merge(quote, fundamentals.result())
+    
+    async def arun(self, symbol: str, max_retries: int = 3, tier: str = FULL_TIER) -> Dict:
+        """
+        주식 데이터를 비동기로 조회합니다. (run 과 동일한 결과 형태)
+        
+        Args:
+            symbol: 주식 심볼
+            max_retries: 최대 재시도 횟수
+            tier: "full" 또는 "quote"
+            
+        Returns:
+            Dict: 주식 데이터 또는 에러 정보
+        """
+        if tier == QUOTE_TIER or (QUOTE_TIER, symbol) in self.negative_cache:
+            return await self._aget(QUOTE_TIER, symbol, max_retries)
+        
+        quote, fundamentals = await asyncio.gather(
+            self._aget(QUOTE_TIER, symbol, max_retries),
+            self._aget(FUNDAMENTALS_TIER, symbol, max_retries)
+        )
+        if quote.get("status") != "success":
+            return quote
+        
+        return self._merge(quote, fundamentals)
+    
+    def fundamentals(self, symbol: str, max_retries: int = 3) -> Dict:
+        """
+        펀더멘털(PER, 시가총액, 52주 범위)만 조회합니다. (긴 TTL 로 캐시)
+        
+        Args:
+            symbol: 주식 심볼
+            max_retries: 최대 재시도 횟수
+            
+        Returns:
+            Dict: 펀더멘털 데이터 또는 에러 정보
+        """
+        return self._get(FUNDAMENTALS_TIER, symbol, max_retries)
+    
+    def run_many(self, symbols: List[str], include_fundamentals: bool = False,
+                 max_retries: int = 3) -> Dict[str, Dict]:
+        """
+        여러 심볼의 주식 데이터를 한 번에 조회합니다.
+        
+        캐시에 없는 심볼은 yf.download 한 번으로 1년치 일봉을 받아
+        현재가/변화량/거래량/52주 고저를 계산합니다. PER과 시가총액은
+        ticker.info 에만 있으므로 include_fundamentals=True 이거나 이미 캐시된 경우에만 채웁니다.
+        
+        Args:
+            symbols: 주식 심볼 목록
+            include_fundamentals: PER/시가총액 조회 여부 (캐시에 없으면 심볼당 추가 호출)
+            max_retries: 일괄 다운로드 최대 재시도 횟수
+            
+        Returns:
+            Dict[str, Dict]: 심볼별 run() 과 동일한 형태의 결과
+        """
+        ordered = list(dict.fromkeys(symbols))  # 순서를 유지하며 중복 제거
+        quotes: Dict[str, Dict] = {}
+        pending: List[str] = []
+        
+        for symbol in ordered:
+            if not symbol or not symbol.strip():
+                quotes[symbol] = {
                     "symbol": symbol,
-                    "current_price": current_price,
-                    "change": info.get("regularMarketChange", "N/A"),
-                    "change_percent": info.get("regularMarketChangePercent", "N/A"),
-                    "volume": info.get("volume", "N/A"),
-                    "market_cap": info.get("marketCap", "N/A"),
-                    "pe_ratio": info.get("trailingPE", "N/A"),
-                    "52w_high": info.get("fiftyTwoWeekHigh", "N/A"),
-                    "52w_low": info.get("fiftyTwoWeekLow", "N/A"),
-                    "status": "success"
+                    "status": "error",
+                    "error": "주식 데이터 조회 실패: 빈 심볼입니다.",
+                    "retry_hint": "심볼을 다시 확인해주세요."
                 }
-                
-                latency_ms = (time.time() - start_time) * 1000
-                logger.info({
-                    "tool": self.name,
-                    "symbol": symbol,
-                    "status": "success",
-                    "attempt": attempt + 1,
-                    "latency_ms": latency_ms
-                })
-                
-                return stock_data
-                
+                continue
+            
+            cached, cache_state = self._lookup(QUOTE_TIER, symbol)
+            if cache_state is not None:
+                if cache_state == STALE:
+                    self._schedule_refresh(QUOTE_TIER, symbol, max_retries)
+                quotes[symbol] = dict(cached)
+                continue
+            
+            negative = self.negative_cache.get((QUOTE_TIER, symbol))
+            if negative is not None:
+                quotes[symbol] = negative
+            else:
+                pending.append(symbol)
+        
+        ranges: Dict[str, Dict] = {}
+        if pending:
+            fetched, ranges = self._fetch_many(pending, max_retries)
+            quotes.update(fetched)
+        
+        results: Dict[str, Dict] = {}
+        for symbol in ordered:
+            quote = quotes[symbol]
+            if quote.get("status") != "success":
+                results[symbol] = quote
+                continue
+            
+            if include_fundamentals:
+                fundamentals = self._get(FUNDAMENTALS_TIER, symbol, max_retries)
+            else:
+                fundamentals, _ = self._lookup(FUNDAMENTALS_TIER, symbol)
+            results[symbol] = self._merge(quote, fundamentals, fallback=ranges.get(symbol))
+        
+        return results
+    
+    def _fetch_many(self, symbols: List[str], max_retries: int):
+        """
+        yf.download 일괄 조회 (재시도 + 지수 백오프, 서킷 브레이커/재시도 예산 적용)
+        
+        Returns:
+            (심볼별 시세 또는 에러, 심볼별 52주 범위)
+        """
+        start_time = time.time()
+        breaker = get_circuit_breaker(YFINANCE)
+        history = None
+        last_error = None
+        
+        for attempt in range(max_retries):
+            if not allow_attempt(breaker, attempt):
+                break
+            try:
+                history = yf.download(
+                    symbols,
+                    period="1y",
+                    interval="1d",
+                    group_by="ticker",
+                    auto_adjust=False,
+                    threads=True,
+                    progress=False
+                )
+                break
             except Exception as e:
-                latency_ms = (time.time() - start_time) * 1000
-                error_msg = f"주식 데이터 조회 실패: {str(e)}"
-                
+                breaker.record_failure()
+                last_error = e
                 logger.error({
                     "tool": self.name,
-                    "symbol": symbol,
+                    "symbols_count": len(symbols),
                     "status": "error",
-                    "error": error_msg,
-                    "attempt": attempt + 1,
-                    "latency_ms": latency_ms
+                    "error": f"일괄 주식 데이터 조회 실패: {str(e)}",
+                    "attempt": attempt + 1
                 })
+                if attempt < max_retries - 1:
+                    time.sleep(backoff_seconds(attempt))
+        
+        if history is None and last_error is None:
+            errors = {symbol: circuit_open_result(YFINANCE, symbol=symbol) for symbol in symbols}
+            return errors, {}
+        
+        if history is None:
+            errors = {
+                symbol: {
+                    "symbol": symbol,
+                    "status": "error",
+                    "error": f"주식 데이터 조회 실패: {str(last_error)}",
+                    "retry_hint": "네트워크 연결을 확인하거나 심볼을 다시 확인해주세요.",
+                    "error_class": classify_error(last_error)
+                }
+                for symbol in symbols
+            }
+            return errors, {}
+        
+        multi_level = getattr(history.columns, "nlevels", 1) > 1
+        # yf.download 는 네트워크 오류도 예외 없이 빈/NaN 프레임으로 돌려주고, 심볼별 실패 사유를 남김
+        download_errors = dict(getattr(getattr(yf, "shared", None), "_ERRORS", None) or {})
+        quotes: Dict[str, Dict] = {}
+        ranges: Dict[str, Dict] = {}
+        failures: Dict[str, Exception] = {}
+        
+        for symbol in symbols:
+            try:
+                if multi_level:
+                    if symbol not in history.columns.get_level_values(0):
+                        raise PermanentToolError(f"심볼 '{symbol}'에 대한 데이터를 찾을 수 없습니다.")
+                    frame = history[symbol]
+                else:
+                    frame = history
                 
+                frame = frame.dropna(subset=["Close"])
+                if frame.empty:
+                    raise PermanentToolError(f"심볼 '{symbol}'의 현재 가격 정보를 가져올 수 없습니다.")
+                
+                closes = frame["Close"]
+                current_price = float(closes.iloc[-1])
+                previous_close = float(closes.iloc[-2]) if len(closes) > 1 else None
+                
+                quote = self._quote_result(
+                    symbol, current_price, previous_close, int(frame["Volume"].iloc[-1])
+                )
+                self._store(QUOTE_TIER, symbol, quote)
+                quotes[symbol] = quote
+                ranges[symbol] = {
+                    "52w_high": float(frame["High"].max()),
+                    "52w_low": float(frame["Low"].min())
+                }
+                
+            except Exception as e:
+                failures[symbol] = e
+        
+        # 배치 전체가 비었으면 심볼 문제가 아니라 업스트림/네트워크 장애로 보고 네거티브 캐시하지 않음
+        if ranges:
+            breaker.record_success()
+        elif failures:
+            breaker.record_failure()
+        
+        for symbol, error in failures.items():
+            reported = download_errors.get(symbol)
+            if not ranges:
+                error_class = TRANSIENT
+            elif reported is not None:
+                # yfinance 가 남긴 실패 사유로 분류 (상장폐지/없음은 영구, 그 외는 일시적)
+                error_class = classify_error(Exception(reported))
+            else:
+                error_class = classify_error(error)
+            quotes[symbol] = {
+                "symbol": symbol,
+                "status": "error",
+                "error": f"주식 데이터 조회 실패: {reported or str(error)}",
+                "retry_hint": "네트워크 연결을 확인하거나 심볼을 다시 확인해주세요.",
+                "error_class": error_class
+            }
+            self.negative_cache.put((QUOTE_TIER, symbol), quotes[symbol])
+        
+        logger.info({
+            "tool": self.name,
+            "action": "run_many",
+            "symbols_count": len(symbols),
+            "success_count": len(ranges),
+            "latency_ms": (time.time() - start_time) * 1000
+        })
+        
+        return quotes, ranges
+    
+    def update_history(self, symbol: str, store: OHLCVStore, interval: str = "1d",
+                       period: str = "1y") -> Dict:
+        """
+        과거 OHLCV 를 저장소에 증분 적재합니다.
+        
+        저장소가 비어 있으면 period 만큼, 이미 데이터가 있으면 마지막 봉 이후만 받아옵니다.
+        
+        Args:
+            symbol: 주식 심볼
+            store: OHLCV 저장소
+            interval: 봉 주기 (예: 1d, 1h)
+            period: 최초 적재 기간
+            
+        Returns:
+            Dict: 적재 요약 또는 에러 정보
+        """
+        start_time = time.time()
+        breaker = get_circuit_breaker(YFINANCE)
+        if not allow_attempt(breaker, 0):
+            return circuit_open_result(YFINANCE, symbol=symbol)
+        
+        fetched = False
+        try:
+            ticker = yf.Ticker(symbol)
+            last_ts = store.last_timestamp(symbol, interval)
+            if last_ts is None:
+                frame = ticker.history(period=period, interval=interval, auto_adjust=False)
+            else:
+                frame = ticker.history(
+                    start=datetime.fromtimestamp(last_ts, tz=timezone.utc),
+                    interval=interval,
+                    auto_adjust=False
+                )
+            
+            breaker.record_success()
+            fetched = True
+            added = store.append_frame(symbol, interval, frame)
+            meta = store.info(symbol, interval)
+            if not meta:
+                raise ValueError(f"심볼 '{symbol}'의 과거 시세 데이터를 찾을 수 없습니다.")
+            
+            logger.info({
+                "tool": self.name,
+                "action": "update_history",
+                "symbol": symbol,
+                "interval": interval,
+                "added": added,
+                "bars": meta["rows"],
+                "latency_ms": (time.time() - start_time) * 1000
+            })
+            
+            return {
+                "symbol": symbol,
+                "status": "success",
+                "interval": interval,
+                "added": added,
+                "bars": meta["rows"],
+                "start": datetime.fromtimestamp(meta["first_ts"], tz=timezone.utc).date().isoformat(),
+                "end": datetime.fromtimestamp(meta["last_ts"], tz=timezone.utc).date().isoformat()
+            }
+            
+        except Exception as e:
+            if not fetched:
+                breaker.record_failure()
+            error_msg = f"과거 시세 조회 실패: {str(e)}"
+            logger.error({
+                "tool": self.name,
+                "action": "update_history",
+                "symbol": symbol,
+                "status": "error",
+                "error": error_msg
+            })
+            return {
+                "symbol": symbol,
+                "status": "error",
+                "error": error_msg,
+                "retry_hint": "네트워크 연결을 확인하거나 심볼을 다시 확인해주세요."
+            }
+    
+    def cache_stats(self) -> Dict:
+        """시세/펀더멘털 캐시 히트/미스/축출 카운터와 네거티브 캐시 절약 횟수"""
+        return {
+            QUOTE_TIER: self.cache.stats(),
+            FUNDAMENTALS_TIER: self.fundamentals_cache.stats(),
+            "negative": self.negative_cache.stats()
+        }
+    
+    def warm_start(self, max_age: Optional[float] = None) -> int:
+        """
+        디스크 캐시의 최근 시세/펀더멘털을 메모리 캐시에 미리 적재합니다.
+        
+        Args:
+            max_age: 적재할 최대 경과 시간(초), 기본값은 계층별 TTL + stale 기간
+            
+        Returns:
+            int: 적재된 항목 수
+        """
+        disk = self._disk()
+        if disk is None:
+            return 0
+        
+        loaded = 0
+        for tier in (QUOTE_TIER, FUNDAMENTALS_TIER):
+            cache = self._cache_for(tier)
+            tier_max_age = max_age if max_age is not None else cache.ttl_seconds + cache.stale_ttl_seconds
+            entries = disk.load_recent(_TIER_NAMESPACES[tier], tier_max_age)
+            for symbol, value, age in entries:
+                cache.set(symbol, value, ttl=max(0.0, cache.ttl_seconds - age))
+            loaded += len(entries)
+        
+        logger.info({
+            "tool": self.name,
+            "action": "warm_start",
+            "loaded": loaded
+        })
+        return loaded
+    
+    @staticmethod
+    def _merge(quote: Dict, fundamentals: Optional[Dict], fallback: Optional[Dict] = None) -> Dict:
+        """시세 + 펀더멘털을 run() 결과 형태로 합침 (펀더멘털이 없으면 N/A)"""
+        if not fundamentals or fundamentals.get("status") != "success":
+            fundamentals = fallback or {}
+        
+        stock_data = {key: value for key, value in quote.items() if key != "tier"}
+        for field in FUNDAMENTAL_FIELDS:
+            stock_data[field] = fundamentals.get(field, "N/A")
+        stock_data["status"] = "success"
+        return stock_data
+    
+    def _cache_for(self, tier: str) -> TTLCache:
+        return self.cache if tier == QUOTE_TIER else self.fundamentals_cache
+    
+    def _disk(self) -> Optional[MarketDataDiskCache]:
+        return self._disk_cache if self._disk_cache is not None else get_default_disk_cache()
+    
+    def _get(self, tier: str, symbol: str, max_retries: int) -> Dict:
+        """캐시 조회 후 없으면 업스트림 조회 (동시 요청 병합)"""
+        cached, cache_state = self._lookup(tier, symbol)
+        if cache_state == FRESH:
+            return dict(cached)
+        if cache_state == STALE:
+            self._schedule_refresh(tier, symbol, max_retries)
+            return dict(cached)
+        
+        negative = self.negative_cache.get((tier, symbol))
+        if negative is not None:
+            return negative
+        
+        result = _quote_flight.do((tier, symbol), lambda: self._fetch_and_cache(tier, symbol, max_retries))
+        return dict(result)
+    
+    async def _aget(self, tier: str, symbol: str, max_retries: int) -> Dict:
+        """캐시 조회 후 없으면 업스트림 조회 (비동기)"""
+        cached, cache_state = self._lookup(tier, symbol)
+        if cache_state == FRESH:
+            return dict(cached)
+        if cache_state == STALE:
+            self._schedule_refresh(tier, symbol, max_retries)
+            return dict(cached)
+        
+        negative = self.negative_cache.get((tier, symbol))
+        if negative is not None:
+            return negative
+        
+        result = await _quote_flight.ado(
+            (tier, symbol), lambda: self._afetch_and_cache(tier, symbol, max_retries)
+        )
+        return dict(result)
+    
+    def _lookup(self, tier: str, symbol: str):
+        """메모리 캐시 → 디스크 캐시 순으로 조회 (디스크 히트는 메모리로 승격)"""
+        cache = self._cache_for(tier)
+        cached, cache_state = cache.get(symbol)
+        if cache_state is not None:
+            return cached, cache_state
+        
+        disk = self._disk()
+        if disk is None:
+            return None, None
+        
+        value, age = disk.get(_TIER_NAMESPACES[tier], symbol, cache.ttl_seconds + cache.stale_ttl_seconds)
+        if value is None:
+            return None, None
+        
+        # 남은 TTL 만큼만 신선한 것으로 취급
+        cache.set(symbol, value, ttl=max(0.0, cache.ttl_seconds - age))
+        return value, FRESH if age <= cache.ttl_seconds else STALE
+    
+    def _store(self, tier: str, symbol: str, data: Dict) -> None:
+        """성공한 결과를 메모리/디스크 캐시에 저장"""
+        self._cache_for(tier).set(symbol, data)
+        disk = self._disk()
+        if disk is not None:
+            disk.set(_TIER_NAMESPACES[tier], symbol, data)
+    
+    def _schedule_refresh(self, tier: str, symbol: str, max_retries: int) -> None:
+        """stale 항목을 백그라운드에서 갱신 (키당 동시에 하나만)"""
+        key = (tier, symbol)
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        
+        def refresh():
+            try:
+                _quote_flight.do(key, lambda: self._fetch_and_cache(tier, symbol, max_retries))
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(key)
+        
+        threading.Thread(target=refresh, name=f"{tier}-refresh-{symbol}", daemon=True).start()
+    
+    def _fetch_and_cache(self, tier: str, symbol: str, max_retries: int) -> Dict:
+        """조회 후 성공한 결과는 캐시에, 영구 실패는 네거티브 캐시에 저장"""
+        result = self._fetch(tier, symbol, max_retries)
+        if result.get("status") == "success":
+            self._store(tier, symbol, result)
+        else:
+            self.negative_cache.put((tier, symbol), result)
+        return result
+    
+    async def _afetch_and_cache(self, tier: str, symbol: str, max_retries: int) -> Dict:
+        """조회 후 성공한 결과는 캐시에, 영구 실패는 네거티브 캐시에 저장 (비동기)"""
+        result = await self._afetch(tier, symbol, max_retries)
+        if result.get("status") == "success":
+            self._store(tier, symbol, result)
+        else:
+            self.negative_cache.put((tier, symbol), result)
+        return result
+    
+    def _fetch_once(self, tier: str, symbol: str, attempt: int, start_time: float) -> Dict:
+        if tier == QUOTE_TIER:
+            return self._fetch_quote_once(symbol, attempt, start_time)
+        return self._fetch_fundamentals_once(symbol, attempt, start_time)
+    
+    def _fetch(self, tier: str, symbol: str, max_retries: int) -> Dict:
+        """yfinance에서 조회 (재시도 + 지수 백오프, 서킷 브레이커/재시도 예산 적용)"""
+        breaker = get_circuit_breaker(YFINANCE)
+        error_result = None
+        for attempt in range(max_retries):
+            # 서킷이 열렸거나 재시도 예산이 없으면 마지막 에러로 빠르게 실패
+            if not allow_attempt(breaker, attempt):
+                return error_result or circuit_open_result(YFINANCE, symbol=symbol)
+            
+            start_time = time.time()
+            try:
+                result = self._fetch_once(tier, symbol, attempt, start_time)
+                breaker.record_success()
+                return result
+            except Exception as e:
+                error_result = self._error_result(symbol, e, attempt, start_time)
+                # 영구 실패는 업스트림이 정상 응답한 것이므로 재시도하지 않음
+                if error_result["error_class"] == PERMANENT:
+                    breaker.record_success()
+                    return error_result
+                breaker.record_failure()
                 if attempt == max_retries - 1:
-                    return {
-                        "symbol": symbol,
-                        "status": "error",
-                        "error": error_msg,
-                        "retry_hint": "네트워크 연결을 확인하거나 심볼을 다시 확인해주세요."
-                    }
+                    return error_result
                 
                 # 지수 백오프
-                time.sleep(0.5 * (2 ** attempt))
+                time.sleep(backoff_seconds(attempt))
+    
+    async def _afetch(self, tier: str, symbol: str, max_retries: int) -> Dict:
+        """yfinance 조회를 제한된 executor 에서 실행 (asyncio.sleep 백오프)"""
+        loop = asyncio.get_running_loop()
+        breaker = get_circuit_breaker(YFINANCE)
+        error_result = None
+        for attempt in range(max_retries):
+            if not allow_attempt(breaker, attempt):
+                return error_result or circuit_open_result(YFINANCE, symbol=symbol)
+            
+            start_time = time.time()
+            try:
+                result = await loop.run_in_executor(
+                    _yfinance_executor, self._fetch_once, tier, symbol, attempt, start_time
+                )
+                breaker.record_success()
+                return result
+            except Exception as e:
+                error_result = self._error_result(symbol, e, attempt, start_time)
+                if error_result["error_class"] == PERMANENT:
+                    breaker.record_success()
+                    return error_result
+                breaker.record_failure()
+                if attempt == max_retries - 1:
+                    return error_result
+                
+                await asyncio.sleep(backoff_seconds(attempt))
+    
+    @staticmethod
+    def _quote_result(symbol: str, current_price: float, previous_close: Optional[float],
+                      volume) -> Dict:
+        """가격/거래량 시세 결과 생성"""
+        if previous_close:
+            change = current_price - previous_close
+            change_percent = (change / previous_close) * 100
+        else:
+            change = "N/A"
+            change_percent = "N/A"
+        
+        return {
+            "symbol": symbol,
+            "current_price": current_price,
+            "change": change,
+            "change_percent": change_percent,
+            "volume": volume if volume is not None else "N/A",
+            "status": "success",
+            "tier": QUOTE_TIER
+        }
+    
+    def _fetch_quote_once(self, symbol: str, attempt: int, start_time: float) -> Dict:
+        """fast_info 로 가격/거래량만 조회 (실패 시 예외)"""
+        fast_info = yf.Ticker(symbol).fast_info
+        
+        current_price = fast_info.last_price
+        if current_price is None or math.isnan(current_price):
+            raise PermanentToolError(f"심볼 '{symbol}'의 현재 가격 정보를 가져올 수 없습니다.")
+        
+        previous_close = fast_info.previous_close
+        if previous_close is not None and math.isnan(previous_close):
+            previous_close = None
+        
+        quote = self._quote_result(symbol, float(current_price), previous_close, fast_info.last_volume)
+        
+        latency_ms = (time.time() - start_time) * 1000
+        logger.info({
+            "tool": self.name,
+            "symbol": symbol,
+            "tier": QUOTE_TIER,
+            "status": "success",
+            "attempt": attempt + 1,
+            "latency_ms": latency_ms
+        })
+        
+        return quote
+    
+    def _fetch_fundamentals_once(self, symbol: str, attempt: int, start_time: float) -> Dict:
+        """ticker.info 로 펀더멘털 조회 (실패 시 예외)"""
+        info = yf.Ticker(symbol).info
+        
+        # 유효하지 않은 심볼 체크
+        if not info or len(info) <= 2:  # 빈 결과 또는 기본 정보만 있는 경우
+            raise PermanentToolError(f"심볼 '{symbol}'에 대한 데이터를 찾을 수 없습니다.")
+        
+        fundamentals = {
+            "symbol": symbol,
+            "market_cap": info.get("marketCap", "N/A"),
+            "pe_ratio": info.get("trailingPE", "N/A"),
+            "52w_high": info.get("fiftyTwoWeekHigh", "N/A"),
+            "52w_low": info.get("fiftyTwoWeekLow", "N/A"),
+            "status": "success",
+            "tier": FUNDAMENTALS_TIER
+        }
+        
+        latency_ms = (time.time() - start_time) * 1000
+        logger.info({
+            "tool": self.name,
+            "symbol": symbol,
+            "tier": FUNDAMENTALS_TIER,
+            "status": "success",
+            "attempt": attempt + 1,
+            "latency_ms": latency_ms
+        })
+        
+        return fundamentals
+    
+    def _error_result(self, symbol: str, error: Exception, attempt: int, start_time: float) -> Dict:
+        """실패 로깅 후 에러 응답 생성"""
+        latency_ms = (time.time() - start_time) * 1000
+        error_msg = f"주식 데이터 조회 실패: {str(error)}"
+        error_class = classify_error(error)
+        
+        logger.error({
+            "tool": self.name,
+            "symbol": symbol,
+            "status": "error",
+            "error": error_msg,
+            "error_class": error_class,
+            "attempt": attempt + 1,
+            "latency_ms": latency_ms
+        })
+        
+        return {
+            "symbol": symbol,
+            "status": "error",
+            "error": error_msg,
+            "retry_hint": "네트워크 연결을 확인하거나 심볼을 다시 확인해주세요.",
+            "error_class": error_class
+        }
 
 
 class FinancialNewsTool:
     """금융 뉴스 조회 도구"""
     
-    def __init__(self, tavily_api_key: Optional[str] = None):
+    def __init__(self, tavily_api_key: Optional[str] = None,
+                 disk_cache: Optional[MarketDataDiskCache] = None,
+                 disk_ttl_seconds: float = 900.0,
+                 negative_cache: Optional[NegativeCache] = None,
+                 http_pool: Optional[HTTPClientPool] = None,
+                 include_domains: Optional[List[str]] = None,
+                 normalized_cache: Optional[TTLCache] = None,
+                 search_url: Optional[str] = None):
         self.name = "financial_news_tool"
         self.tavily_api_key = tavily_api_key
+        self.search_url = search_url or get_tavily_search_url()
+        self.include_domains = list(include_domains) if include_domains is not None else list(DEFAULT_NEWS_DOMAINS)
+        self.normalized_cache = (
+            normalized_cache if normalized_cache is not None else _default_normalized_news_cache
+        )
+        # 연결 재사용을 위해 프로세스 공유 풀 사용 (인스턴스마다 새 연결을 맺지 않음)
+        self.http_pool = http_pool if http_pool is not None else get_default_http_pool()
+        self.negative_cache = negative_cache if negative_cache is not None else _default_news_negative_cache
+        self._disk_cache = disk_cache
+        self.disk_ttl_seconds = disk_ttl_seconds
         self.description = """
         금융 관련 뉴스를 검색합니다.
         
@@ -154,98 +846,356 @@ class FinancialNewsTool:
             Dict: 뉴스 데이터 또는 에러 정보
         """
         if not self.tavily_api_key:
-            return {
-                "status": "error",
-                "error": "Tavily API 키가 설정되지 않았습니다.",
-                "retry_hint": "API 키를 설정해주세요."
-            }
+            return self._missing_key_result()
+        
+        cached = self._disk_lookup(query, max_results)
+        if cached is not None:
+            return cached
+        
+        negative = self.negative_cache.get(self._key(query, max_results))
+        if negative is not None:
+            return negative
+        
+        # 동일한 (쿼리, 결과 수) 동시 요청은 한 번의 검색으로 병합
+        result = _news_flight.do(
+            self._key(query, max_results),
+            lambda: self._store(query, max_results, self._search(query, max_results, max_retries))
+        )
+        return dict(result)
+    
+    async def arun(self, query: str, max_results: int = 5, max_retries: int = 3) -> Dict:
+        """
+        금융 뉴스를 비동기로 검색합니다. (run 과 동일한 결과 형태)
+        
+        Args:
+            query: 검색 쿼리
+            max_results: 최대 결과 수
+            max_retries: 최대 재시도 횟수
+            
+        Returns:
+            Dict: 뉴스 데이터 또는 에러 정보
+        """
+        if not self.tavily_api_key:
+            return self._missing_key_result()
+        
+        cached = self._disk_lookup(query, max_results)
+        if cached is not None:
+            return cached
+        
+        negative = self.negative_cache.get(self._key(query, max_results))
+        if negative is not None:
+            return negative
+        
+        async def search():
+            result = await self._asearch(query, max_results, max_retries)
+            return self._store(query, max_results, result)
+        
+        result = await _news_flight.ado(self._key(query, max_results), search)
+        return dict(result)
+    
+    def run_many(self, queries: List[str], max_results: int = 3, max_concurrency: int = 4,
+                 limit: Optional[int] = None, max_retries: int = 3) -> Dict:
+        """
+        여러 쿼리(티커, 회사명, 섹터, 실적 등)를 동시에 검색하고 하나의 순위 목록으로 병합합니다.
+        
+        최대 max_concurrency 개씩 병렬로 실행하므로 전체 지연은 대략 가장 느린 쿼리 하나 수준입니다.
+        
+        Args:
+            queries: 검색 쿼리 목록
+            max_results: 쿼리당 최대 결과 수
+            max_concurrency: 동시 검색 수 상한
+            limit: 병합 후 최대 결과 수 (None 이면 전체)
+            max_retries: 쿼리당 최대 재시도 횟수
+            
+        Returns:
+            Dict: run() 과 같은 형태 + queries, failed_queries, duplicates_removed
+        """
+        queries = self._unique_queries(queries)
+        if not self.tavily_api_key:
+            return self._missing_key_result()
+        if not queries:
+            return self._merge_results([], [], limit)
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(queries))),
+                                thread_name_prefix="news-fanout") as executor:
+            results = list(executor.map(lambda q: self.run(q, max_results, max_retries), queries))
+        
+        return self._merge_results(queries, results, limit)
+    
+    async def arun_many(self, queries: List[str], max_results: int = 3, max_concurrency: int = 4,
+                        limit: Optional[int] = None, max_retries: int = 3) -> Dict:
+        """
+        여러 쿼리를 비동기로 동시에 검색하고 병합합니다. (run_many 와 동일한 결과 형태)
+        """
+        queries = self._unique_queries(queries)
+        if not self.tavily_api_key:
+            return self._missing_key_result()
+        if not queries:
+            return self._merge_results([], [], limit)
+        
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def search(query):
+            async with semaphore:
+                return await self.arun(query, max_results, max_retries)
+        
+        results = await asyncio.gather(*(search(query) for query in queries))
+        return self._merge_results(queries, list(results), limit)
+    
+    @staticmethod
+    def _unique_queries(queries: List[str]) -> List[str]:
+        """빈 쿼리 제거, 정규화 기준 중복 제거 (순서 유지)"""
+        unique = {}
+        for query in queries:
+            if query and query.strip():
+                unique.setdefault(" ".join(query.lower().split()), query.strip())
+        return list(unique.values())
+    
+    def _merge_results(self, queries: List[str], results: List[Dict], limit: Optional[int]) -> Dict:
+        """쿼리별 결과 병합 (하나라도 성공하면 success)"""
+        succeeded = [result for result in results if result.get("status") == "success"]
+        failed = [
+            {"query": query, "error": result.get("error", "Unknown error")}
+            for query, result in zip(queries, results) if result.get("status") != "success"
+        ]
+        
+        if results and not succeeded:
+            error_result = dict(results[0])
+            error_result["failed_queries"] = failed
+            return error_result
+        
+        merged = merge_ranked([result.get("results", []) for result in succeeded], limit=limit)
+        
+        logger.info({
+            "tool": self.name,
+            "action": "run_many",
+            "queries_count": len(queries),
+            "failed_count": len(failed),
+            "results_count": len(merged["results"]),
+            "duplicates_removed": merged["duplicates_removed"]
+        })
         
+        return {
+            "status": "success",
+            "query": " | ".join(queries),
+            "queries": queries,
+            "results": merged["results"],
+            "total_results": len(merged["results"]),
+            "duplicates_removed": merged["duplicates_removed"],
+            "failed_queries": failed
+        }
+    
+    def _disk(self) -> Optional[MarketDataDiskCache]:
+        return self._disk_cache if self._disk_cache is not None else get_default_disk_cache()
+    
+    def _disk_lookup(self, query: str, max_results: int) -> Optional[Dict]:
+        """디스크 캐시에 저장된 최근 검색 결과 조회"""
+        disk = self._disk()
+        if disk is None:
+            return None
+        value, _ = disk.get(NEWS_NAMESPACE, json.dumps(self._key(query, max_results)), self.disk_ttl_seconds)
+        return value
+    
+    def cached_normalized(self, query: str, max_results: int = 5) -> Optional[Dict]:
+        """
+        정규화된 뉴스 결과 캐시 조회
+        
+        Returns:
+            DataNormalizer.normalize_news_data 결과 (없거나 만료되었으면 None)
+        """
+        value, state = self.normalized_cache.get(self._key(query, max_results))
+        return dict(value) if state == FRESH else None
+    
+    def store_normalized(self, query: str, max_results: int, normalized: Dict) -> None:
+        """
+        정규화에 성공한 뉴스 결과만 캐시에 저장
+        
+        원시 응답(_raw)과 실행별 핸들(_raw_ref)은 다른 실행에서 쓸 수 없으므로 빼고 저장합니다.
+        """
+        if normalized.get("status") == "success":
+            compact = {k: v for k, v in normalized.items() if k not in ("_raw", "_raw_ref")}
+            self.normalized_cache.set(self._key(query, max_results), compact)
+    
+    def cache_stats(self) -> Dict:
+        """정규화 결과 캐시, 네거티브 캐시, HTTP 연결 재사용 통계"""
+        return {
+            "normalized": self.normalized_cache.stats(),
+            "negative": self.negative_cache.stats(),
+            "http": self.http_pool.stats()
+        }
+    
+    def _key(self, query: str, max_results: int) -> tuple:
+        return news_cache_key(query, max_results, self.include_domains)
+    
+    def _store(self, query: str, max_results: int, result: Dict) -> Dict:
+        """성공한 검색 결과는 디스크 캐시에, 영구 실패는 네거티브 캐시에 저장"""
+        if result.get("status") != "success":
+            self.negative_cache.put(self._key(query, max_results), result)
+            return result
+        
+        disk = self._disk()
+        if disk is not None:
+            disk.set(NEWS_NAMESPACE, json.dumps(self._key(query, max_results)), result)
+        return result
+    
+    def _search(self, query: str, max_results: int, max_retries: int) -> Dict:
+        """Tavily 검색 (재시도 + 지수 백오프, 서킷 브레이커/재시도 예산 적용)"""
+        breaker = get_circuit_breaker(TAVILY)
+        error_result = None
         for attempt in range(max_retries):
+            if not allow_attempt(breaker, attempt):
+                return error_result or circuit_open_result(TAVILY)
+            
+            start_time = time.time()
             try:
-                start_time = time.time()
-                
-                headers = {
-                    "Authorization": f"Bearer {self.tavily_api_key}",
-                    "Content-Type": "application/json"
-                }
-                
-                payload = {
-                    "query": f"financial news {query}",
-                    "max_results": max_results,
-                    "include_domains": ["reuters.com", "bloomberg.com", "cnbc.com", "marketwatch.com"],
-                    "search_depth": "advanced"
-                }
-                
-                response = requests.post(
-                    "https://api.tavily.com/search",
-                    headers=headers,
-                    json=payload,
-                    timeout=10
+                response = self.http_pool.post(
+                    self.search_url,
+                    headers=self._headers(),
+                    json=self._payload(query, max_results)
                 )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    results = data.get("results", [])
-                    
-                    news_data = []
-                    for result in results:
-                        news_data.append({
-                            "title": result.get("title", "N/A"),
-                            "url": result.get("url", "N/A"),
-                            "snippet": result.get("content", "N/A"),
-                            "published_date": "N/A"  # Tavily에서는 제공하지 않음
-                        })
-                    
-                    latency_ms = (time.time() - start_time) * 1000
-                    logger.info({
-                        "tool": self.name,
-                        "query": query,
-                        "status": "success",
-                        "results_count": len(news_data),
-                        "attempt": attempt + 1,
-                        "latency_ms": latency_ms
-                    })
-                    
-                    return {
-                        "status": "success",
-                        "query": query,
-                        "results": news_data,
-                        "total_results": len(news_data)
-                    }
-                    
-                elif response.status_code >= 500:
-                    # 5xx 에러 - 재시도
-                    raise Exception(f"서버 에러: {response.status_code}")
-                else:
-                    # 4xx 에러 - 재시도하지 않음
-                    return {
-                        "status": "error",
-                        "error": f"클라이언트 에러: {response.status_code}",
-                        "retry_hint": "검색 쿼리를 수정해보세요."
-                    }
+                return self._record_outcome(breaker, self._handle_response(query, response, attempt, start_time))
                     
             except Exception as e:
-                latency_ms = (time.time() - start_time) * 1000
-                error_msg = f"뉴스 검색 실패: {str(e)}"
-                
-                logger.error({
-                    "tool": self.name,
-                    "query": query,
-                    "status": "error",
-                    "error": error_msg,
-                    "attempt": attempt + 1,
-                    "latency_ms": latency_ms
-                })
+                breaker.record_failure()
+                error_result = self._error_result(query, e, attempt, start_time)
+                if attempt == max_retries - 1:
+                    return error_result
                 
+                time.sleep(backoff_seconds(attempt))
+        
+        return self._max_retries_result()
+    
+    async def _asearch(self, query: str, max_results: int, max_retries: int) -> Dict:
+        """Tavily 비동기 검색 (재시도 + asyncio.sleep 백오프, 서킷 브레이커/재시도 예산 적용)"""
+        breaker = get_circuit_breaker(TAVILY)
+        error_result = None
+        for attempt in range(max_retries):
+            if not allow_attempt(breaker, attempt):
+                return error_result or circuit_open_result(TAVILY)
+            
+            start_time = time.time()
+            try:
+                response = await self.http_pool.apost(
+                    self.search_url,
+                    headers=self._headers(),
+                    json=self._payload(query, max_results)
+                )
+                return self._record_outcome(breaker, self._handle_response(query, response, attempt, start_time))
+            
+            except Exception as e:
+                breaker.record_failure()
+                error_result = self._error_result(query, e, attempt, start_time)
                 if attempt == max_retries - 1:
-                    return {
-                        "status": "error",
-                        "error": error_msg,
-                        "retry_hint": "네트워크 연결을 확인하거나 검색어를 수정해보세요."
-                    }
+                    return error_result
                 
-                time.sleep(0.5 * (2 ** attempt))
+                await asyncio.sleep(backoff_seconds(attempt))
+        
+        return self._max_retries_result()
+    
+    @staticmethod
+    def _record_outcome(breaker, result: Dict) -> Dict:
+        """응답 결과를 서킷 브레이커에 반영 (429 등 일시적 4xx 는 실패로 집계)"""
+        if result.get("status") == "error" and result.get("error_class") == TRANSIENT:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return result
+    
+    def _headers(self) -> Dict:
+        return {
+            "Authorization": f"Bearer {self.tavily_api_key}",
+            "Content-Type": "application/json"
+        }
+    
+    def _payload(self, query: str, max_results: int) -> Dict:
+        return {
+            "query": f"financial news {query}",
+            "max_results": max_results,
+            "include_domains": self.include_domains,
+            "search_depth": "advanced"
+        }
+    
+    def _handle_response(self, query: str, response, attempt: int, start_time: float) -> Dict:
+        """
+        HTTP 응답을 결과로 변환 (requests/httpx 응답 모두 지원)
         
+        5xx 는 재시도를 위해 예외를 발생시키고, 4xx 는 재시도하지 않고 에러를 반환합니다.
+        """
+        if response.status_code == 200:
+            data = response.json()
+            results = data.get("results", [])
+            
+            news_data = []
+            for result in results:
+                news_data.append({
+                    "title": result.get("title", "N/A"),
+                    "url": result.get("url", "N/A"),
+                    "snippet": result.get("content", "N/A"),
+                    "published_date": "N/A"  # Tavily에서는 제공하지 않음
+                })
+            
+            latency_ms = (time.time() - start_time) * 1000
+            logger.info({
+                "tool": self.name,
+                "query": query,
+                "status": "success",
+                "results_count": len(news_data),
+                "attempt": attempt + 1,
+                "latency_ms": latency_ms
+            })
+            
+            return {
+                "status": "success",
+                "query": query,
+                "results": news_data,
+                "total_results": len(news_data)
+            }
+            
+        elif response.status_code >= 500:
+            # 5xx 에러 - 재시도
+            raise Exception(f"서버 에러: {response.status_code}")
+        else:
+            # 4xx 에러 - 재시도하지 않음
+            return {
+                "status": "error",
+                "error": f"클라이언트 에러: {response.status_code}",
+                "retry_hint": "검색 쿼리를 수정해보세요.",
+                "error_class": classify_status(response.status_code)
+            }
+    
+    def _error_result(self, query: str, error: Exception, attempt: int, start_time: float) -> Dict:
+        """실패 로깅 후 에러 응답 생성"""
+        latency_ms = (time.time() - start_time) * 1000
+        error_msg = f"뉴스 검색 실패: {str(error)}"
+        error_class = classify_error(error)
+        
+        logger.error({
+            "tool": self.name,
+            "query": query,
+            "status": "error",
+            "error": error_msg,
+            "error_class": error_class,
+            "attempt": attempt + 1,
+            "latency_ms": latency_ms
+        })
+        
+        return {
+            "status": "error",
+            "error": error_msg,
+            "retry_hint": "네트워크 연결을 확인하거나 검색어를 수정해보세요.",
+            "error_class": error_class
+        }
+    
+    @staticmethod
+    def _missing_key_result() -> Dict:
+        return {
+            "status": "error",
+            "error": "Tavily API 키가 설정되지 않았습니다.",
+            "retry_hint": "API 키를 설정해주세요."
+        }
+    
+    @staticmethod
+    def _max_retries_result() -> Dict:
         return {
             "status": "error",
             "error": "최대 재시도 횟수 초과",
@@ -0,0 +1,182 @@
+"""
+오프라인 심볼 유니버스 인덱스
+Offline Symbol Universe Index
+"""
+import bisect
+import csv
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 티커 형식: 영문 대문자/숫자로 시작, 이후 . - ^ = 허용 (예: BRK.B, BF-B, ^GSPC, 005930.KS)
+SYMBOL_PATTERN = re.compile(r"^\^?[A-Z0-9][A-Z0-9.\-=]{0,14}$")
+
+# 상장 목록 파일에서 심볼/종목명을 찾을 때 사용하는 컬럼명 (NASDAQ Trader, 일반 CSV)
+_SYMBOL_COLUMNS = ("Symbol", "ACT Symbol", "symbol", "Ticker", "ticker")
+_NAME_COLUMNS = ("Security Name", "Name", "name", "Company", "company")
+
+
+def normalize_symbol(symbol: str) -> str:
+    return (symbol or "").strip().upper()
+
+
+def is_valid_symbol_format(symbol: str) -> bool:
+    """네트워크 없이 티커 형식만 검사"""
+    return bool(SYMBOL_PATTERN.match(normalize_symbol(symbol)))
+
+
+class SymbolUniverse:
+    """
+    정렬된 심볼 배열 기반 심볼 인덱스
+
+    - 포함 여부(contains): 이진 탐색 O(log n)
+    - 접두사 검색(suggest): 접두사의 삽입 위치부터 limit 개만 읽으므로 O(log n + k)
+    """
+
+    def __init__(self, entries: Optional[Iterable[Tuple[str, str]]] = None):
+        names: Dict[str, str] = {}
+        for symbol, name in entries or ():
+            symbol = normalize_symbol(symbol)
+            if is_valid_symbol_format(symbol):
+                names[symbol] = name or ""
+
+        self._symbols: List[str] = sorted(names)
+        self._names = names
+
+    @classmethod
+    def from_symbols(cls, symbols: Iterable[str]) -> "SymbolUniverse":
+        return cls((symbol, "") for symbol in symbols)
+
+    @classmethod
+    def load(cls, *paths: str) -> "SymbolUniverse":
+        """
+        상장 목록 파일에서 로드
+
+        지원 형식:
+            - 구분자(| 또는 ,)가 있는 헤더 파일 (NASDAQ Trader nasdaqlisted.txt/otherlisted.txt, CSV)
+            - 한 줄에 심볼 하나인 텍스트 파일
+
+        Args:
+            paths: 상장 목록 파일 경로들 (여러 거래소 목록을 합칠 수 있음)
+        """
+        entries: List[Tuple[str, str]] = []
+        for path in paths:
+            entries.extend(cls._read_listing(path))
+
+        universe = cls(entries)
+        logger.info({
+            "index": "symbol_universe",
+            "action": "load",
+            "files": len(paths),
+            "symbols": len(universe)
+        })
+        return universe
+
+    @staticmethod
+    def _read_listing(path: str) -> List[Tuple[str, str]]:
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            header = f.readline()
+            f.seek(0)
+
+            delimiter = "|" if "|" in header else "," if "," in header else None
+            if delimiter is None:
+                return [(line.strip(), "") for line in f if line.strip()]
+
+            reader = csv.DictReader(f, delimiter=delimiter)
+            fields = reader.fieldnames or []
+            symbol_column = next((c for c in _SYMBOL_COLUMNS if c in fields), None)
+            name_column = next((c for c in _NAME_COLUMNS if c in fields), None)
+            if symbol_column is None:
+                raise ValueError(f"상장 목록 파일에 심볼 컬럼이 없습니다: {path}")
+
+            entries = []
+            for row in reader:
+                # NASDAQ Trader 파일의 테스트 종목과 마지막 "File Creation Time" 줄 제외
+                if row.get("Test Issue") == "Y" or not row.get(symbol_column):
+                    continue
+                if row[symbol_column].startswith("File Creation Time"):
+                    continue
+                entries.append((row[symbol_column], row.get(name_column, "") if name_column else ""))
+            return entries
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        return self.contains(symbol)
+
+    def contains(self, symbol: str) -> bool:
+        symbol = normalize_symbol(symbol)
+        i = bisect.bisect_left(self._symbols, symbol)
+        return i < len(self._symbols) and self._symbols[i] == symbol
+
+    def name(self, symbol: str) -> Optional[str]:
+        return self._names.get(normalize_symbol(symbol))
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[Dict[str, str]]:
+        """
+        접두사로 시작하는 심볼 목록 (사전순)
+
+        Returns:
+            [{"symbol": ..., "name": ...}, ...]
+        """
+        prefix = normalize_symbol(prefix)
+        if not prefix:
+            return []
+
+        results = []
+        i = bisect.bisect_left(self._symbols, prefix)
+        while i < len(self._symbols) and len(results) < limit and self._symbols[i].startswith(prefix):
+            symbol = self._symbols[i]
+            results.append({"symbol": symbol, "name": self._names[symbol]})
+            i += 1
+        return results
+
+    def validate(self, symbol: str, suggestions: int = 5) -> Dict:
+        """
+        심볼 검증 (네트워크 호출 없음)
+
+        Returns:
+            Dict: {"symbol", "status": "success"} 또는 에러 정보 (가능하면 "suggestions" 포함)
+        """
+        symbol = normalize_symbol(symbol)
+        if not is_valid_symbol_format(symbol):
+            return {
+                "symbol": symbol,
+                "status": "error",
+                "error": f"주식 데이터 조회 실패: 올바른 심볼 형식이 아닙니다: '{symbol}'",
+                "retry_hint": "심볼을 다시 확인해주세요."
+            }
+
+        if not self._symbols or self.contains(symbol):
+            return {"symbol": symbol, "status": "success"}
+
+        # 접두사를 줄여 가며 가까운 심볼 제안
+        candidates = []
+        for length in range(len(symbol), 0, -1):
+            candidates = self.suggest(symbol[:length], limit=suggestions)
+            if candidates:
+                break
+
+        return {
+            "symbol": symbol,
+            "status": "error",
+            "error": f"주식 데이터 조회 실패: 심볼 '{symbol}'을(를) 상장 목록에서 찾을 수 없습니다.",
+            "retry_hint": "심볼을 다시 확인해주세요.",
+            "suggestions": [candidate["symbol"] for candidate in candidates]
+        }
+
+
+def load_symbol_universe(paths: str) -> Optional[SymbolUniverse]:
+    """
+    os.pathsep 로 구분된 경로 목록에서 유니버스 로드
+
+    존재하는 파일이 없으면 None (형식 검사만 수행)
+    """
+    existing = [path for path in (paths or "").split(os.pathsep) if path and os.path.exists(path)]
+    if not existing:
+        return None
+    return SymbolUniverse.load(*existing)
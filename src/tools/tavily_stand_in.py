@@ -0,0 +1,286 @@
+"""
+부하 테스트용 로컬 Tavily 호환 서버
+Local Tavily-Compatible Stand-In Server for Load Testing
+
+실제 Tavily API 대신 /search 엔드포인트를 흉내 내며, 합성 결과 또는 녹화된 결과를
+지연 분포, 에러율(5xx/4xx), 처리량 제한과 함께 돌려줍니다. 표준 라이브러리만 사용합니다.
+
+사용 예:
+    python src/tools/tavily_stand_in.py --port 8765 --latency-ms 120 --latency-distribution lognormal \\
+        --error-rate-5xx 0.02 --max-rps 50
+    TAVILY_SEARCH_URL=http://127.0.0.1:8765/search python src/main.py
+"""
+import argparse
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+FIXED = "fixed"
+UNIFORM = "uniform"
+LOGNORMAL = "lognormal"
+LATENCY_DISTRIBUTIONS = (FIXED, UNIFORM, LOGNORMAL)
+
+# stats() 백분위 계산에 쓰는 최근 응답 지연 수 (장시간 부하 테스트에서도 메모리/정렬 비용 고정)
+LATENCY_WINDOW = 10000
+
+_SYNTHETIC_DOMAINS = ("reuters.com", "bloomberg.com", "cnbc.com", "marketwatch.com")
+_SYNTHETIC_HEADLINES = (
+    "{subject} shares rise after strong quarterly results",
+    "{subject} stock falls as analysts cut targets",
+    "{subject} announces new product lineup",
+    "Investors weigh {subject} guidance ahead of earnings",
+    "{subject} beats revenue expectations, outlook steady",
+    "Regulators review {subject} acquisition plan",
+    "{subject} rallies on upgrade from major bank",
+    "{subject} misses profit estimates amid cost pressure",
+)
+
+
+class TavilyStandInServer:
+    """
+    Tavily /search 호환 로컬 HTTP 서버
+
+    - 지연: latency_ms 를 중앙값으로 하는 fixed / uniform(± latency_jitter_ms) / lognormal 분포
+    - 에러: 요청마다 error_rate_5xx 확률로 503, error_rate_4xx 확률로 400 응답
+    - 처리량: max_rps 를 넘는 요청은 토큰 버킷으로 걸러 429 응답 (0 이면 제한 없음)
+    - 결과: recorded_path 의 JSON({"쿼리": [결과, ...]} 또는 [결과, ...])을 우선 사용하고,
+      없으면 쿼리 해시로 결정되는 합성 결과를 만듭니다.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 latency_ms: float = 0.0, latency_jitter_ms: float = 0.0,
+                 latency_distribution: str = FIXED,
+                 error_rate_5xx: float = 0.0, error_rate_4xx: float = 0.0,
+                 max_rps: float = 0.0, recorded_path: Optional[str] = None,
+                 seed: Optional[int] = None, latency_window: int = LATENCY_WINDOW):
+        if latency_distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"지원하지 않는 지연 분포입니다: {latency_distribution}")
+
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.latency_distribution = latency_distribution
+        self.error_rate_5xx = error_rate_5xx
+        self.error_rate_4xx = error_rate_4xx
+        self.max_rps = max_rps
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = max_rps
+        self._refilled_at = time.monotonic()
+        self._status_counts: Dict[int, int] = {}
+        self._latencies: deque = deque(maxlen=latency_window)
+
+        self._recorded: Dict[str, List[Dict]] = {}
+        self._recorded_default: Optional[List[Dict]] = None
+        if recorded_path:
+            with open(recorded_path, "r", encoding="utf-8") as f:
+                recorded = json.load(f)
+            if isinstance(recorded, list):
+                self._recorded_default = recorded
+            else:
+                self._recorded = {k.lower(): v for k, v in recorded.items()}
+
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """FinancialNewsTool 의 search_url 로 넘길 주소"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/search"
+
+    def start(self) -> "TavilyStandInServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "TavilyStandInServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _sample_latency(self) -> float:
+        """이번 요청의 지연 (초)"""
+        with self._lock:
+            if self.latency_distribution == UNIFORM:
+                ms = self._random.uniform(self.latency_ms - self.latency_jitter_ms,
+                                          self.latency_ms + self.latency_jitter_ms)
+            elif self.latency_distribution == LOGNORMAL and self.latency_ms > 0:
+                # latency_ms 를 중앙값, jitter/latency 를 로그 표준편차로 사용 (긴 꼬리)
+                sigma = self.latency_jitter_ms / self.latency_ms if self.latency_jitter_ms else 0.5
+                ms = self._random.lognormvariate(math.log(self.latency_ms), sigma)
+            else:
+                ms = self.latency_ms
+        return max(ms, 0.0) / 1000.0
+
+    def _admit(self) -> bool:
+        """처리량 제한 토큰 버킷 (초당 max_rps 개 충전, 최대 max_rps 개 보관)"""
+        if self.max_rps <= 0:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.max_rps, self._tokens + (now - self._refilled_at) * self.max_rps)
+            self._refilled_at = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            return False
+
+    def _injected_error(self) -> Optional[int]:
+        with self._lock:
+            roll = self._random.random()
+        if roll < self.error_rate_5xx:
+            return 503
+        if roll < self.error_rate_5xx + self.error_rate_4xx:
+            return 400
+        return None
+
+    def _results(self, query: str, max_results: int) -> List[Dict]:
+        recorded = self._recorded.get(query.lower(), self._recorded_default)
+        if recorded is not None:
+            return recorded[:max_results]
+
+        # 같은 쿼리에는 항상 같은 결과 (캐시/중복 제거 동작을 재현 가능하게)
+        digest = hashlib.sha1(query.encode("utf-8")).hexdigest()
+        subject = query.replace("financial news", "").strip() or "Market"
+        start = int(digest[:8], 16)
+        results = []
+        for i in range(max_results):
+            n = start + i
+            slug = hashlib.sha1(f"{digest}:{i}".encode("utf-8")).hexdigest()[:12]
+            domain = _SYNTHETIC_DOMAINS[n % len(_SYNTHETIC_DOMAINS)]
+            results.append({
+                "title": _SYNTHETIC_HEADLINES[n % len(_SYNTHETIC_HEADLINES)].format(subject=subject),
+                "url": f"https://www.{domain}/markets/{slug}",
+                "content": f"Synthetic coverage of {subject} ({i + 1}/{max_results}).",
+                "score": round(1.0 - i / (max_results + 1), 3)
+            })
+        return results
+
+    def _record(self, status: int, elapsed: float) -> None:
+        with self._lock:
+            self._status_counts[status] = self._status_counts.get(status, 0) + 1
+            self._latencies.append(elapsed)
+
+    def stats(self) -> Dict:
+        """상태 코드별 응답 수와 서버 측 지연 백분위 (ms, 최근 latency_window 개 응답 기준)"""
+        with self._lock:
+            counts = dict(self._status_counts)
+            latencies = sorted(self._latencies)
+
+        def percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000, 2)
+
+        return {
+            "requests": sum(counts.values()),
+            "status_counts": counts,
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99)
+        }
+
+    def _handle(self, handler: BaseHTTPRequestHandler) -> None:
+        started = time.monotonic()
+        body = handler.rfile.read(int(handler.headers.get("Content-Length", 0) or 0))
+
+        if handler.path.split("?")[0].rstrip("/") != "/search":
+            status, payload = 404, {"detail": "Not Found"}
+        elif not self._admit():
+            status, payload = 429, {"detail": "Rate limit exceeded"}
+        else:
+            time.sleep(self._sample_latency())
+            status = self._injected_error()
+            if status == 503:
+                payload = {"detail": "Service temporarily unavailable"}
+            elif status == 400:
+                payload = {"detail": "Bad request"}
+            else:
+                try:
+                    request = json.loads(body or b"{}")
+                    query = str(request.get("query", ""))
+                    max_results = int(request.get("max_results", 5))
+                    status, payload = 200, {
+                        "query": query,
+                        "results": self._results(query, max_results),
+                        "response_time": round(time.monotonic() - started, 3)
+                    }
+                except (ValueError, TypeError):
+                    status, payload = 400, {"detail": "Invalid JSON body"}
+
+        data = json.dumps(payload).encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(data)))
+        handler.end_headers()
+        handler.wfile.write(data)
+        self._record(status, time.monotonic() - started)
+
+    def _handler_class(self):
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            # keep-alive 지원 (HTTPClientPool 의 연결 재사용 측정이 의미 있도록)
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                server._handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        return _Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="로컬 Tavily 호환 /search 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="지연 중앙값 (ms)")
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0,
+                        help="uniform 은 ± 폭, lognormal 은 퍼짐 정도 (ms)")
+    parser.add_argument("--latency-distribution", choices=LATENCY_DISTRIBUTIONS, default=FIXED)
+    parser.add_argument("--error-rate-5xx", type=float, default=0.0)
+    parser.add_argument("--error-rate-4xx", type=float, default=0.0)
+    parser.add_argument("--max-rps", type=float, default=0.0, help="초당 허용 요청 수 (0: 무제한)")
+    parser.add_argument("--recorded", default=None, help="녹화된 결과 JSON 파일")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = TavilyStandInServer(
+        host=args.host,
+        port=args.port,
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        latency_distribution=args.latency_distribution,
+        error_rate_5xx=args.error_rate_5xx,
+        error_rate_4xx=args.error_rate_4xx,
+        max_rps=args.max_rps,
+        recorded_path=args.recorded,
+        seed=args.seed
+    )
+    print(f"Tavily stand-in listening on {server.url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+        print(json.dumps(server.stats()))
+
+
+if __name__ == "__main__":
+    main()
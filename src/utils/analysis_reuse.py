@@ -0,0 +1,199 @@
+"""
+입력 데이터 지문 기반 분석 재사용
+Data-Fingerprint-Based Reuse of LLM Analysis Output
+
+가격이 조금만 움직여도 프롬프트가 달라져 정확 일치 LLM 캐시는 거의 맞지 않습니다.
+정규화된 입력을 양자화한 지문으로 비교해, 의미 있는 변화가 없으면 최근 LLM 결과를 재사용합니다.
+"""
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from .records import QuoteRecord
+
+ANALYSIS = "analysis"
+RECOMMENDATIONS = "recommendations"
+
+
+@dataclass(frozen=True)
+class ReuseTolerance:
+    """지문 비교 허용 범위"""
+    price_percent: float = 0.5      # 기준 가격 대비 변화율(%) 이내면 같은 가격으로 봄
+    position_points: float = 5.0    # 52주 범위 내 위치(0~100) 차이
+    pe_bucket: float = 5.0          # PER 구간 폭 (같은 구간이어야 함)
+    max_age_seconds: float = 900.0  # 재사용할 수 있는 결과의 최대 나이
+
+
+@dataclass(frozen=True, slots=True)
+class AnalysisFingerprint:
+    """분석 입력 지문: 정확히 같아야 하는 key 와 허용 범위로 비교하는 연속값"""
+    symbol: str
+    trend: str
+    pe_bucket: Optional[int]
+    news_urls: FrozenSet[str]
+    query_hash: str
+    price: Optional[float]
+    position_percent: Optional[float]
+
+    @property
+    def key(self) -> Tuple:
+        """같은 후보끼리 묶는 정확 일치 부분 (가격/위치는 matches 에서 비교)"""
+        news_hash = hashlib.sha1("\n".join(sorted(self.news_urls)).encode("utf-8")).hexdigest()
+        return (self.symbol, self.trend, self.pe_bucket, news_hash, self.query_hash)
+
+    def matches(self, other: "AnalysisFingerprint", tolerance: ReuseTolerance) -> bool:
+        if self.key != other.key:
+            return False
+        if not _within(self.price, other.price, abs(other.price or 0) * tolerance.price_percent / 100):
+            return False
+        return _within(self.position_percent, other.position_percent, tolerance.position_points)
+
+    def to_dict(self) -> Dict:
+        return {
+            "symbol": self.symbol,
+            "trend": self.trend,
+            "pe_bucket": self.pe_bucket,
+            "news_count": len(self.news_urls),
+            "price": self.price,
+            "position_percent": self.position_percent
+        }
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value) if math.isfinite(value) else None
+
+
+def _within(value: Optional[float], reference: Optional[float], allowed: float) -> bool:
+    if value is None or reference is None:
+        return value is None and reference is None
+    return abs(value - reference) <= allowed
+
+
+def _as_normalized(value: Any) -> Optional[Dict]:
+    if hasattr(value, "to_dict"):
+        value = value.to_dict()
+    return value if isinstance(value, dict) else None
+
+
+def fingerprint_inputs(stock_data: Any, news_data: Any, user_query: str = "",
+                       tolerance: Optional[ReuseTolerance] = None) -> Optional[AnalysisFingerprint]:
+    """
+    정규화된 입력의 지문 생성
+
+    Args:
+        stock_data: QuoteRecord (또는 normalize_stock_data 결과 dict)
+        news_data: NewsRecord (또는 summarize_news_items 결과 dict)
+        user_query: 사용자 질문 (프롬프트에 들어가므로 지문에 포함)
+
+    Returns:
+        AnalysisFingerprint, 시세가 없거나 실패 결과면 None (재사용하지 않음)
+    """
+    tolerance = tolerance or ReuseTolerance()
+    # 레코드는 dict 로 맞춰 비교 (src.utils / utils 처럼 다른 경로로 import 된 레코드도 허용)
+    stock = _as_normalized(stock_data)
+    if not stock or stock.get("status") != "success":
+        return None
+    stock_data = QuoteRecord.from_normalized(stock)
+    if not stock_data.symbol:
+        return None
+
+    news = _as_normalized(news_data)
+    items = news.get("news_items", []) if news else []
+    urls = frozenset(item.get("url") for item in items if item.get("url"))
+
+    pe_ratio = _number(stock_data.pe_ratio)
+    pe_bucket = int(pe_ratio // tolerance.pe_bucket) if pe_ratio is not None and tolerance.pe_bucket > 0 else None
+
+    return AnalysisFingerprint(
+        symbol=stock_data.symbol,
+        trend=stock_data.trend,
+        pe_bucket=pe_bucket,
+        news_urls=urls,
+        query_hash=hashlib.sha1((user_query or "").encode("utf-8")).hexdigest(),
+        price=_number(stock_data.current),
+        position_percent=_number(stock_data.position_percent)
+    )
+
+
+class AnalysisReuseCache:
+    """
+    최근 LLM 결과를 지문과 함께 보관하는 캐시
+
+    (종류, 지문 key) 마다 가장 최근 결과 하나를 LRU 로 보관하고,
+    lookup 시 max_age_seconds 이내이며 가격/위치가 허용 범위 안이면 결과와 나이(초)를 돌려줍니다.
+    LLM 대체(fallback) 결과는 호출자가 저장하지 않아야 합니다.
+    """
+
+    def __init__(self, tolerance: Optional[ReuseTolerance] = None, max_entries: int = 256):
+        self.tolerance = tolerance or ReuseTolerance()
+        self.max_entries = max_entries
+        # (kind, key) -> (지문, 결과, 생성 시각)
+        self._entries: "OrderedDict[Tuple, Tuple[AnalysisFingerprint, Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._reused = 0
+        self._misses = 0
+
+    def lookup(self, kind: str, fingerprint: Optional[AnalysisFingerprint]) -> Tuple[Optional[Any], Optional[float]]:
+        """
+        Returns:
+            (재사용할 결과, 나이(초)) - 맞는 결과가 없으면 (None, None)
+        """
+        if fingerprint is None:
+            return None, None
+        with self._lock:
+            entry = self._entries.get((kind, fingerprint.key))
+            age = time.time() - entry[2] if entry is not None else None
+            if entry is None or age > self.tolerance.max_age_seconds \
+                    or not fingerprint.matches(entry[0], self.tolerance):
+                self._misses += 1
+                return None, None
+            self._entries.move_to_end((kind, fingerprint.key))
+            self._reused += 1
+            return entry[1], age
+
+    def store(self, kind: str, fingerprint: Optional[AnalysisFingerprint], output: Any) -> None:
+        """정상 LLM 결과 저장 (같은 key 의 이전 결과는 대체)"""
+        if fingerprint is None:
+            return
+        with self._lock:
+            self._entries[(kind, fingerprint.key)] = (fingerprint, output, time.time())
+            self._entries.move_to_end((kind, fingerprint.key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self._reused + self._misses
+            return {
+                "entries": len(self._entries),
+                "reused": self._reused,
+                "misses": self._misses,
+                "reuse_ratio": self._reused / lookups if lookups else 0.0
+            }
+
+
+def reuse_marker(age_seconds: Optional[float]) -> Dict:
+    """상태의 reuse_info 항목 (재사용 여부와 나이)"""
+    if age_seconds is None:
+        return {"reused": False}
+    return {"reused": True, "age_seconds": round(age_seconds, 1)}
+
+
+# 기본 비활성화: main.setup_analysis_reuse 가 설정값으로 켬
+_default_reuse_cache: Optional[AnalysisReuseCache] = None
+
+
+def set_default_reuse_cache(cache: Optional[AnalysisReuseCache]) -> None:
+    """분석/추천 에이전트가 기본으로 사용할 재사용 캐시 지정 (None 이면 비활성화)"""
+    global _default_reuse_cache
+    _default_reuse_cache = cache
+
+
+def get_default_reuse_cache() -> Optional[AnalysisReuseCache]:
+    return _default_reuse_cache
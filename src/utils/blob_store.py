@@ -0,0 +1,171 @@
+"""
+실행(run) 단위 원시 응답 저장소 (내용 해시 참조)
+Per-Run Content-Addressed Blob Store for Raw Tool Payloads
+
+원시 도구 응답은 실행마다 한 번만 저장하고, 상태/tool_history/정규화 결과에는
+내용 해시 핸들만 남깁니다. 원시 데이터가 실제로 필요할 때 get() 으로 꺼냅니다.
+"""
+import hashlib
+import json
+import threading
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+HANDLE_PREFIX = "sha256:"
+
+# 실행이 끝난 뒤 남겨 둔(keep_raw_payloads) 저장소는 최근 것만 유지
+# (실행 중인 저장소는 닫히기 전까지 정리하지 않음)
+MAX_RETAINED_RUNS = 16
+
+
+def _canonical(payload: Any) -> bytes:
+    return json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+
+
+class BlobStore:
+    """
+    내용 해시로 주소를 매기는 원시 응답 저장소
+
+    같은 내용은 한 번만 저장되며(중복 put 은 핸들만 반환), 저장된 객체는 복사하지 않고
+    그대로 보관하므로 호출자는 put 이후 원본을 수정하지 않아야 합니다.
+    """
+
+    def __init__(self, run_id: Optional[str] = None):
+        self.run_id = run_id or uuid.uuid4().hex
+        self._lock = threading.Lock()
+        self._blobs: Dict[str, Any] = {}
+        self._sizes: Dict[str, int] = {}
+        self._puts = 0
+        self._reads = 0
+
+    def put(self, payload: Any) -> str:
+        """원시 응답 저장 후 핸들('sha256:...') 반환"""
+        data = _canonical(payload)
+        handle = HANDLE_PREFIX + hashlib.sha256(data).hexdigest()
+        with self._lock:
+            self._puts += 1
+            if handle not in self._blobs:
+                self._blobs[handle] = payload
+                self._sizes[handle] = len(data)
+        return handle
+
+    def get(self, handle: Optional[str]) -> Optional[Any]:
+        """핸들로 원시 응답 조회 (없으면 None)"""
+        if not handle:
+            return None
+        with self._lock:
+            payload = self._blobs.get(handle)
+            if payload is not None:
+                self._reads += 1
+            return payload
+
+    def __contains__(self, handle: str) -> bool:
+        with self._lock:
+            return handle in self._blobs
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._blobs)
+
+    def stats(self) -> Dict:
+        """저장된 blob 수, 중복 제거된 put 수, 저장 바이트, 조회 수"""
+        with self._lock:
+            return {
+                "run_id": self.run_id,
+                "blobs": len(self._blobs),
+                "deduplicated_puts": self._puts - len(self._blobs),
+                "bytes": sum(self._sizes.values()),
+                "reads": self._reads
+            }
+
+
+_open_stores: Dict[str, BlobStore] = {}
+_retained_stores: "OrderedDict[str, BlobStore]" = OrderedDict()
+_run_lock = threading.Lock()
+
+
+def open_run_store(run_id: Optional[str] = None) -> BlobStore:
+    """새 실행 저장소를 열어 등록 (close_run_store 로 닫을 때까지 유지)"""
+    store = BlobStore(run_id)
+    with _run_lock:
+        _open_stores[store.run_id] = store
+    return store
+
+
+def get_run_store(run_id: Optional[str]) -> Optional[BlobStore]:
+    """실행 중이거나 남겨 둔 저장소 반환 (없으면 None)"""
+    if not run_id:
+        return None
+    with _run_lock:
+        store = _open_stores.get(run_id)
+        return store if store is not None else _retained_stores.get(run_id)
+
+
+def close_run_store(run_id: Optional[str], retain: bool = False) -> Optional[Dict]:
+    """
+    실행 저장소를 닫고 마지막 통계를 반환 (없으면 None)
+
+    retain=True 이면 조회용으로 남겨 두며, 남겨 둔 저장소가 MAX_RETAINED_RUNS 를 넘으면
+    가장 오래된 것부터 정리합니다. 남겨 둔 저장소를 다시 닫으면(retain=False) 바로 정리됩니다.
+    """
+    if not run_id:
+        return None
+    with _run_lock:
+        store = _open_stores.pop(run_id, None)
+        if store is None:
+            store = _retained_stores.pop(run_id, None)
+        if store is not None and retain:
+            _retained_stores[run_id] = store
+            while len(_retained_stores) > MAX_RETAINED_RUNS:
+                _retained_stores.popitem(last=False)
+    if store is None:
+        return None
+    stats = store.stats()
+    logger.info({"store": "run_blobs", "action": "close", "retained": retain, **stats})
+    return stats
+
+
+@contextmanager
+def run_store_scope(state: Dict) -> Iterator[BlobStore]:
+    """
+    노드 실행 범위의 저장소
+
+    워크플로우 안(run_id 가 있음)에서는 그 저장소를 그대로 쓰고 닫지 않습니다.
+    워크플로우 밖에서 노드를 직접 호출해 run_id 가 없으면 새 저장소를 열어 state["run_id"] 를 설정하고,
+    범위가 끝나면 조회용으로 남겨 두며 닫습니다 (최근 MAX_RETAINED_RUNS 개까지만 유지).
+    """
+    if state.get("run_id"):
+        yield ensure_run_store(state)
+        return
+
+    store = open_run_store()
+    state["run_id"] = store.run_id
+    try:
+        yield store
+    finally:
+        close_run_store(store.run_id, retain=True)
+
+
+def ensure_run_store(state: Dict) -> BlobStore:
+    """
+    상태의 run_id 에 해당하는 저장소 반환
+
+    저장소를 암묵적으로 만들지 않습니다. 노드는 run_store_scope 안에서 호출합니다.
+
+    Raises:
+        KeyError: run_id 가 없거나, 열린(또는 남겨 둔) 저장소가 없는 경우
+            (빈 저장소를 새로 만들면 이미 기록된 핸들이 조회되지 않으므로)
+    """
+    run_id = state.get("run_id")
+    if not run_id:
+        raise KeyError("상태에 run_id 가 없습니다 (run_store_scope 또는 워크플로우 안에서 호출하세요)")
+
+    store = get_run_store(run_id)
+    if store is None:
+        raise KeyError(f"실행 저장소를 찾을 수 없습니다 (닫혔거나 정리됨): {run_id}")
+    return store
@@ -39,6 +39,38 @@ class Config:
     # 도구 설정
     DEFAULT_MAX_RETRIES = int(os.getenv("DEFAULT_MAX_RETRIES", "3"))
     DEFAULT_NEWS_RESULTS = int(os.getenv("DEFAULT_NEWS_RESULTS", "5"))
+    # 리서치 단계의 뉴스 검색 쿼리 수 (1: 티커만, 2: + 회사명, 3: + 실적 / 쿼리마다 Tavily 호출 1회)
+    NEWS_QUERY_FANOUT = int(os.getenv("NEWS_QUERY_FANOUT", "1"))
+    
+    # HTTP 연결 풀 설정 (프로세스 전체에서 공유)
+    HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "10"))
+    HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "3.05"))
+    HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "10"))
+    # Gemini 클라이언트 동시 요청 수 (모든 에이전트/워크플로우가 공유)
+    LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+    # LLM 응답 캐시 (같은 프롬프트/모델/설정의 정상 응답 재사용, TTL 0 이면 비활성화)
+    LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", "900"))
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "256"))
+    LLM_CACHE_DISK = os.getenv("LLM_CACHE_DISK", "false").lower() == "true"
+    # 입력 지문이 같으면 최근 분석/추천 재사용 (MAX_AGE 0 이면 비활성화)
+    ANALYSIS_REUSE_MAX_AGE = float(os.getenv("ANALYSIS_REUSE_MAX_AGE", "900"))
+    ANALYSIS_REUSE_PRICE_PERCENT = float(os.getenv("ANALYSIS_REUSE_PRICE_PERCENT", "0.5"))
+    ANALYSIS_REUSE_POSITION_POINTS = float(os.getenv("ANALYSIS_REUSE_POSITION_POINTS", "5"))
+    ANALYSIS_REUSE_PE_BUCKET = float(os.getenv("ANALYSIS_REUSE_PE_BUCKET", "5"))
+    
+    # 뉴스 검색 엔드포인트 (비우면 실제 Tavily, 부하 테스트 시 로컬 호환 서버 주소)
+    TAVILY_SEARCH_URL = os.getenv("TAVILY_SEARCH_URL", "")
+    
+    # 디스크 캐시/저장소 경로 (기본 비활성화, 경로를 지정해야 사용 - 예시는 .env.example)
+    MARKET_CACHE_PATH = os.getenv("MARKET_CACHE_PATH", "")
+    OHLCV_STORE_DIR = os.getenv("OHLCV_STORE_DIR", "")
+    NEWS_ARCHIVE_DIR = os.getenv("NEWS_ARCHIVE_DIR", "")
+    
+    # 상장 목록 파일 (os.pathsep 로 여러 개 지정, 없으면 심볼 형식 검사만 수행)
+    SYMBOL_UNIVERSE_PATH = os.getenv("SYMBOL_UNIVERSE_PATH", "data/nasdaqlisted.txt")
+    
+    # 뉴스 감성 어휘 파일 ('단어<TAB>가중치', 비우면 내장 어휘 사용)
+    SENTIMENT_LEXICON_PATH = os.getenv("SENTIMENT_LEXICON_PATH", "")
     
     @classmethod
     def validate_config(cls) -> bool:
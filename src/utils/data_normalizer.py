@@ -6,19 +6,60 @@ import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
+import numpy as np
+
+from .indicators import summarize_indicators
+from .sentiment import NEGATIVE, POSITIVE, get_default_sentiment_scorer
+from .blob_store import BlobStore
+
 logger = logging.getLogger(__name__)
 
 
+def _raw_field(raw_data: Any, blob_store: Optional[BlobStore]) -> Dict:
+    """원시 응답 필드: 저장소가 있으면 내용 해시 핸들(_raw_ref), 없으면 원시 응답(_raw) 그대로"""
+    if blob_store is None:
+        return {"_raw": raw_data}
+    return {"_raw_ref": blob_store.put(raw_data) if raw_data is not None else None}
+
+
+def _format_volume(volume: Any) -> str:
+    """거래량 표시 문자열 (숫자가 아니거나 0 이면 "N/A", 시세 계층은 "N/A" 문자열일 수 있음)"""
+    if isinstance(volume, (int, float)) and volume:
+        return f"{volume:,}"
+    return "N/A"
+
+
+def _numeric_column(values: List[Any]):
+    """
+    값 목록 → (float64 배열, 숫자 여부 마스크)
+
+    스칼라 경로의 isinstance(v, (int, float)) 판정과 같게 bool 도 숫자로 보며,
+    숫자가 아닌 자리는 NaN 으로 채웁니다.
+    """
+    mask = np.fromiter((isinstance(v, (int, float)) for v in values), dtype=bool, count=len(values))
+    column = np.fromiter(
+        (float(v) if ok else np.nan for v, ok in zip(values, mask)),
+        dtype=np.float64,
+        count=len(values)
+    )
+    return column, mask
+
+
 class DataNormalizer:
     """툴 결과를 요약하고 정규화하는 클래스"""
     
     @staticmethod
-    def normalize_stock_data(raw_data: Dict) -> Dict:
+    def normalize_stock_data(raw_data: Dict, history: Optional[Dict] = None,
+                             technical_summary: Optional[Dict] = None,
+                             blob_store: Optional[BlobStore] = None) -> Dict:
         """
         주식 데이터를 정규화하고 요약
         
         Args:
             raw_data: yfinance에서 가져온 원시 데이터
+            history: 과거 OHLCV 컬럼 (있으면 기술적 지표 요약 추가)
+            technical_summary: 미리 계산된 지표 요약 (증분 계산 결과, history 보다 우선)
+            blob_store: 실행 저장소 (있으면 원시 데이터 대신 핸들 _raw_ref 를 기록)
             
         Returns:
             정규화된 주식 데이터
@@ -36,8 +77,11 @@ class DataNormalizer:
             change = raw_data.get("change", 0)
             change_percent = raw_data.get("change_percent", 0)
             
-            # 추세 판단
-            if change > 0:
+            # 추세 판단 (전일 종가가 없으면 변화량이 "N/A")
+            if not isinstance(change, (int, float)):
+                trend = "알 수 없음"
+                trend_emoji = "❔"
+            elif change > 0:
                 trend = "상승"
                 trend_emoji = "📈"
             elif change < 0:
@@ -63,7 +107,9 @@ class DataNormalizer:
             high_52w = raw_data.get("52w_high")
             low_52w = raw_data.get("52w_low")
             
-            if high_52w and low_52w and current_price:
+            # 펀더멘털 조회 실패 시 "N/A" 문자열일 수 있음
+            if all(isinstance(v, (int, float)) and v for v in (high_52w, low_52w, current_price)) \
+                    and high_52w != low_52w:
                 range_position = ((current_price - low_52w) / (high_52w - low_52w)) * 100
                 
                 if range_position > 80:
@@ -101,7 +147,7 @@ class DataNormalizer:
                 # 거래 정보 (요약)
                 "trading_summary": {
                     "volume": raw_data.get("volume"),
-                    "volume_formatted": f"{raw_data.get('volume', 0):,}" if raw_data.get('volume') else "N/A"
+                    "volume_formatted": _format_volume(raw_data.get("volume"))
                 },
                 
                 # 52주 범위 (요약)
@@ -112,8 +158,12 @@ class DataNormalizer:
                     "position_description": position_desc
                 },
                 
+                # 기술적 지표 (과거 시세 기반, 없으면 None)
+                "technical_summary": technical_summary if technical_summary is not None
+                else (summarize_indicators(history) if history else None),
+                
                 # 원시 데이터 (참고용)
-                "_raw": raw_data
+                **_raw_field(raw_data, blob_store)
             }
             
             logger.info({
@@ -140,12 +190,131 @@ class DataNormalizer:
             }
     
     @staticmethod
-    def normalize_news_data(raw_data: Dict) -> Dict:
+    def normalize_stock_batch(raw_batch: List[Dict],
+                              technical_summaries: Optional[Dict[str, Dict]] = None,
+                              blob_store: Optional[BlobStore] = None) -> List[Dict]:
+        """
+        여러 종목의 주식 데이터를 한 번에 정규화
+        
+        추세, PER 평가, 52주 범위 위치를 NumPy 배열 연산(np.select)으로 계산하며,
+        결과는 종목마다 normalize_stock_data 와 같은 레코드입니다 (입력 순서 유지).
+        
+        Args:
+            raw_batch: StockDataTool.run 결과 목록
+            technical_summaries: 심볼별 미리 계산된 지표 요약
+            blob_store: 실행 저장소 (있으면 원시 데이터 대신 핸들 _raw_ref 를 기록)
+            
+        Returns:
+            정규화된 주식 데이터 목록
+        """
+        technical_summaries = technical_summaries or {}
+        rows = [raw for raw in raw_batch if isinstance(raw, dict) and raw.get("status") == "success"]
+        
+        price, price_ok = _numeric_column([raw.get("current_price", 0) for raw in rows])
+        change, change_ok = _numeric_column([raw.get("change", 0) for raw in rows])
+        pe, pe_ok = _numeric_column([raw.get("pe_ratio", "N/A") for raw in rows])
+        high, high_ok = _numeric_column([raw.get("52w_high") for raw in rows])
+        low, low_ok = _numeric_column([raw.get("52w_low") for raw in rows])
+        
+        # 추세 (NaN 변화량은 스칼라 경로처럼 보합)
+        trend_index = np.select(
+            [~change_ok, change > 0, change < 0],
+            [0, 1, 2],
+            default=3
+        )
+        
+        # PER 평가
+        pe_index = np.select(
+            [~pe_ok, pe < 15, pe > 25],
+            [0, 1, 2],
+            default=3
+        )
+        
+        # 52주 범위 위치 (0/숫자 아님/고가=저가인 종목은 0 나눗셈 없이 제외)
+        has_range = (price_ok & high_ok & low_ok & (price != 0) & (high != 0) & (low != 0)
+                     & (high != low))
+        range_position = np.divide(
+            price - low, high - low,
+            out=np.full(len(rows), np.nan),
+            where=has_range
+        ) * 100
+        position_index = np.select(
+            [~has_range, range_position > 80, range_position < 20],
+            [0, 1, 2],
+            default=3
+        )
+        
+        trends = (("알 수 없음", "❔"), ("상승", "📈"), ("하락", "📉"), ("보합", "➡️"))
+        pe_evaluations = ("평가불가", "저평가", "고평가", "적정")
+        positions = ("알 수 없음", "고점권", "저점권", "중간권")
+        
+        normalized_rows = []
+        timestamp = datetime.now().isoformat()
+        for i, raw in enumerate(rows):
+            try:
+                trend, trend_emoji = trends[trend_index[i]]
+                position = float(range_position[i]) if has_range[i] else None
+                volume = raw.get("volume")
+                normalized_rows.append({
+                    "status": "success",
+                    "symbol": raw.get("symbol"),
+                    "timestamp": timestamp,
+                    "price_summary": {
+                        "current": raw.get("current_price", 0),
+                        "change": raw.get("change", 0),
+                        "change_percent": raw.get("change_percent", 0),
+                        "trend": trend,
+                        "trend_emoji": trend_emoji
+                    },
+                    "valuation_summary": {
+                        "pe_ratio": raw.get("pe_ratio", "N/A"),
+                        "pe_evaluation": pe_evaluations[pe_index[i]],
+                        "market_cap": raw.get("market_cap")
+                    },
+                    "trading_summary": {
+                        "volume": volume,
+                        "volume_formatted": _format_volume(volume)
+                    },
+                    "range_summary": {
+                        "high_52w": raw.get("52w_high"),
+                        "low_52w": raw.get("52w_low"),
+                        "position_percent": round(position, 1) if position else None,
+                        "position_description": positions[position_index[i]]
+                    },
+                    "technical_summary": technical_summaries.get(raw.get("symbol")),
+                    **_raw_field(raw, blob_store)
+                })
+            except Exception:
+                # 형식이 이상한 레코드는 스칼라 경로로 처리해 같은 에러 응답을 만듦
+                normalized_rows.append(DataNormalizer.normalize_stock_data(
+                    raw, technical_summary=technical_summaries.get(raw.get("symbol")), blob_store=blob_store
+                ))
+        
+        # 실패한 조회는 입력 위치 그대로 에러 레코드로 채움
+        results, normalized_iter = [], iter(normalized_rows)
+        for raw in raw_batch:
+            if isinstance(raw, dict) and raw.get("status") == "success":
+                results.append(next(normalized_iter))
+            else:
+                results.append(DataNormalizer.normalize_stock_data(raw if isinstance(raw, dict) else {}))
+        
+        logger.info({
+            "normalizer": "stock_batch",
+            "symbols": len(raw_batch),
+            "normalized": len(rows),
+            "errors": len(raw_batch) - len(rows)
+        })
+        
+        return results
+    
+    @staticmethod
+    def normalize_news_data(raw_data: Dict, blob_store: Optional[BlobStore] = None) -> Dict:
         """
         뉴스 데이터를 정규화하고 요약
         
         Args:
             raw_data: Tavily에서 가져온 원시 뉴스 데이터
+            blob_store: 실행 저장소 (있으면 원시 데이터 대신 핸들 _raw_ref 를 기록)
             
         Returns:
             정규화된 뉴스 데이터
@@ -161,35 +330,25 @@ class DataNormalizer:
             results = raw_data.get("results", [])
             
             # 뉴스 요약
-            news_summary = []
-            sentiment_keywords = {
-                "positive": ["상승", "증가", "성장", "호조", "긍정", "strong", "rise", "gain"],
-                "negative": ["하락", "감소", "우려", "부진", "약세", "weak", "fall", "drop"]
-            }
+            articles = results[:10]  # 최대 10개만 처리
             
-            sentiment_counts = {"positive": 0, "negative": 0, "neutral": 0}
+            # 감성 분석 (컴파일된 가중치 어휘, 기사 전체를 한 번에 처리)
+            labels = get_default_sentiment_scorer().label_many(
+                news.get("title", "") + " " + news.get("snippet", "") for news in articles
+            )
             
-            for news in results[:10]:  # 최대 10개만 처리
+            news_summary = []
+            for news, sentiment in zip(articles, labels):
                 title = news.get("title", "")
                 snippet = news.get("snippet", "")
                 
-                # 감성 분석 (간단한 키워드 기반)
-                text = (title + " " + snippet).lower()
-                pos_count = sum(1 for word in sentiment_keywords["positive"] if word in text)
-                neg_count = sum(1 for word in sentiment_keywords["negative"] if word in text)
-                
-                if pos_count > neg_count:
-                    sentiment = "positive"
+                if sentiment == POSITIVE:
                     sentiment_emoji = "✅"
-                elif neg_count > pos_count:
-                    sentiment = "negative"
+                elif sentiment == NEGATIVE:
                     sentiment_emoji = "⚠️"
                 else:
-                    sentiment = "neutral"
                     sentiment_emoji = "ℹ️"
                 
-                sentiment_counts[sentiment] += 1
-                
                 news_summary.append({
                     "title": title[:100],  # 제목 100자 제한
                     "snippet": snippet[:200],  # 요약 200자 제한
@@ -198,36 +357,11 @@ class DataNormalizer:
                     "sentiment_emoji": sentiment_emoji
                 })
             
-            # 전체 감성 판단
-            if sentiment_counts["positive"] > sentiment_counts["negative"]:
-                overall_sentiment = "긍정적"
-                overall_emoji = "📈"
-            elif sentiment_counts["negative"] > sentiment_counts["positive"]:
-                overall_sentiment = "부정적"
-                overall_emoji = "📉"
-            else:
-                overall_sentiment = "중립적"
-                overall_emoji = "➡️"
-            
-            normalized = {
-                "status": "success",
-                "timestamp": datetime.now().isoformat(),
-                
-                # 뉴스 개요
-                "news_overview": {
-                    "total_count": len(results),
-                    "processed_count": len(news_summary),
-                    "overall_sentiment": overall_sentiment,
-                    "overall_emoji": overall_emoji,
-                    "sentiment_breakdown": sentiment_counts
-                },
-                
-                # 요약된 뉴스 목록
-                "news_items": news_summary,
-                
-                # 원시 데이터 (참고용)
-                "_raw": raw_data
-            }
+            normalized = DataNormalizer.summarize_news_items(
+                news_summary, raw_data, total_count=len(results), blob_store=blob_store
+            )
+            sentiment_counts = normalized["news_overview"]["sentiment_breakdown"]
+            overall_sentiment = normalized["news_overview"]["overall_sentiment"]
             
             logger.info({
                 "normalizer": "news_data",
@@ -252,12 +386,67 @@ class DataNormalizer:
             }
     
     @staticmethod
-    def normalize_calculation_result(raw_data: Dict) -> Dict:
+    def summarize_news_items(news_items: List[Dict], raw_data: Optional[Dict] = None,
+                             total_count: Optional[int] = None,
+                             blob_store: Optional[BlobStore] = None) -> Dict:
+        """
+        감성 점수가 매겨진 뉴스 항목들로 정규화 결과 생성
+        
+        normalize_news_data 의 news_items 형태(이미 점수가 매겨진 항목)를 받으므로
+        뉴스 아카이브에 저장된 항목을 다시 점수 매기지 않고 요약할 수 있습니다.
+        
+        Args:
+            news_items: title/snippet/url/sentiment/sentiment_emoji 를 가진 항목 목록
+            raw_data: 원시 데이터 (참고용)
+            total_count: 전체 검색 결과 수 (기본값: 항목 수)
+            blob_store: 실행 저장소 (있으면 원시 데이터 대신 핸들 _raw_ref 를 기록)
+            
+        Returns:
+            normalize_news_data 와 같은 형태의 정규화된 뉴스 데이터
+        """
+        sentiment_counts = {"positive": 0, "negative": 0, "neutral": 0}
+        for item in news_items:
+            sentiment_counts[item.get("sentiment", "neutral")] += 1
+        
+        # 전체 감성 판단
+        if sentiment_counts["positive"] > sentiment_counts["negative"]:
+            overall_sentiment = "긍정적"
+            overall_emoji = "📈"
+        elif sentiment_counts["negative"] > sentiment_counts["positive"]:
+            overall_sentiment = "부정적"
+            overall_emoji = "📉"
+        else:
+            overall_sentiment = "중립적"
+            overall_emoji = "➡️"
+        
+        return {
+            "status": "success",
+            "timestamp": datetime.now().isoformat(),
+            
+            # 뉴스 개요
+            "news_overview": {
+                "total_count": total_count if total_count is not None else len(news_items),
+                "processed_count": len(news_items),
+                "overall_sentiment": overall_sentiment,
+                "overall_emoji": overall_emoji,
+                "sentiment_breakdown": sentiment_counts
+            },
+            
+            # 요약된 뉴스 목록
+            "news_items": news_items,
+            
+            # 원시 데이터 (참고용)
+            **_raw_field(raw_data, blob_store)
+        }
+    
+    @staticmethod
+    def normalize_calculation_result(raw_data: Dict, blob_store: Optional[BlobStore] = None) -> Dict:
         """
         계산 결과를 정규화
         
         Args:
             raw_data: 계산기 툴의 원시 결과
+            blob_store: 실행 저장소 (있으면 원시 데이터 대신 핸들 _raw_ref 를 기록)
             
         Returns:
             정규화된 계산 결과
@@ -288,7 +477,7 @@ class DataNormalizer:
                     "result": result,
                     "formatted_result": formatted_result
                 },
-                "_raw": raw_data
+                **_raw_field(raw_data, blob_store)
             }
             
             logger.info({
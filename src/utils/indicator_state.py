@@ -0,0 +1,257 @@
+"""
+증분 (스트리밍) 기술적 지표 상태
+Incremental Streaming Indicator State
+
+새 봉 하나당 O(1) 로 지표를 갱신하는 상태 객체들입니다.
+indicators.py 의 일괄 계산과 같은 정의(시드 방식, 표준편차 ddof)를 사용하므로
+같은 봉 시퀀스를 넣으면 같은 결과를 냅니다.
+모든 상태는 to_dict()/from_dict() 로 JSON 체크포인트가 가능합니다.
+"""
+import copy
+import math
+from collections import deque
+from typing import Dict, Optional
+import logging
+
+from .indicators import TRADING_DAYS_PER_YEAR
+
+logger = logging.getLogger(__name__)
+
+
+class RollingWindow:
+    """고정 길이 윈도우의 합/제곱합 (평균, 표준편차)"""
+
+    def __init__(self, window: int):
+        self.window = window
+        self.values = deque()
+        self.total = 0.0
+        self.total_sq = 0.0
+        self._updates = 0
+
+    def update(self, value: float) -> None:
+        self.values.append(value)
+        self.total += value
+        self.total_sq += value * value
+        if len(self.values) > self.window:
+            old = self.values.popleft()
+            self.total -= old
+            self.total_sq -= old * old
+
+        # 누적 부동소수점 오차 방지: window 번마다 합계를 다시 계산 (분할 상환 O(1))
+        self._updates += 1
+        if self._updates >= self.window:
+            self._updates = 0
+            self.total = math.fsum(self.values)
+            self.total_sq = math.fsum(v * v for v in self.values)
+
+    @property
+    def ready(self) -> bool:
+        return len(self.values) == self.window
+
+    def mean(self) -> Optional[float]:
+        return self.total / self.window if self.ready else None
+
+    def std(self, ddof: int = 0) -> Optional[float]:
+        if not self.ready:
+            return None
+        mean = self.total / self.window
+        variance = (self.total_sq - self.window * mean * mean) / (self.window - ddof)
+        return math.sqrt(max(variance, 0.0))
+
+    def to_dict(self) -> Dict:
+        return {"window": self.window, "values": list(self.values)}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "RollingWindow":
+        state = cls(data["window"])
+        for value in data["values"]:
+            state.update(value)
+        return state
+
+
+class SmoothedAverage:
+    """
+    지수 평활 평균
+
+    첫 period 개 값의 단순 평균으로 시드한 뒤 value = alpha * x + (1 - alpha) * value.
+    EMA 는 alpha = 2 / (period + 1), Wilder 평활은 alpha = 1 / period 입니다.
+    """
+
+    def __init__(self, period: int, alpha: float):
+        self.period = period
+        self.alpha = alpha
+        self.value: Optional[float] = None
+        self._seed = []
+
+    @classmethod
+    def ema(cls, span: int) -> "SmoothedAverage":
+        return cls(span, 2.0 / (span + 1))
+
+    @classmethod
+    def wilder(cls, period: int) -> "SmoothedAverage":
+        return cls(period, 1.0 / period)
+
+    def update(self, x: float) -> Optional[float]:
+        if self.value is None:
+            self._seed.append(x)
+            if len(self._seed) == self.period:
+                self.value = sum(self._seed) / self.period
+                self._seed = []
+        else:
+            self.value = self.alpha * x + (1 - self.alpha) * self.value
+        return self.value
+
+    def to_dict(self) -> Dict:
+        return {"period": self.period, "alpha": self.alpha, "value": self.value, "seed": list(self._seed)}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SmoothedAverage":
+        state = cls(data["period"], data["alpha"])
+        state.value = data["value"]
+        state._seed = list(data["seed"])
+        return state
+
+
+class IndicatorState:
+    """
+    심볼 하나의 전체 지표 상태
+
+    update() 로 봉을 하나씩 넣으며, 이미 반영한 timestamp 이하의 봉은 무시합니다.
+    snapshot() 은 indicators.summarize_indicators 와 같은 형태의 요약을 반환합니다.
+    """
+
+    def __init__(self):
+        self.bars = 0
+        self.last_timestamp: Optional[int] = None
+        self.prev_close: Optional[float] = None
+
+        self.sma_20 = RollingWindow(20)
+        self.sma_50 = RollingWindow(50)
+        self.ema_12 = SmoothedAverage.ema(12)
+        self.ema_26 = SmoothedAverage.ema(26)
+        self.macd_signal = SmoothedAverage.ema(9)
+        self.rsi_gain = SmoothedAverage.wilder(14)
+        self.rsi_loss = SmoothedAverage.wilder(14)
+        self.atr_14 = SmoothedAverage.wilder(14)
+        self.returns_20 = RollingWindow(20)
+
+        self._macd: Optional[float] = None
+
+    def update(self, timestamp: int, high: float, low: float, close: float) -> bool:
+        """
+        봉 하나 반영
+
+        Returns:
+            bool: 반영 여부 (이미 반영한 봉이면 False)
+        """
+        if self.last_timestamp is not None and timestamp <= self.last_timestamp:
+            return False
+
+        self.sma_20.update(close)
+        self.sma_50.update(close)
+        fast = self.ema_12.update(close)
+        slow = self.ema_26.update(close)
+        if fast is not None and slow is not None:
+            self._macd = fast - slow
+            self.macd_signal.update(self._macd)
+
+        if self.prev_close is not None:
+            delta = close - self.prev_close
+            self.rsi_gain.update(max(delta, 0.0))
+            self.rsi_loss.update(max(-delta, 0.0))
+
+            true_range = max(high - low, abs(high - self.prev_close), abs(low - self.prev_close))
+            self.atr_14.update(true_range)
+
+            if self.prev_close > 0 and close > 0:
+                self.returns_20.update(math.log(close / self.prev_close))
+
+        self.prev_close = close
+        self.last_timestamp = int(timestamp)
+        self.bars += 1
+        return True
+
+    def update_many(self, timestamps, highs, lows, closes) -> int:
+        """여러 봉 반영, 새로 반영된 봉 수 반환"""
+        added = 0
+        for ts, high, low, close in zip(timestamps, highs, lows, closes):
+            added += self.update(int(ts), float(high), float(low), float(close))
+        return added
+
+    def preview(self, timestamp: int, high: float, low: float, close: float) -> Dict:
+        """
+        확정되지 않은 (진행 중인) 봉을 반영한 요약
+
+        상태 자체는 바꾸지 않으므로 같은 봉이 갱신되어도 다시 호출할 수 있습니다.
+        """
+        state = copy.deepcopy(self)
+        state.update(timestamp, high, low, close)
+        return state.snapshot()
+
+    def _rsi(self) -> Optional[float]:
+        gain, loss = self.rsi_gain.value, self.rsi_loss.value
+        if gain is None or loss is None:
+            return None
+        if loss == 0:
+            return 50.0 if gain == 0 else 100.0
+        return 100.0 - 100.0 / (1.0 + gain / loss)
+
+    def snapshot(self) -> Dict:
+        """최신 지표 요약 (계산 불가 항목은 None)"""
+        middle = self.sma_20.mean()
+        std = self.sma_20.std(ddof=0)
+        signal = self.macd_signal.value
+        volatility = self.returns_20.std(ddof=1)
+
+        values = {
+            "sma_20": middle,
+            "sma_50": self.sma_50.mean(),
+            "ema_12": self.ema_12.value,
+            "ema_26": self.ema_26.value,
+            "rsi_14": self._rsi(),
+            "macd": self._macd,
+            "macd_signal": signal,
+            "macd_histogram": self._macd - signal if signal is not None else None,
+            "bb_upper": middle + 2.0 * std if middle is not None else None,
+            "bb_middle": middle,
+            "bb_lower": middle - 2.0 * std if middle is not None else None,
+            "atr_14": self.atr_14.value,
+            "volatility_20d": volatility * math.sqrt(TRADING_DAYS_PER_YEAR) if volatility is not None else None,
+        }
+
+        summary = {"bars": self.bars}
+        for name, value in values.items():
+            summary[name] = None if value is None else round(value, 4)
+        return summary
+
+    def to_dict(self) -> Dict:
+        """JSON 직렬화 가능한 체크포인트"""
+        return {
+            "bars": self.bars,
+            "last_timestamp": self.last_timestamp,
+            "prev_close": self.prev_close,
+            "macd": self._macd,
+            "sma_20": self.sma_20.to_dict(),
+            "sma_50": self.sma_50.to_dict(),
+            "ema_12": self.ema_12.to_dict(),
+            "ema_26": self.ema_26.to_dict(),
+            "macd_signal": self.macd_signal.to_dict(),
+            "rsi_gain": self.rsi_gain.to_dict(),
+            "rsi_loss": self.rsi_loss.to_dict(),
+            "atr_14": self.atr_14.to_dict(),
+            "returns_20": self.returns_20.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "IndicatorState":
+        """체크포인트에서 복원"""
+        state = cls()
+        state.bars = data["bars"]
+        state.last_timestamp = data["last_timestamp"]
+        state.prev_close = data["prev_close"]
+        state._macd = data["macd"]
+        for name in ("sma_20", "sma_50", "returns_20"):
+            setattr(state, name, RollingWindow.from_dict(data[name]))
+        for name in ("ema_12", "ema_26", "macd_signal", "rsi_gain", "rsi_loss", "atr_14"):
+            setattr(state, name, SmoothedAverage.from_dict(data[name]))
+        return state
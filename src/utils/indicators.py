@@ -0,0 +1,226 @@
+"""
+기술적 지표 계산 엔진 (NumPy 벡터화)
+Vectorized Technical Indicator Engine
+
+모든 함수는 1차원 (n,) 배열(심볼 하나) 또는 2차원 (심볼 수, n) 배열(여러 심볼)을
+받아 마지막 축(시간)을 따라 계산하며, 입력과 같은 모양의 배열을 반환합니다.
+계산에 필요한 기간이 부족한 구간은 NaN 입니다.
+"""
+from typing import Dict, Optional
+import logging
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+logger = logging.getLogger(__name__)
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+def _as_float(values) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64)
+
+
+def _rolling(values: np.ndarray, window: int) -> Optional[np.ndarray]:
+    """(…, n - window + 1, window) 슬라이딩 윈도우 뷰 (기간 부족 시 None)"""
+    if values.shape[-1] < window:
+        return None
+    return sliding_window_view(values, window, axis=-1)
+
+
+def _pad_front(result: np.ndarray, length: int) -> np.ndarray:
+    """앞쪽을 NaN 으로 채워 원래 길이로 맞춤"""
+    pad = length - result.shape[-1]
+    if pad <= 0:
+        return result
+    padding = np.full(result.shape[:-1] + (pad,), np.nan)
+    return np.concatenate([padding, result], axis=-1)
+
+
+def _wilder(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Wilder 평활 (RMA): 첫 값은 period 개의 단순 평균, 이후 (prev * (p-1) + x) / p
+
+    values 의 첫 period 개로 시드하며, 그 이전 구간은 NaN 입니다.
+    """
+    out = np.full(values.shape, np.nan)
+    n = values.shape[-1]
+    if n < period:
+        return out
+
+    out[..., period - 1] = values[..., :period].mean(axis=-1)
+    for i in range(period, n):
+        out[..., i] = (out[..., i - 1] * (period - 1) + values[..., i]) / period
+    return out
+
+
+def sma(values, window: int) -> np.ndarray:
+    """단순 이동평균"""
+    values = _as_float(values)
+    windows = _rolling(values, window)
+    if windows is None:
+        return np.full(values.shape, np.nan)
+    return _pad_front(windows.mean(axis=-1), values.shape[-1])
+
+
+def ema(values, span: int) -> np.ndarray:
+    """지수 이동평균 (alpha = 2 / (span + 1), 첫 span 개의 단순 평균으로 시드)"""
+    values = _as_float(values)
+    out = np.full(values.shape, np.nan)
+    n = values.shape[-1]
+    if n < span:
+        return out
+
+    alpha = 2.0 / (span + 1)
+    out[..., span - 1] = values[..., :span].mean(axis=-1)
+    for i in range(span, n):
+        out[..., i] = alpha * values[..., i] + (1 - alpha) * out[..., i - 1]
+    return out
+
+
+def rsi(close, period: int = 14) -> np.ndarray:
+    """상대강도지수 (Wilder)"""
+    close = _as_float(close)
+    out = np.full(close.shape, np.nan)
+    if close.shape[-1] <= period:
+        return out
+
+    delta = np.diff(close, axis=-1)
+    avg_gain = _wilder(np.clip(delta, 0, None), period)
+    avg_loss = _wilder(np.clip(-delta, 0, None), period)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = avg_gain / avg_loss
+        values = 100.0 - 100.0 / (1.0 + rs)
+    # 손실이 0 이면 RSI 100, 이익/손실 모두 0 이면 50
+    values = np.where(avg_loss == 0, np.where(avg_gain == 0, 50.0, 100.0), values)
+    values = np.where(np.isnan(avg_gain), np.nan, values)
+
+    out[..., 1:] = values
+    return out
+
+
+def macd(close, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict[str, np.ndarray]:
+    """MACD 선, 시그널 선, 히스토그램"""
+    close = _as_float(close)
+    macd_line = ema(close, fast) - ema(close, slow)
+
+    signal_line = np.full(close.shape, np.nan)
+    start = slow - 1
+    if close.shape[-1] - start >= signal:
+        signal_line[..., start:] = ema(macd_line[..., start:], signal)
+
+    return {
+        "macd": macd_line,
+        "signal": signal_line,
+        "histogram": macd_line - signal_line
+    }
+
+
+def bollinger_bands(close, window: int = 20, num_std: float = 2.0) -> Dict[str, np.ndarray]:
+    """볼린저 밴드 (모표준편차 기준)"""
+    close = _as_float(close)
+    windows = _rolling(close, window)
+    if windows is None:
+        empty = np.full(close.shape, np.nan)
+        return {"upper": empty, "middle": empty.copy(), "lower": empty.copy()}
+
+    middle = _pad_front(windows.mean(axis=-1), close.shape[-1])
+    std = _pad_front(windows.std(axis=-1), close.shape[-1])
+    return {
+        "upper": middle + num_std * std,
+        "middle": middle,
+        "lower": middle - num_std * std
+    }
+
+
+def atr(high, low, close, period: int = 14) -> np.ndarray:
+    """평균 실제 범위 (Wilder)"""
+    high, low, close = _as_float(high), _as_float(low), _as_float(close)
+    out = np.full(close.shape, np.nan)
+    if close.shape[-1] <= period:
+        return out
+
+    prev_close = close[..., :-1]
+    true_range = np.maximum.reduce([
+        high[..., 1:] - low[..., 1:],
+        np.abs(high[..., 1:] - prev_close),
+        np.abs(low[..., 1:] - prev_close)
+    ])
+    out[..., 1:] = _wilder(true_range, period)
+    return out
+
+
+def realized_volatility(close, window: int = 20,
+                        periods_per_year: int = TRADING_DAYS_PER_YEAR) -> np.ndarray:
+    """로그 수익률 표준편차 기반 연율화 실현 변동성 (소수, 예: 0.25 = 25%)"""
+    close = _as_float(close)
+    out = np.full(close.shape, np.nan)
+    if close.shape[-1] <= window:
+        return out
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_returns = np.diff(np.log(close), axis=-1)
+    windows = _rolling(log_returns, window)
+    out[..., 1:] = _pad_front(windows.std(axis=-1, ddof=1), log_returns.shape[-1])
+    return out * np.sqrt(periods_per_year)
+
+
+def compute_indicators(high, low, close) -> Dict[str, np.ndarray]:
+    """
+    전체 지표 계산
+
+    Args:
+        high, low, close: (n,) 또는 (심볼 수, n) 배열
+
+    Returns:
+        지표 이름 → 입력과 같은 모양의 배열
+    """
+    macd_result = macd(close)
+    bands = bollinger_bands(close)
+    return {
+        "sma_20": sma(close, 20),
+        "sma_50": sma(close, 50),
+        "ema_12": ema(close, 12),
+        "ema_26": ema(close, 26),
+        "rsi_14": rsi(close, 14),
+        "macd": macd_result["macd"],
+        "macd_signal": macd_result["signal"],
+        "macd_histogram": macd_result["histogram"],
+        "bb_upper": bands["upper"],
+        "bb_middle": bands["middle"],
+        "bb_lower": bands["lower"],
+        "atr_14": atr(high, low, close, 14),
+        "volatility_20d": realized_volatility(close, 20),
+    }
+
+
+def latest_indicators(high, low, close) -> Dict[str, np.ndarray]:
+    """
+    여러 심볼의 최신 지표값
+
+    Returns:
+        지표 이름 → 마지막 봉의 값 (1차원 입력이면 스칼라, 2차원이면 (심볼 수,) 배열)
+    """
+    return {name: values[..., -1] for name, values in compute_indicators(high, low, close).items()}
+
+
+def summarize_indicators(history: Dict[str, np.ndarray]) -> Optional[Dict]:
+    """
+    심볼 하나의 OHLCV 로 프롬프트용 지표 요약 생성
+
+    Args:
+        history: OHLCVStore.read/range 결과 (컬럼명 → 배열)
+
+    Returns:
+        지표 이름 → 최신값 (계산 불가 시 None), 데이터가 없으면 None
+    """
+    if not history or len(history.get("close", [])) == 0:
+        return None
+
+    latest = latest_indicators(history["high"], history["low"], history["close"])
+    summary = {"bars": int(len(history["close"]))}
+    for name, value in latest.items():
+        value = float(value)
+        summary[name] = None if np.isnan(value) else round(value, 4)
+    return summary
@@ -0,0 +1,268 @@
+"""
+정규화된 도구 결과 레코드 (슬롯 기반 불변 데이터 클래스)
+Compact Slotted Records for Normalized Tool Results
+
+워크플로우 상태에는 중첩 dict 대신 이 레코드를 보관하고, 프롬프트 직렬화나
+결과 반환처럼 dict 가 필요한 경계에서만 to_dict() 로 변환합니다.
+원시 응답은 실행 저장소(utils.blob_store)에 한 번만 저장하고 레코드에는 핸들(raw_ref)만 둡니다.
+"""
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class QuoteRecord:
+    """정규화된 주식 시세 (DataNormalizer.normalize_stock_data 결과와 같은 정보)"""
+    symbol: Optional[str]
+    timestamp: str
+    current: Any
+    change: Any
+    change_percent: Any
+    trend: str
+    trend_emoji: str
+    pe_ratio: Any
+    pe_evaluation: str
+    market_cap: Any
+    volume: Any
+    volume_formatted: str
+    high_52w: Any
+    low_52w: Any
+    position_percent: Optional[float]
+    position_description: str
+    technical_summary: Optional[Dict] = None  # 읽기 전용으로 취급
+    status: str = "success"
+    raw_ref: Optional[str] = None  # 원시 응답 핸들 (BlobStore.get 으로 조회)
+
+    @classmethod
+    def from_normalized(cls, normalized: Dict) -> "QuoteRecord":
+        price = normalized.get("price_summary", {})
+        valuation = normalized.get("valuation_summary", {})
+        trading = normalized.get("trading_summary", {})
+        range_summary = normalized.get("range_summary", {})
+        return cls(
+            symbol=normalized.get("symbol"),
+            timestamp=normalized.get("timestamp", ""),
+            current=price.get("current"),
+            change=price.get("change"),
+            change_percent=price.get("change_percent"),
+            trend=price.get("trend", "알 수 없음"),
+            trend_emoji=price.get("trend_emoji", ""),
+            pe_ratio=valuation.get("pe_ratio"),
+            pe_evaluation=valuation.get("pe_evaluation", "평가불가"),
+            market_cap=valuation.get("market_cap"),
+            volume=trading.get("volume"),
+            volume_formatted=trading.get("volume_formatted", "N/A"),
+            high_52w=range_summary.get("high_52w"),
+            low_52w=range_summary.get("low_52w"),
+            position_percent=range_summary.get("position_percent"),
+            position_description=range_summary.get("position_description", "알 수 없음"),
+            technical_summary=normalized.get("technical_summary"),
+            status=normalized.get("status", "success"),
+            raw_ref=normalized.get("_raw_ref")
+        )
+
+    def to_dict(self) -> Dict:
+        """normalize_stock_data 와 같은 중첩 구조 (_raw 제외, 핸들이 있으면 _raw_ref 포함)"""
+        data = {
+            "status": self.status,
+            "symbol": self.symbol,
+            "timestamp": self.timestamp,
+            "price_summary": {
+                "current": self.current,
+                "change": self.change,
+                "change_percent": self.change_percent,
+                "trend": self.trend,
+                "trend_emoji": self.trend_emoji
+            },
+            "valuation_summary": {
+                "pe_ratio": self.pe_ratio,
+                "pe_evaluation": self.pe_evaluation,
+                "market_cap": self.market_cap
+            },
+            "trading_summary": {
+                "volume": self.volume,
+                "volume_formatted": self.volume_formatted
+            },
+            "range_summary": {
+                "high_52w": self.high_52w,
+                "low_52w": self.low_52w,
+                "position_percent": self.position_percent,
+                "position_description": self.position_description
+            },
+            "technical_summary": self.technical_summary
+        }
+        if self.raw_ref is not None:
+            data["_raw_ref"] = self.raw_ref
+        return data
+
+
+@dataclass(frozen=True, slots=True)
+class NewsItemRecord:
+    """감성 점수를 매긴 뉴스 기사 하나"""
+    title: str
+    snippet: str
+    url: Optional[str]
+    sentiment: str
+    sentiment_emoji: str
+
+    @classmethod
+    def from_dict(cls, item: Dict) -> "NewsItemRecord":
+        return cls(
+            title=item.get("title", ""),
+            snippet=item.get("snippet", ""),
+            url=item.get("url"),
+            sentiment=item.get("sentiment", "neutral"),
+            sentiment_emoji=item.get("sentiment_emoji", "")
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            "title": self.title,
+            "snippet": self.snippet,
+            "url": self.url,
+            "sentiment": self.sentiment,
+            "sentiment_emoji": self.sentiment_emoji
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class NewsRecord:
+    """정규화된 뉴스 요약 (DataNormalizer.summarize_news_items 결과와 같은 정보)"""
+    timestamp: str
+    total_count: int
+    overall_sentiment: str
+    overall_emoji: str
+    positive: int
+    negative: int
+    neutral: int
+    items: Tuple[NewsItemRecord, ...]
+    status: str = "success"
+    raw_ref: Optional[str] = None
+
+    @classmethod
+    def from_normalized(cls, normalized: Dict) -> "NewsRecord":
+        overview = normalized.get("news_overview", {})
+        breakdown = overview.get("sentiment_breakdown", {})
+        items = tuple(NewsItemRecord.from_dict(item) for item in normalized.get("news_items", []))
+        return cls(
+            timestamp=normalized.get("timestamp", ""),
+            total_count=overview.get("total_count", len(items)),
+            overall_sentiment=overview.get("overall_sentiment", "중립적"),
+            overall_emoji=overview.get("overall_emoji", ""),
+            positive=breakdown.get("positive", 0),
+            negative=breakdown.get("negative", 0),
+            neutral=breakdown.get("neutral", 0),
+            items=items,
+            status=normalized.get("status", "success"),
+            raw_ref=normalized.get("_raw_ref")
+        )
+
+    def to_dict(self) -> Dict:
+        """summarize_news_items 와 같은 구조 (_raw 제외, 핸들이 있으면 _raw_ref 포함)"""
+        data = {
+            "status": self.status,
+            "timestamp": self.timestamp,
+            "news_overview": {
+                "total_count": self.total_count,
+                "processed_count": len(self.items),
+                "overall_sentiment": self.overall_sentiment,
+                "overall_emoji": self.overall_emoji,
+                "sentiment_breakdown": {
+                    "positive": self.positive,
+                    "negative": self.negative,
+                    "neutral": self.neutral
+                }
+            },
+            "news_items": [item.to_dict() for item in self.items]
+        }
+        if self.raw_ref is not None:
+            data["_raw_ref"] = self.raw_ref
+        return data
+
+
+@dataclass(frozen=True, slots=True)
+class CalculationRecord:
+    """계산기 도구 결과"""
+    expression: str
+    status: str
+    result: Any = None
+    error: Optional[str] = None
+    retry_hint: Optional[str] = None
+
+    @classmethod
+    def from_result(cls, result: Dict) -> "CalculationRecord":
+        return cls(
+            expression=result.get("expression", ""),
+            status=result.get("status", "error"),
+            result=result.get("result"),
+            error=result.get("error"),
+            retry_hint=result.get("retry_hint")
+        )
+
+    def to_dict(self) -> Dict:
+        """CalculatorTool.run 과 같은 형태 (없는 필드는 생략)"""
+        data = {"status": self.status, "expression": self.expression}
+        if self.status == "success":
+            data["result"] = self.result
+        else:
+            data["error"] = self.error
+            if self.retry_hint is not None:
+                data["retry_hint"] = self.retry_hint
+        return data
+
+
+RECORD_TYPES = (QuoteRecord, NewsItemRecord, NewsRecord, CalculationRecord)
+
+
+def as_dict(value: Any) -> Any:
+    """레코드면 dict 로 변환, 아니면 그대로 (dict 를 받는 기존 코드와의 경계용)"""
+    return value.to_dict() if isinstance(value, RECORD_TYPES) else value
+
+
+def json_default(value: Any) -> Any:
+    """
+    json.dumps(default=...) 훅: 직렬화 시점에만 레코드를 dict 로 변환
+
+    프롬프트용이므로 LLM 에게 의미 없는 원시 응답 핸들(_raw_ref)은 뺍니다.
+    """
+    if isinstance(value, RECORD_TYPES):
+        data = value.to_dict()
+        data.pop("_raw_ref", None)
+        return data
+    return str(value)
+
+
+def to_serializable(value: Any) -> Any:
+    """상태 전체에서 레코드를 dict 로 재귀 변환 (워크플로우 결과 반환용)"""
+    if isinstance(value, RECORD_TYPES):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {key: to_serializable(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [to_serializable(item) for item in value]
+    return value
+
+
+def deep_sizeof(value: Any) -> int:
+    """
+    객체 그래프의 대략적인 메모리 크기 (바이트)
+
+    공유 객체는 한 번만 세며, 슬롯 레코드는 각 슬롯 값까지 포함합니다.
+    """
+    seen = set()
+
+    def size(obj: Any) -> int:
+        if id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+        total = sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            total += sum(size(k) + size(v) for k, v in obj.items())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            total += sum(size(item) for item in obj)
+        elif isinstance(obj, RECORD_TYPES):
+            total += sum(size(getattr(obj, name)) for name in obj.__slots__)
+        return total
+
+    return size(value)
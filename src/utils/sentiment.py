@@ -0,0 +1,170 @@
+"""
+컴파일된 다중 패턴 감성 점수기
+Compiled Multi-Pattern Sentiment Scorer
+
+가중치가 있는 한/영 감성 어휘 전체를 접두사 트라이 형태의 정규식 하나로 컴파일해,
+어휘 크기와 무관하게 텍스트를 한 번만 훑어 점수를 계산합니다.
+"""
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+POSITIVE = "positive"
+NEGATIVE = "negative"
+NEUTRAL = "neutral"
+
+# 기본 어휘 (양수: 긍정, 음수: 부정). 영어는 활용형을 별도 항목으로 둡니다.
+DEFAULT_LEXICON: Dict[str, float] = {
+    # 한국어 긍정
+    "상승": 1.0, "급등": 2.0, "반등": 1.0, "증가": 1.0, "성장": 1.0, "호조": 1.5, "호실적": 2.0,
+    "긍정": 1.0, "강세": 1.5, "최고치": 1.5, "신고가": 1.5, "흑자": 1.5, "개선": 1.0,
+    "상향": 1.0, "돌파": 1.0, "수혜": 1.0, "기대감": 0.5, "매수": 0.5,
+    # 한국어 부정
+    "하락": -1.0, "급락": -2.0, "폭락": -2.5, "감소": -1.0, "우려": -1.0, "부진": -1.5,
+    "약세": -1.5, "적자": -1.5, "악화": -1.5, "하향": -1.0, "최저치": -1.5, "신저가": -1.5,
+    "둔화": -1.0, "리스크": -0.5, "소송": -1.0, "매도": -0.5, "손실": -1.5,
+    # 영어 긍정
+    "strong": 1.0, "stronger": 1.0, "rise": 1.0, "rises": 1.0, "rose": 1.0, "rising": 1.0,
+    "gain": 1.0, "gains": 1.0, "gained": 1.0, "surge": 2.0, "surges": 2.0, "surged": 2.0,
+    "soar": 2.0, "soars": 2.0, "soared": 2.0, "rally": 1.5, "rallies": 1.5, "rallied": 1.5,
+    "beat": 1.5, "beats": 1.5, "upgrade": 1.5, "upgraded": 1.5, "record high": 1.5,
+    "outperform": 1.5, "bullish": 1.5, "growth": 1.0, "profit": 0.5, "jump": 1.5,
+    "jumps": 1.5, "jumped": 1.5, "boost": 1.0, "boosts": 1.0, "raises guidance": 2.0,
+    # 영어 부정
+    "weak": -1.0, "weaker": -1.0, "fall": -1.0, "falls": -1.0, "fell": -1.0, "falling": -1.0,
+    "drop": -1.0, "drops": -1.0, "dropped": -1.0, "plunge": -2.0, "plunges": -2.0,
+    "plunged": -2.0, "slump": -2.0, "slumps": -2.0, "tumble": -2.0, "tumbles": -2.0,
+    "miss": -1.5, "misses": -1.5, "missed": -1.5, "downgrade": -1.5, "downgraded": -1.5,
+    "underperform": -1.5, "bearish": -1.5, "loss": -1.5, "losses": -1.5, "lawsuit": -1.0,
+    "recall": -1.0, "layoffs": -1.0, "cuts guidance": -2.0, "concern": -1.0, "concerns": -1.0,
+}
+
+_LATIN = re.compile(r"[0-9a-z]")
+
+
+def load_lexicon(path: str) -> Dict[str, float]:
+    """
+    탭 구분 어휘 파일 로드 (한 줄에 '단어<TAB>가중치', '#' 주석 허용)
+
+    가중치가 없으면 1.0 으로 봅니다.
+    """
+    lexicon: Dict[str, float] = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            term, _, weight = line.partition("\t")
+            lexicon[term.strip()] = float(weight) if weight.strip() else 1.0
+    return lexicon
+
+
+def _trie_regex(terms: Iterable[str]) -> str:
+    """
+    단어 목록을 접두사 트라이 정규식으로 변환
+
+    ("rise", "rises", "rising") → "ris(?:e(?:s)?|ing)" 처럼 공통 접두사를 공유하므로
+    re 엔진이 위치마다 모든 단어를 차례로 시도하지 않습니다. 더 긴 단어가 먼저 일치합니다.
+    """
+    trie: Dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def build(node: Dict) -> str:
+        ending = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if ending:
+            # 이 지점에서 끝나는 단어도 있으면 나머지는 선택 사항 (탐욕적으로 긴 단어 우선)
+            body = "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+class SentimentScorer:
+    """
+    가중치 어휘 기반 감성 점수기
+
+    - 영어 등 라틴 문자 단어는 양쪽 단어 경계가 있어야 일치합니다 ("gain" 은 "against" 에 일치하지 않음).
+    - 한글 단어는 조사/어미와 복합어("실적부진", "상승세")가 붙으므로 부분 문자열로 일치합니다.
+    - 겹치는 후보 중에서는 가장 긴 단어가 선택되고, 같은 위치를 두 번 세지 않습니다.
+    """
+
+    def __init__(self, lexicon: Optional[Dict[str, float]] = None):
+        lexicon = DEFAULT_LEXICON if lexicon is None else lexicon
+        self.weights: Dict[str, float] = {}
+        for term, weight in lexicon.items():
+            key = " ".join(term.lower().split())
+            if key and weight:
+                self.weights[key] = float(weight)
+
+        latin = [t for t in self.weights if _LATIN.search(t)]
+        other = [t for t in self.weights if not _LATIN.search(t)]
+        alternatives = []
+        if latin:
+            alternatives.append(r"(?<![0-9a-z])" + _trie_regex(latin) + r"(?![0-9a-z])")
+        if other:
+            alternatives.append(_trie_regex(other))
+        self._pattern = re.compile("|".join(alternatives)) if alternatives else None
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+    def matches(self, text: str) -> List[str]:
+        """텍스트에서 일치한 어휘 목록 (등장 순서)"""
+        if self._pattern is None or not text:
+            return []
+        normalized = " ".join(text.lower().split())
+        return [m.group(0) for m in self._pattern.finditer(normalized)]
+
+    def score(self, text: str) -> Tuple[float, float]:
+        """(긍정 점수 합, 부정 점수 합의 절댓값)"""
+        positive = negative = 0.0
+        for term in self.matches(text):
+            weight = self.weights[term]
+            if weight > 0:
+                positive += weight
+            else:
+                negative -= weight
+        return positive, negative
+
+    def label(self, text: str) -> str:
+        positive, negative = self.score(text)
+        if positive > negative:
+            return POSITIVE
+        if negative > positive:
+            return NEGATIVE
+        return NEUTRAL
+
+    def label_many(self, texts: Iterable[str]) -> List[str]:
+        """여러 기사의 감성 레이블 (컴파일된 패턴 하나를 재사용)"""
+        return [self.label(text) for text in texts]
+
+
+_default_scorer: Optional[SentimentScorer] = None
+_default_lock = threading.Lock()
+
+
+def set_default_sentiment_scorer(scorer: Optional[SentimentScorer]) -> None:
+    """정규화에 사용할 프로세스 전역 감성 점수기 지정 (None 이면 기본 어휘로 다시 생성)"""
+    global _default_scorer
+    with _default_lock:
+        _default_scorer = scorer
+
+
+def get_default_sentiment_scorer() -> SentimentScorer:
+    """프로세스 전역 감성 점수기 (처음 호출 시 한 번만 컴파일)"""
+    global _default_scorer
+    with _default_lock:
+        if _default_scorer is None:
+            _default_scorer = SentimentScorer()
+        return _default_scorer
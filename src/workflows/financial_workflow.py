@@ -3,35 +3,100 @@
 Financial ReAct Agent Workflow
 """
 import logging
-from typing import Dict, Any
+from functools import wraps
+from typing import Dict, Any, Optional
 from langgraph.graph import StateGraph, END
 
 try:
     from .state import FinancialAgentState
-    from ..agents.financial_agents import ResearchAgent, AnalysisAgent, RecommendationAgent, ReviewAgent
+    from ..agents.financial_agents import (
+        ResearchAgent, AnalysisAgent, RecommendationAgent, ReviewAgent, STREAM_TOKENS
+    )
     from ..agents.human_approval_agent import HumanApprovalAgent
+    from ..tools.ohlcv_store import OHLCVStore
+    from ..tools.symbol_universe import SymbolUniverse
+    from ..tools.news_archive import NewsArchive
+    from ..tools.llm_client import LLMClient, get_default_llm_client
+    from ..tools.registry import ToolRegistry, get_tool_registry
+    from ..tools.llm_cache import LLMResponseCache
+    from ..utils.records import as_dict, to_serializable
+    from ..utils.blob_store import open_run_store, close_run_store
 except ImportError:
     # 테스트 환경에서 절대 import 사용
     from src.workflows.state import FinancialAgentState
-    from src.agents.financial_agents import ResearchAgent, AnalysisAgent, RecommendationAgent, ReviewAgent
+    from src.agents.financial_agents import (
+        ResearchAgent, AnalysisAgent, RecommendationAgent, ReviewAgent, STREAM_TOKENS
+    )
     from src.agents.human_approval_agent import HumanApprovalAgent
+    from src.tools.ohlcv_store import OHLCVStore
+    from src.tools.symbol_universe import SymbolUniverse
+    from src.tools.news_archive import NewsArchive
+    from src.tools.llm_client import LLMClient, get_default_llm_client
+    from src.tools.registry import ToolRegistry, get_tool_registry
+    from src.tools.llm_cache import LLMResponseCache
+    from src.utils.records import as_dict, to_serializable
+    from src.utils.blob_store import open_run_store, close_run_store
 
 logger = logging.getLogger(__name__)
 
 
+# operator.add 리듀서로 누적되는 상태 필드
+ACCUMULATED_FIELDS = ("messages", "errors", "tool_history")
+
+
+def _append_only(node):
+    """
+    누적 필드를 이번 노드에서 추가된 항목만 반환하도록 감싸는 래퍼
+    
+    노드는 상태 전체(누적 목록 포함)를 돌려주는데, 리듀서가 이를 기존 목록에 더하면
+    노드를 지날 때마다 목록이 두 배로 불어납니다. 노드에는 목록 사본을 넘기고
+    결과에서는 새로 추가된 부분만 남깁니다.
+    """
+    @wraps(node)
+    def wrapped(state):
+        state = dict(state)
+        offsets = {}
+        for field in ACCUMULATED_FIELDS:
+            items = list(state.get(field) or [])
+            state[field] = items
+            offsets[field] = len(items)
+        
+        result = node(state)
+        for field in ACCUMULATED_FIELDS:
+            if field in result:
+                result[field] = list(result[field] or [])[offsets[field]:]
+        return result
+    return wrapped
+
+
 class FinancialWorkflow:
     """금융 ReAct 에이전트 워크플로우"""
     
-    def __init__(self, google_ai_api_key: str, tavily_api_key: str = None):
+    def __init__(self, google_ai_api_key: str, tavily_api_key: str = None,
+                 ohlcv_store: Optional[OHLCVStore] = None,
+                 symbol_universe: Optional[SymbolUniverse] = None,
+                 news_archive: Optional[NewsArchive] = None,
+                 llm_client: Optional[LLMClient] = None,
+                 tool_registry: Optional[ToolRegistry] = None,
+                 llm_cache: Optional[LLMResponseCache] = None,
+                 news_query_fanout: int = 1):
         self.google_ai_api_key = google_ai_api_key
         self.tavily_api_key = tavily_api_key
+        # 모든 에이전트가 하나의 LLM 클라이언트와 도구 레지스트리를 공유 (기본값은 프로세스 전역)
+        self.llm_client = llm_client if llm_client is not None else get_default_llm_client(google_ai_api_key)
+        self.tool_registry = tool_registry if tool_registry is not None else get_tool_registry(tavily_api_key)
+        shared = {"llm_client": self.llm_client, "tool_registry": self.tool_registry, "llm_cache": llm_cache}
         
         # 에이전트 초기화
-        self.research_agent = ResearchAgent(google_ai_api_key, tavily_api_key)
-        self.analysis_agent = AnalysisAgent(google_ai_api_key, tavily_api_key)
-        self.recommendation_agent = RecommendationAgent(google_ai_api_key, tavily_api_key)
+        self.research_agent = ResearchAgent(
+            google_ai_api_key, tavily_api_key,
+            ohlcv_store=ohlcv_store, symbol_universe=symbol_universe,
+            news_archive=news_archive, news_query_fanout=news_query_fanout, **shared
+        )
+        self.analysis_agent = AnalysisAgent(google_ai_api_key, tavily_api_key, **shared)
+        self.recommendation_agent = RecommendationAgent(google_ai_api_key, tavily_api_key, **shared)
         self.human_approval_agent = HumanApprovalAgent()
-        self.review_agent = ReviewAgent(google_ai_api_key, tavily_api_key)
+        self.review_agent = ReviewAgent(google_ai_api_key, tavily_api_key, **shared)
         
         # 워크플로우 빌드
         self.app = self._build_workflow()
@@ -41,11 +106,11 @@ class FinancialWorkflow:
         workflow = StateGraph(FinancialAgentState)
         
         # 노드 추가
-        workflow.add_node("research", self.research_agent.research_node)
-        workflow.add_node("analyze", self.analysis_agent.analyze_node)
-        workflow.add_node("recommend", self.recommendation_agent.recommend_node)
-        workflow.add_node("human_approval", self.human_approval_agent.approval_node)
-        workflow.add_node("review", self.review_agent.review_node)
+        workflow.add_node("research", _append_only(self.research_agent.research_node))
+        workflow.add_node("analyze", _append_only(self.analysis_agent.analyze_node))
+        workflow.add_node("recommend", _append_only(self.recommendation_agent.recommend_node))
+        workflow.add_node("human_approval", _append_only(self.human_approval_agent.approval_node))
+        workflow.add_node("review", _append_only(self.review_agent.review_node))
         
         # 엔트리 포인트 설정
         workflow.set_entry_point("research")
@@ -149,7 +214,7 @@ class FinancialWorkflow:
         stock_data = state.get("stock_data")
         news_data = state.get("news_data", [])
         
-        if not stock_data or stock_data.get("status") != "success":
+        if not stock_data or as_dict(stock_data).get("status") != "success":
             if iteration < max_iterations - 1:
                 logger.info({
                     "decision": "should_continue",
@@ -167,8 +232,15 @@ class FinancialWorkflow:
         })
         return "end"
     
-    def run(self, initial_state: Dict[str, Any]) -> Dict[str, Any]:
-        """워크플로우 실행"""
+    def run(self, initial_state: Dict[str, Any], keep_raw_payloads: bool = False) -> Dict[str, Any]:
+        """
+        워크플로우 실행
+        
+        원시 도구 응답은 실행 단위 저장소에 한 번만 저장되고 상태에는 핸들만 남습니다.
+        저장소는 실행이 끝나면 닫히며, keep_raw_payloads=True 이면 남겨 두어
+        get_run_store(result["run_id"]).get(핸들) 로 조회할 수 있습니다
+        (최근 MAX_RETAINED_RUNS 개까지 유지, close_run_store 로 정리).
+        """
         logger.info({
             "workflow": "FinancialWorkflow",
             "action": "run",
@@ -176,6 +248,7 @@ class FinancialWorkflow:
             "status": "starting"
         })
         
+        run_store = open_run_store()
         try:
             # 초기 상태 설정
             state = FinancialAgentState({
@@ -192,7 +265,8 @@ class FinancialWorkflow:
                 "news_data": initial_state.get("news_data", []),
                 "analysis": initial_state.get("analysis"),
                 "recommendations": initial_state.get("recommendations"),
-                "final_report": initial_state.get("final_report", "")
+                "final_report": initial_state.get("final_report", ""),
+                "run_id": run_store.run_id
             })
             
             # 워크플로우 실행
@@ -205,7 +279,8 @@ class FinancialWorkflow:
                 "final_report_length": len(result.get("final_report", ""))
             })
             
-            return result
+            # 상태의 레코드는 결과를 돌려주는 경계에서만 dict 로 변환
+            return to_serializable(result)
             
         except Exception as e:
             logger.error({
@@ -221,16 +296,22 @@ class FinancialWorkflow:
                 "errors": initial_state.get("errors", []) + [f"워크플로우 실행 오류: {str(e)}"],
                 "final_report": "죄송합니다. 워크플로우 실행 중 오류가 발생했습니다."
             }
+        finally:
+            close_run_store(run_store.run_id, retain=keep_raw_payloads)
     
-    def stream(self, initial_state: Dict[str, Any]):
+    def stream(self, initial_state: Dict[str, Any], keep_raw_payloads: bool = False,
+               stream_tokens: bool = True):
         """
         워크플로우를 스트리밍 모드로 실행 (실시간 로깅)
         
         Args:
             initial_state: 초기 상태
+            keep_raw_payloads: 실행이 끝나도 원시 응답 저장소를 남길지 (run 참고)
+            stream_tokens: 분석/추천/보고서 LLM 응답을 토큰 단위로 함께 내보낼지
             
         Yields:
-            각 단계의 실행 결과
+            노드 완료: {"type": "node", "node": ..., "state": ..., "status": ...}
+            LLM 토큰 (stream_tokens): {"type": "token", "node": ..., "token": "...", "status": "streaming"}
         """
         logger.info({
             "workflow": "FinancialWorkflow",
@@ -240,6 +321,7 @@ class FinancialWorkflow:
             "status": "starting"
         })
         
+        run_store = open_run_store()
         try:
             # 초기 상태 설정
             state = FinancialAgentState({
@@ -256,14 +338,31 @@ class FinancialWorkflow:
                 "news_data": initial_state.get("news_data", []),
                 "analysis": initial_state.get("analysis"),
                 "recommendations": initial_state.get("recommendations"),
-                "final_report": initial_state.get("final_report", "")
+                "final_report": initial_state.get("final_report", ""),
+                "run_id": run_store.run_id
             })
             
-            # 스트리밍 실행
-            for event in self.app.stream(state):
+            # 스트리밍 실행 (토큰은 에이전트가 LangGraph custom 스트림으로 내보냄)
+            if stream_tokens:
+                events = self.app.stream(
+                    state, config={"configurable": {STREAM_TOKENS: True}}, stream_mode=["updates", "custom"]
+                )
+            else:
+                events = (("updates", event) for event in self.app.stream(state))
+            
+            for mode, event in events:
+                if mode == "custom":
+                    yield {
+                        "type": "token",
+                        "node": event.get("node", "unknown"),
+                        "token": event.get("token", ""),
+                        "status": "streaming"
+                    }
+                    continue
+                
                 # 이벤트 로깅
                 node_name = list(event.keys())[0] if event else "unknown"
-                node_state = event.get(node_name, {}) if event else {}
+                node_state = to_serializable(event.get(node_name, {})) if event else {}
                 
                 logger.info({
                     "workflow": "FinancialWorkflow",
@@ -274,6 +373,7 @@ class FinancialWorkflow:
                 })
                 
                 yield {
+                    "type": "node",
                     "node": node_name,
                     "state": node_state,
                     "status": node_state.get("status", "running")
@@ -294,6 +394,7 @@ class FinancialWorkflow:
             })
             
             yield {
+                "type": "node",
                 "node": "error",
                 "state": {
                     "status": "error",
@@ -301,3 +402,5 @@ class FinancialWorkflow:
                 },
                 "status": "error"
             }
+        finally:
+            close_run_store(run_store.run_id, retain=keep_raw_payloads)
@@ -2,7 +2,7 @@
 금융 ReAct 에이전트를 위한 State 정의
 Financial ReAct Agent State Definition
 """
-from typing import TypedDict, Annotated, List, Dict, Optional
+from typing import TypedDict, Annotated, Any, List, Dict, Optional
 import operator
 
 
@@ -18,10 +18,10 @@ class FinancialAgentState(TypedDict):
     # 초기 질문/요청
     user_query: str
     
-    # 데이터 수집 단계의 결과들
-    stock_data: Optional[Dict]
+    # 데이터 수집 단계의 결과들 (utils.records 의 QuoteRecord/NewsRecord, 결과 반환 시 dict 로 변환)
+    stock_data: Optional[Any]
     market_data: Optional[Dict]
-    news_data: Optional[List[Dict]]
+    news_data: Optional[Any]
     
     # 분석 결과
     analysis: Optional[str]
@@ -29,6 +29,9 @@ class FinancialAgentState(TypedDict):
     # 추천사항
     recommendations: Optional[List[str]]
     
+    # 분석/추천 재사용 여부 ({"analysis": {"reused": True, "age_seconds": 42.0}, ...})
+    reuse_info: Optional[Dict[str, Dict]]
+    
     # 최종 보고서
     final_report: str
     
@@ -42,5 +45,8 @@ class FinancialAgentState(TypedDict):
     # 에러 상태
     errors: Annotated[List[str], operator.add]
     
-    # 도구 사용 히스토리
+    # 도구 사용 히스토리 (원시 결과는 output_ref 핸들로 실행 저장소에서 조회)
     tool_history: Annotated[List[Dict], operator.add]
+    
+    # 실행 단위 원시 응답 저장소 키 (utils.blob_store)
+    run_id: Optional[str]
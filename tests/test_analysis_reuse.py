@@ -0,0 +1,158 @@
+"""
+입력 지문 기반 분석 재사용 테스트
+Fingerprint-Based Analysis Reuse Tests
+"""
+import pytest
+import sys
+import os
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.data_normalizer import DataNormalizer
+from utils.records import QuoteRecord, NewsRecord
+from utils.analysis_reuse import (
+    ANALYSIS, AnalysisReuseCache, ReuseTolerance, fingerprint_inputs
+)
+from tools.llm_cache import LLMResponseCache
+from agents import financial_agents
+from agents.financial_agents import AnalysisAgent, RecommendationAgent
+
+RAW_NEWS = {
+    "status": "success",
+    "results": [{"title": f"Apple shares rise {i}", "url": f"https://r.com/{i}", "snippet": ""} for i in range(3)]
+}
+
+
+def quote(price, pe_ratio=29.4, change=1.2):
+    raw = {
+        "status": "success", "symbol": "AAPL", "current_price": price, "change": change,
+        "change_percent": 0.0064, "volume": 100, "market_cap": 2.9e12, "pe_ratio": pe_ratio,
+        "52w_high": 199.6, "52w_low": 164.1
+    }
+    return QuoteRecord.from_normalized(DataNormalizer.normalize_stock_data(raw))
+
+
+NEWS = NewsRecord.from_normalized(DataNormalizer.normalize_news_data(RAW_NEWS))
+
+
+class FakeClient:
+    model_name = "fake-model"
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate_content(self, prompt, **kwargs):
+        self.calls += 1
+
+        class Response:
+            text = f"1. 보유 - 응답 {self.calls}"
+            usage_metadata = None
+        return Response()
+
+
+def state_for(price, **kwargs):
+    # 에이전트는 src.utils 경로로 import 되므로 상태에는 dict 형태로 넣음
+    return {
+        "stock_symbol": "AAPL", "user_query": "AAPL 분석", "stock_data": quote(price, **kwargs).to_dict(),
+        "news_data": NEWS.to_dict(), "messages": [], "tool_history": [], "errors": [], "analysis": "분석"
+    }
+
+
+class TestFingerprint:
+    """지문 비교 테스트"""
+
+    def test_small_price_move_matches(self):
+        tolerance = ReuseTolerance()
+        base = fingerprint_inputs(quote(189.3), NEWS, "q")
+
+        assert fingerprint_inputs(quote(189.5), NEWS, "q").matches(base, tolerance)
+        assert not fingerprint_inputs(quote(192.0), NEWS, "q").matches(base, tolerance)
+        assert not fingerprint_inputs(quote(189.3, pe_ratio=36.0), NEWS, "q").matches(base, tolerance)
+        assert not fingerprint_inputs(quote(189.3, change=-1.0), NEWS, "q").matches(base, tolerance)
+        assert not fingerprint_inputs(quote(189.3), None, "q").matches(base, tolerance)
+        assert not fingerprint_inputs(quote(189.3), NEWS, "other").matches(base, tolerance)
+
+    def test_failed_quote_has_no_fingerprint(self):
+        assert fingerprint_inputs({"status": "error"}, NEWS) is None
+        assert AnalysisReuseCache().lookup(ANALYSIS, None) == (None, None)
+
+    def test_max_age(self, monkeypatch):
+        cache = AnalysisReuseCache(ReuseTolerance(max_age_seconds=60))
+        fingerprint = fingerprint_inputs(quote(189.3), NEWS)
+        cache.store(ANALYSIS, fingerprint, "분석")
+        assert cache.lookup(ANALYSIS, fingerprint)[0] == "분석"
+
+        import utils.analysis_reuse as analysis_reuse
+        now = analysis_reuse.time.time()
+        monkeypatch.setattr(analysis_reuse.time, "time", lambda: now + 120)
+        assert cache.lookup(ANALYSIS, fingerprint) == (None, None)
+
+
+class TestAgentReuse:
+    """분석/추천 에이전트 재사용 테스트"""
+
+    def test_analysis_reused_within_tolerance(self):
+        client, cache = FakeClient(), AnalysisReuseCache()
+        agent = AnalysisAgent("dummy", llm_client=client, llm_cache=LLMResponseCache(), reuse_cache=cache)
+
+        first = agent.analyze_node(state_for(189.3))
+        second = agent.analyze_node(state_for(189.45))
+
+        assert client.calls == 1
+        assert second["analysis"] == first["analysis"]
+        assert first["reuse_info"]["analysis"] == {"reused": False}
+        assert second["reuse_info"]["analysis"]["reused"] is True
+        assert second["reuse_info"]["analysis"]["age_seconds"] >= 0
+
+        agent.analyze_node(state_for(195.0))
+        assert client.calls == 2
+
+    def test_recommendations_reused(self):
+        client, cache = FakeClient(), AnalysisReuseCache()
+        agent = RecommendationAgent("dummy", llm_client=client, llm_cache=LLMResponseCache(), reuse_cache=cache)
+
+        first = agent.recommend_node(state_for(189.3))
+        second = agent.recommend_node(state_for(189.4))
+
+        assert client.calls == 1
+        assert second["recommendations"] == first["recommendations"]
+        assert second["reuse_info"]["recommendations"]["reused"] is True
+
+    def test_quote_only_research_state_reuses_both(self, monkeypatch):
+        """리서치 단계처럼 시세만 있는 상태로 분석 -> 추천을 두 번 실행하면 두 번째는 모두 재사용"""
+        client, cache = FakeClient(), AnalysisReuseCache()
+        analysis_agent = AnalysisAgent("dummy", llm_client=client, llm_cache=LLMResponseCache(), reuse_cache=cache)
+        recommendation_agent = RecommendationAgent("dummy", llm_client=client, llm_cache=LLMResponseCache(),
+                                                   reuse_cache=cache)
+        fetched = []
+        monkeypatch.setattr(analysis_agent.stock_tool, "fundamentals", lambda symbol: fetched.append(symbol) or {
+            "status": "success", "symbol": symbol, "market_cap": 2.9e12, "pe_ratio": 29.4,
+            "52w_high": 199.6, "52w_low": 164.1
+        })
+
+        def research_state(price):
+            state = state_for(price)
+            state["stock_data"] = DataNormalizer.normalize_stock_data({
+                "status": "success", "symbol": "AAPL", "current_price": price, "change": 1.2,
+                "change_percent": 0.0064, "volume": 100, "tier": "quote"
+            })
+            return state
+
+        first = recommendation_agent.recommend_node(analysis_agent.analyze_node(research_state(189.3)))
+        assert first["stock_data"].pe_ratio == 29.4
+        assert first["tool_history"][0]["input"] == {"symbol": "AAPL", "tier": "fundamentals"}
+        assert fetched == ["AAPL"]
+
+        second = recommendation_agent.recommend_node(analysis_agent.analyze_node(research_state(189.4)))
+        assert second["reuse_info"]["analysis"]["reused"] is True
+        assert second["reuse_info"]["recommendations"]["reused"] is True
+        assert client.calls == 2
+
+        # 워크플로우 밖에서 직접 호출한 노드가 연 저장소는 노드가 끝나면 닫힘
+        run_stores = sys.modules[financial_agents.ensure_run_store.__module__]
+        assert first["run_id"] not in run_stores._open_stores
+        assert run_stores.get_run_store(first["run_id"]).get(first["tool_history"][0]["output_ref"])["pe_ratio"] == 29.4
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,106 @@
+"""
+실행 단위 원시 응답 저장소 테스트
+Per-Run Blob Store Tests
+"""
+import pytest
+import sys
+import os
+import json
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils import blob_store
+from utils.blob_store import (
+    BlobStore, open_run_store, get_run_store, close_run_store, ensure_run_store, run_store_scope
+)
+from utils.data_normalizer import DataNormalizer
+from utils.records import QuoteRecord, NewsRecord, json_default
+
+RAW_QUOTE = {"status": "success", "symbol": "AAPL", "current_price": 189.3, "change": 1.2, "volume": 100}
+
+
+class TestBlobStore:
+    """BlobStore 테스트"""
+
+    def test_put_is_content_addressed(self):
+        store = BlobStore()
+        first = store.put({"a": 1, "b": [1, 2]})
+        second = store.put({"b": [1, 2], "a": 1})
+
+        assert first == second
+        assert first.startswith("sha256:")
+        assert store.get(first) == {"a": 1, "b": [1, 2]}
+        assert store.get("sha256:missing") is None
+        assert store.stats()["blobs"] == 1
+        assert store.stats()["deduplicated_puts"] == 1
+
+    def test_normalizer_stores_reference(self):
+        store = BlobStore()
+        normalized = DataNormalizer.normalize_stock_data(RAW_QUOTE, blob_store=store)
+
+        assert "_raw" not in normalized
+        assert store.get(normalized["_raw_ref"]) is RAW_QUOTE
+
+        record = QuoteRecord.from_normalized(normalized)
+        assert record.raw_ref == normalized["_raw_ref"]
+        assert record.to_dict()["_raw_ref"] == record.raw_ref
+        assert "_raw_ref" not in json.loads(json.dumps(record, default=json_default))
+
+    def test_news_reference(self):
+        store = BlobStore()
+        raw = {"status": "success", "results": [{"title": "Apple shares rise", "url": "u", "snippet": ""}]}
+        record = NewsRecord.from_normalized(DataNormalizer.normalize_news_data(raw, blob_store=store))
+
+        assert store.get(record.raw_ref) is raw
+
+    def test_open_runs_are_never_evicted(self, monkeypatch):
+        monkeypatch.setattr(blob_store, "MAX_RETAINED_RUNS", 2)
+        first = open_run_store()
+        handle = first.put(RAW_QUOTE)
+        others = [open_run_store() for _ in range(blob_store.MAX_RETAINED_RUNS + 16)]
+
+        assert ensure_run_store({"run_id": first.run_id}) is first
+        assert first.get(handle) == RAW_QUOTE
+
+        for store in [first] + others:
+            close_run_store(store.run_id)
+        with pytest.raises(KeyError):
+            ensure_run_store({"run_id": first.run_id})
+
+    def test_retained_runs_are_bounded(self, monkeypatch):
+        monkeypatch.setattr(blob_store, "MAX_RETAINED_RUNS", 2)
+        stores = [open_run_store() for _ in range(3)]
+        for store in stores:
+            close_run_store(store.run_id, retain=True)
+
+        assert get_run_store(stores[0].run_id) is None
+        assert get_run_store(stores[2].run_id) is stores[2]
+        assert close_run_store(stores[1].run_id)["blobs"] == 0
+        assert get_run_store(stores[1].run_id) is None
+        close_run_store(stores[2].run_id)
+
+    def test_ensure_run_store_requires_run_id(self):
+        with pytest.raises(KeyError):
+            ensure_run_store({})
+
+    def test_run_store_scope_closes_implicit_store(self):
+        state = {}
+        with run_store_scope(state) as store:
+            assert ensure_run_store(state) is store
+            handle = store.put(RAW_QUOTE)
+
+        assert state["run_id"] not in blob_store._open_stores
+        assert get_run_store(state["run_id"]).get(handle) == RAW_QUOTE
+        close_run_store(state["run_id"])
+
+    def test_run_store_scope_keeps_workflow_store_open(self):
+        store = open_run_store()
+        with run_store_scope({"run_id": store.run_id}) as scoped:
+            assert scoped is store
+
+        assert blob_store._open_stores[store.run_id] is store
+        close_run_store(store.run_id)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
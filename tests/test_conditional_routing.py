@@ -297,6 +297,27 @@ class TestConditionalRouting:
         print(f"✅ 여러 라우팅 결정 테스트 통과 (총 {len(test_cases)}개)")
 
 
+
+class TestAccumulatedState:
+    """누적 필드 리듀서 테스트"""
+    
+    def test_nodes_return_only_new_entries(self):
+        """노드를 거쳐도 누적 목록이 두 배로 불어나지 않음"""
+        from workflows.financial_workflow import _append_only
+        
+        def node(state):
+            state["messages"].append({"role": "assistant", "content": "new"})
+            state["tool_history"].append({"tool": "calculator_tool"})
+            return state
+        
+        original = {"messages": [{"role": "user", "content": "q"}], "errors": [], "tool_history": []}
+        result = _append_only(node)(original)
+        
+        assert result["messages"] == [{"role": "assistant", "content": "new"}]
+        assert result["tool_history"] == [{"tool": "calculator_tool"}]
+        assert result["errors"] == []
+        assert len(original["messages"]) == 1
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
 
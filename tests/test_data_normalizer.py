@@ -0,0 +1,79 @@
+"""
+데이터 정규화 테스트
+Data Normalizer Tests
+"""
+import pytest
+import sys
+import os
+import random
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.data_normalizer import DataNormalizer
+
+
+def _without_timestamps(record):
+    return repr({k: v for k, v in record.items() if k not in ("timestamp", "normalized_at")})
+
+
+class TestNormalizeStockBatch:
+    """normalize_stock_batch 테스트"""
+
+    def test_matches_scalar_path(self):
+        """일괄 정규화 결과는 종목별 스칼라 정규화와 동일"""
+        rng = random.Random(0)
+        values = [0, 1, -1, 0.0, float("nan"), "N/A", None, True, 12.5, 15, 25, 30, 150.3]
+        batch = []
+        for i in range(500):
+            raw = {
+                "status": "success",
+                "symbol": f"S{i}",
+                "current_price": rng.choice(values),
+                "change": rng.choice(values),
+                "change_percent": rng.choice(values),
+                "pe_ratio": rng.choice(values),
+                "52w_high": rng.choice(values),
+                "52w_low": rng.choice(values),
+                "volume": rng.choice([0, None, 1234, "N/A"]),
+                "market_cap": 1
+            }
+            if rng.random() < 0.2:
+                raw.pop(rng.choice(list(raw)[2:]))
+            batch.append(raw)
+        batch.append({"status": "error", "error": "조회 실패"})
+
+        results = DataNormalizer.normalize_stock_batch(batch)
+
+        assert len(results) == len(batch)
+        for raw, record in zip(batch, results):
+            assert _without_timestamps(record) == _without_timestamps(DataNormalizer.normalize_stock_data(raw))
+
+    def test_zero_width_range(self):
+        """고가 = 저가인 종목은 0 나눗셈 없이 위치 알 수 없음"""
+        raw = {"status": "success", "symbol": "FLAT", "current_price": 10.0, "change": 0,
+               "52w_high": 10.0, "52w_low": 10.0, "pe_ratio": 20.0, "volume": 100}
+        record = DataNormalizer.normalize_stock_batch([raw])[0]
+
+        assert record["range_summary"]["position_percent"] is None
+        assert record["range_summary"]["position_description"] == "알 수 없음"
+        assert record["price_summary"]["trend"] == "보합"
+        assert record["valuation_summary"]["pe_evaluation"] == "적정"
+
+    def test_quote_tier_volume_not_available(self):
+        """시세 계층의 거래량 "N/A" 는 에러 없이 표시만 N/A"""
+        raw = {"status": "success", "symbol": "AAPL", "current_price": 150.0, "change": 1.0, "volume": "N/A"}
+
+        for record in (DataNormalizer.normalize_stock_data(raw), DataNormalizer.normalize_stock_batch([raw])[0]):
+            assert record["status"] == "success"
+            assert record["trading_summary"]["volume_formatted"] == "N/A"
+
+    def test_technical_summaries_by_symbol(self):
+        raw = {"status": "success", "symbol": "AAPL", "current_price": 150.0, "change": 1.0}
+        record = DataNormalizer.normalize_stock_batch([raw], technical_summaries={"AAPL": {"bars": 5}})[0]
+
+        assert record["technical_summary"] == {"bars": 5}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,74 @@
+"""
+디스크 캐시 테스트
+Disk Cache Tests
+"""
+import pytest
+import sys
+import os
+import time
+import multiprocessing
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tools.disk_cache import MarketDataDiskCache
+
+
+def _write_entries(path, worker_id, count):
+    """다른 프로세스에서 캐시에 기록"""
+    cache = MarketDataDiskCache(path)
+    for i in range(count):
+        cache.set("stock_quote", f"W{worker_id}_{i}", {"worker": worker_id, "i": i})
+
+
+class TestMarketDataDiskCache:
+    """MarketDataDiskCache 테스트"""
+    
+    def test_set_and_get(self, tmp_path):
+        """저장 후 조회"""
+        cache = MarketDataDiskCache(str(tmp_path / "cache.sqlite3"))
+        cache.set("stock_quote", "AAPL", {"symbol": "AAPL", "current_price": 150.0})
+        
+        value, age = cache.get("stock_quote", "AAPL", max_age=60)
+        assert value["current_price"] == 150.0
+        assert 0 <= age < 60
+        
+        assert cache.get("financial_news", "AAPL", max_age=60) == (None, None)
+    
+    def test_expired_entry_is_ignored(self, tmp_path):
+        """max_age 를 넘은 항목은 반환하지 않음"""
+        cache = MarketDataDiskCache(str(tmp_path / "cache.sqlite3"))
+        cache.set("stock_quote", "AAPL", {"current_price": 150.0})
+        time.sleep(0.05)
+        
+        assert cache.get("stock_quote", "AAPL", max_age=0.01) == (None, None)
+        assert cache.purge(max_age=0.01) == 1
+    
+    def test_persists_across_instances(self, tmp_path):
+        """새 인스턴스(재시작)에서도 최근 항목 적재"""
+        path = str(tmp_path / "cache.sqlite3")
+        MarketDataDiskCache(path).set("stock_quote", "MSFT", {"current_price": 400.0})
+        
+        entries = MarketDataDiskCache(path).load_recent("stock_quote", max_age=60)
+        assert [(key, value["current_price"]) for key, value, _ in entries] == [("MSFT", 400.0)]
+    
+    def test_multiple_processes_share_file(self, tmp_path):
+        """여러 프로세스가 동시에 기록"""
+        path = str(tmp_path / "cache.sqlite3")
+        MarketDataDiskCache(path)
+        
+        workers = [
+            multiprocessing.Process(target=_write_entries, args=(path, worker_id, 20))
+            for worker_id in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        
+        assert all(worker.exitcode == 0 for worker in workers)
+        assert len(MarketDataDiskCache(path).load_recent("stock_quote", max_age=60)) == 80
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,76 @@
+"""
+공유 HTTP 연결 풀 테스트
+Shared HTTP Connection Pool Tests
+"""
+import pytest
+import sys
+import os
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tools.http_client import HTTPClientPool
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    """keep-alive 를 지원하는 테스트용 JSON 서버"""
+    protocol_version = "HTTP/1.1"
+    
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        payload = json.dumps({"echo": json.loads(body)}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/search"
+    server.shutdown()
+    server.server_close()
+
+
+class TestHTTPClientPool:
+    """HTTPClientPool 테스트"""
+    
+    def test_sync_connection_reuse(self, server_url):
+        pool = HTTPClientPool(pool_size=2)
+        for i in range(3):
+            response = pool.post(server_url, json={"i": i})
+            assert response.json() == {"echo": {"i": i}}
+        
+        stats = pool.stats()
+        assert stats["requests"] == 3
+        assert stats["new_connections"] == 1
+        assert stats["reused_connections"] == 2
+        pool.close()
+    
+    def test_async_connection_reuse(self, server_url):
+        pool = HTTPClientPool(pool_size=2)
+        
+        async def run():
+            results = []
+            for i in range(3):
+                response = await pool.apost(server_url, json={"i": i})
+                results.append(response.json()["echo"]["i"])
+            await pool.aclose()
+            return results
+        
+        assert asyncio.run(run()) == [0, 1, 2]
+        stats = pool.stats()
+        assert stats["requests"] == 3
+        assert stats["new_connections"] == 1
+        assert stats["reuse_ratio"] == pytest.approx(2 / 3)
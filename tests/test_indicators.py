@@ -0,0 +1,133 @@
+"""
+기술적 지표 테스트
+Technical Indicator Tests
+"""
+import pytest
+import sys
+import os
+import json
+import numpy as np
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils import indicators
+from utils.data_normalizer import DataNormalizer
+from utils.indicator_state import IndicatorState
+
+
+def _prices(symbols=3, bars=120, seed=0):
+    """테스트용 랜덤 워크 가격"""
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.standard_normal((symbols, bars)).cumsum(axis=-1)
+    return close + 1, close - 1, close
+
+
+class TestIndicators:
+    """지표 계산 테스트"""
+    
+    def test_sma_matches_manual(self):
+        """SMA 는 윈도우 평균과 일치"""
+        values = np.arange(1, 11, dtype=float)
+        result = indicators.sma(values, 3)
+        
+        assert np.isnan(result[:2]).all()
+        assert result[2] == 2.0
+        assert result[-1] == 9.0
+    
+    def test_rsi_bounds(self):
+        """RSI 는 0~100, 단조 상승이면 100"""
+        _, _, close = _prices()
+        values = indicators.rsi(close)
+        valid = values[~np.isnan(values)]
+        assert ((valid >= 0) & (valid <= 100)).all()
+        
+        assert indicators.rsi(np.arange(30, dtype=float))[-1] == 100.0
+    
+    def test_batch_matches_single_symbol(self):
+        """2차원 일괄 계산은 심볼별 계산과 동일"""
+        high, low, close = _prices()
+        batch = indicators.compute_indicators(high, low, close)
+        single = indicators.compute_indicators(high[1], low[1], close[1])
+        
+        for name in batch:
+            np.testing.assert_allclose(batch[name][1], single[name], equal_nan=True)
+    
+    def test_short_history_returns_nan(self):
+        """기간이 부족하면 NaN"""
+        latest = indicators.latest_indicators([10.0, 11.0], [9.0, 10.0], [9.5, 10.5])
+        assert np.isnan(latest["sma_20"])
+        assert np.isnan(latest["rsi_14"])
+    
+    def test_normalized_payload_includes_technical_summary(self):
+        """정규화 결과에 지표 요약 포함"""
+        high, low, close = _prices(symbols=1)
+        raw = {
+            "symbol": "AAPL",
+            "status": "success",
+            "current_price": float(close[0, -1]),
+            "change": 1.0,
+            "change_percent": 0.5,
+            "volume": 1000,
+            "pe_ratio": 20.0,
+            "52w_high": float(high.max()),
+            "52w_low": float(low.min())
+        }
+        history = {"high": high[0], "low": low[0], "close": close[0]}
+        
+        normalized = DataNormalizer.normalize_stock_data(raw, history=history)
+        summary = normalized["technical_summary"]
+        
+        assert summary["bars"] == 120
+        assert summary["sma_50"] is not None
+        assert 0 <= summary["rsi_14"] <= 100
+
+
+
+class TestIndicatorState:
+    """증분 지표 상태 테스트"""
+    
+    def test_streaming_matches_batch(self):
+        """봉 단위 증분 계산은 일괄 계산과 동일"""
+        high, low, close = (values[0] for values in _prices(symbols=1, bars=200))
+        timestamps = np.arange(200)
+        
+        state = IndicatorState()
+        state.update_many(timestamps, high, low, close)
+        
+        streaming = state.snapshot()
+        batch = indicators.summarize_indicators({"high": high, "low": low, "close": close})
+        for name, value in batch.items():
+            assert streaming[name] == pytest.approx(value, abs=1e-3), name
+    
+    def test_checkpoint_resume_skips_seen_bars(self):
+        """체크포인트 복원 후 새 봉만 반영"""
+        high, low, close = (values[0] for values in _prices(symbols=1, bars=120))
+        timestamps = np.arange(120)
+        
+        full = IndicatorState()
+        full.update_many(timestamps, high, low, close)
+        
+        partial = IndicatorState()
+        partial.update_many(timestamps[:80], high[:80], low[:80], close[:80])
+        restored = IndicatorState.from_dict(json.loads(json.dumps(partial.to_dict())))
+        
+        # 겹치는 구간(70~79)은 무시되어야 함
+        assert restored.update_many(timestamps[70:], high[70:], low[70:], close[70:]) == 40
+        assert restored.snapshot() == full.snapshot()
+    
+    def test_preview_does_not_mutate_state(self):
+        """진행 중인 봉 미리보기는 상태를 바꾸지 않음"""
+        high, low, close = (values[0] for values in _prices(symbols=1, bars=60))
+        state = IndicatorState()
+        state.update_many(np.arange(59), high[:59], low[:59], close[:59])
+        before = state.snapshot()
+        
+        preview = state.preview(59, high[59], low[59], close[59])
+        
+        assert preview["bars"] == 60
+        assert state.snapshot() == before
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,122 @@
+"""
+LLM 응답 캐시 테스트
+LLM Response Cache Tests
+"""
+import pytest
+import sys
+import os
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tools.llm_cache import LLMResponseCache, llm_cache_key
+from tools.disk_cache import MarketDataDiskCache
+from agents import financial_agents
+from agents.financial_agents import FinancialAgent
+
+CONFIG = {"temperature": 0.1, "max_output_tokens": 1000, "top_p": 0.8, "top_k": 40}
+
+
+class FakeUsage:
+    total_token_count = 1234
+
+
+class FakeResponse:
+    usage_metadata = FakeUsage()
+
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeClient:
+    """호출 수를 세는 LLMClient 대역"""
+
+    model_name = "fake-model"
+
+    def __init__(self, error=None):
+        self.calls = 0
+        self.error = error
+
+    def generate_content(self, prompt, **kwargs):
+        self.calls += 1
+        if self.error:
+            raise RuntimeError(self.error)
+        return FakeResponse(f"응답 {self.calls}")
+
+
+class TestLLMResponseCache:
+    """LLMResponseCache 테스트"""
+
+    def test_key_covers_prompt_model_and_config(self):
+        base = llm_cache_key("p", "m", CONFIG)
+        assert base == llm_cache_key("p", "m", dict(CONFIG))
+        assert base != llm_cache_key("p2", "m", CONFIG)
+        assert base != llm_cache_key("p", "m2", CONFIG)
+        assert base != llm_cache_key("p", "m", {**CONFIG, "temperature": 0.7})
+
+    def test_memory_hit_reports_tokens(self):
+        cache = LLMResponseCache()
+        assert cache.get("k") == (None, None)
+        cache.set("k", "text", tokens=100)
+
+        assert cache.get("k") == ("text", "memory")
+        stats = cache.stats()
+        assert stats["memory_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["saved_tokens"] == 100
+        assert stats["avg_hit_latency_ms"] >= 0
+
+    def test_disk_tier_survives_new_cache(self, tmp_path):
+        disk = MarketDataDiskCache(str(tmp_path / "cache.sqlite3"))
+        LLMResponseCache(use_disk=True, disk_cache=disk).set("k", "text", tokens=7)
+
+        fresh = LLMResponseCache(use_disk=True, disk_cache=disk)
+        assert fresh.get("k") == ("text", "disk")
+        assert fresh.get("k") == ("text", "memory")
+        assert LLMResponseCache(disk_cache=disk).get("k") == (None, None)
+
+
+class TestCallLLMCache:
+    """FinancialAgent._call_llm 캐시 연동 테스트"""
+
+    def test_identical_prompt_hits_cache(self):
+        client = FakeClient()
+        cache = LLMResponseCache()
+        agent = FinancialAgent("dummy", llm_client=client, llm_cache=cache)
+        messages = [{"role": "user", "content": "AAPL 분석"}]
+
+        first = agent._call_llm(messages)
+        assert agent._call_llm(messages) == first
+        assert client.calls == 1
+        assert cache.stats()["saved_tokens"] == 1234
+
+        agent._call_llm(messages, temperature=0.7)
+        assert client.calls == 2
+
+    def test_fallback_is_not_cached(self):
+        client = FakeClient(error="429 quota exceeded")
+        cache = LLMResponseCache()
+        agent = FinancialAgent("dummy", llm_client=client, llm_cache=cache)
+        messages = [{"role": "user", "content": "quota"}]
+
+        try:
+            assert "할당량" in agent._call_llm(messages)
+            assert "할당량" in agent._call_llm(messages)
+        finally:
+            financial_agents.get_circuit_breaker(financial_agents.GEMINI).reset()
+        assert client.calls == 2
+        assert cache.stats()["stores"] == 0
+
+    def test_disabled_by_default(self):
+        client = FakeClient()
+        agent = FinancialAgent("dummy", llm_client=client)
+        messages = [{"role": "user", "content": "기본 설정"}]
+
+        assert agent.llm_cache is None
+        agent._call_llm(messages)
+        agent._call_llm(messages)
+        assert client.calls == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,105 @@
+"""
+공유 LLM 클라이언트/도구 레지스트리 테스트
+Shared LLM Client and Tool Registry Tests
+"""
+import pytest
+import sys
+import os
+import threading
+import time
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tools import llm_client
+from tools.llm_client import LLMClient, get_default_llm_client
+from tools.registry import ToolRegistry, get_tool_registry
+from workflows.financial_workflow import FinancialWorkflow
+
+
+class FakeModel:
+    """동시 호출 수를 기록하는 GenerativeModel 대역"""
+
+    created = 0
+
+    def __init__(self, model_name):
+        FakeModel.created += 1
+        self.model_name = model_name
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def generate_content(self, prompt, **kwargs):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.01)
+        with self._lock:
+            self.active -= 1
+        return prompt
+
+
+@pytest.fixture
+def fake_genai(monkeypatch):
+    FakeModel.created = 0
+    configured = []
+    monkeypatch.setattr(llm_client.genai, "GenerativeModel", FakeModel)
+    monkeypatch.setattr(llm_client.genai, "configure", lambda api_key: configured.append(api_key))
+    monkeypatch.setattr(llm_client, "_configured_api_key", None)
+    return configured
+
+
+class TestLLMClient:
+    """LLMClient 테스트"""
+
+    def test_lazy_initialization(self, fake_genai):
+        client = LLMClient("key")
+        assert FakeModel.created == 0
+        assert not client.stats()["initialized"]
+
+        assert client.generate_content("hi") == "hi"
+        client.generate_content("again")
+        assert FakeModel.created == 1
+        assert fake_genai == ["key"]
+        assert client.stats()["requests"] == 2
+
+    def test_concurrency_limit(self, fake_genai):
+        client = LLMClient("key", max_concurrency=2)
+        threads = [threading.Thread(target=client.generate_content, args=("p",)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert client.model.peak <= 2
+
+    def test_default_client_per_key(self):
+        assert get_default_llm_client("shared-key") is get_default_llm_client("shared-key")
+        assert get_default_llm_client("shared-key") is not get_default_llm_client("other-key")
+
+
+class TestToolRegistry:
+    """ToolRegistry 테스트"""
+
+    def test_tools_are_created_once_on_demand(self):
+        registry = ToolRegistry("tavily")
+        assert registry._news_tool is None
+
+        assert registry.news_tool is registry.news_tool
+        assert registry.news_tool.tavily_api_key == "tavily"
+        assert registry._stock_tool is None
+        assert get_tool_registry("tavily-x") is get_tool_registry("tavily-x")
+
+    def test_workflow_agents_share_client_and_tools(self):
+        first = FinancialWorkflow("dummy_key", "tavily")
+        second = FinancialWorkflow("dummy_key", "tavily")
+
+        agents = [first.research_agent, first.analysis_agent, first.recommendation_agent,
+                  first.review_agent, second.research_agent]
+        assert len({id(agent.llm_client) for agent in agents}) == 1
+        assert len({id(agent.tool_registry) for agent in agents}) == 1
+        assert first.research_agent.stock_tool is second.review_agent.stock_tool
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
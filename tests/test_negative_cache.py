@@ -0,0 +1,141 @@
+"""
+네거티브 캐시 및 에러 분류 테스트
+Negative Cache and Error Classification Tests
+"""
+import sys
+import os
+import time
+
+import pandas as pd
+import pytest
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tools.negative_cache import (
+    NegativeCache, PermanentToolError, PERMANENT, TRANSIENT, classify_error, classify_status
+)
+from tools import stock_tools
+from tools.quote_cache import TTLCache
+from tools.resilience import CircuitBreaker, YFINANCE, set_circuit_breaker
+from tools.stock_tools import StockDataTool, FinancialNewsTool, news_cache_key
+
+
+def _permanent_error(symbol):
+    return {
+        "symbol": symbol,
+        "status": "error",
+        "error": "주식 데이터 조회 실패: 상장폐지된 심볼",
+        "retry_hint": "심볼을 다시 확인해주세요.",
+        "error_class": PERMANENT
+    }
+
+
+def _daily_frame(symbol, closes):
+    """yf.download(group_by="ticker") 형태의 일봉 프레임"""
+    frame = pd.DataFrame({"Open": closes, "High": closes, "Low": closes, "Close": closes,
+                          "Volume": [1000] * len(closes)},
+                         index=pd.date_range("2024-01-01", periods=len(closes)))
+    return pd.concat({symbol: frame}, axis=1)
+
+
+@pytest.fixture
+def fresh_breaker():
+    set_circuit_breaker(CircuitBreaker(YFINANCE))
+    yield
+    set_circuit_breaker(CircuitBreaker(YFINANCE))
+
+
+class TestErrorClassification:
+    """에러 분류 테스트"""
+    
+    def test_classify_status(self):
+        assert classify_status(400) == PERMANENT
+        assert classify_status(401) == PERMANENT
+        assert classify_status(404) == PERMANENT
+        assert classify_status(429) == TRANSIENT
+        assert classify_status(408) == TRANSIENT
+        assert classify_status(503) == TRANSIENT
+    
+    def test_classify_error(self):
+        assert classify_error(PermanentToolError("x")) == PERMANENT
+        assert classify_error(Exception("$XYZ: possibly delisted; no price data found")) == PERMANENT
+        assert classify_error(TimeoutError("read timed out")) == TRANSIENT
+        assert classify_error(Exception("서버 에러: 502")) == TRANSIENT
+
+
+class TestNegativeCache:
+    """NegativeCache 테스트"""
+    
+    def test_stores_only_permanent_errors(self):
+        cache = NegativeCache()
+        
+        assert not cache.put("a", {"status": "success"})
+        assert not cache.put("b", {"status": "error", "error_class": TRANSIENT})
+        assert cache.put("c", _permanent_error("C"))
+        
+        assert cache.get("a") is None
+        assert cache.get("b") is None
+        assert cache.get("c")["error_class"] == PERMANENT
+        assert cache.stats() == {"saved_calls": 1, "stored": 1, "entries": 1}
+    
+    def test_expires(self):
+        cache = NegativeCache(ttl_seconds=0.05)
+        cache.put("c", _permanent_error("C"))
+        time.sleep(0.1)
+        
+        assert cache.get("c") is None
+        assert cache.stats()["saved_calls"] == 0
+    
+    def test_stock_tool_returns_cached_error(self):
+        """네거티브 캐시에 있는 심볼은 업스트림 호출 없이 바로 실패"""
+        cache = NegativeCache()
+        cache.put(("quote", "DLSTD"), _permanent_error("DLSTD"))
+        tool = StockDataTool(negative_cache=cache)
+        
+        start = time.perf_counter()
+        result = tool.run("DLSTD")
+        elapsed = time.perf_counter() - start
+        
+        assert result["status"] == "error"
+        assert result["error_class"] == PERMANENT
+        assert elapsed < 0.1
+        assert tool.cache_stats()["negative"]["saved_calls"] == 1
+    
+    def test_news_tool_returns_cached_error(self):
+        cache = NegativeCache()
+        cache.put(news_cache_key("bad query", 3), {"status": "error", "error": "클라이언트 에러: 400",
+                                     "retry_hint": "검색 쿼리를 수정해보세요.", "error_class": PERMANENT})
+        tool = FinancialNewsTool("dummy-key", negative_cache=cache)
+        
+        result = tool.run("  Bad   Query ", max_results=3)
+        
+        assert result["error"] == "클라이언트 에러: 400"
+        assert tool.cache_stats()["negative"]["saved_calls"] == 1
+
+    def test_empty_batch_is_transient(self, monkeypatch, fresh_breaker):
+        """네트워크 장애로 배치 전체가 비면 네거티브 캐시하지 않고 단건 조회는 업스트림을 다시 호출"""
+        monkeypatch.setattr(stock_tools.yf, "download", lambda *args, **kwargs: pd.DataFrame())
+        tool = StockDataTool(cache=TTLCache(), fundamentals_cache=TTLCache(), negative_cache=NegativeCache())
+        
+        results = tool.run_many(["AAPL", "MSFT"], max_retries=1)
+        
+        assert {result["error_class"] for result in results.values()} == {TRANSIENT}
+        assert len(tool.negative_cache) == 0
+        
+        fetched = []
+        monkeypatch.setattr(tool, "_fetch", lambda tier, symbol, max_retries: fetched.append(symbol) or
+                            StockDataTool._quote_result(symbol, 110.0, 100.0, 1000))
+        assert tool.run("AAPL", tier="quote")["status"] == "success"
+        assert fetched == ["AAPL"]
+    
+    def test_missing_symbol_in_partial_batch_is_permanent(self, monkeypatch, fresh_breaker):
+        monkeypatch.setattr(stock_tools.yf, "download",
+                            lambda *args, **kwargs: _daily_frame("AAPL", [100.0, 110.0]))
+        tool = StockDataTool(cache=TTLCache(), fundamentals_cache=TTLCache(), negative_cache=NegativeCache())
+        
+        results = tool.run_many(["AAPL", "DLSTD"], max_retries=1)
+        
+        assert results["AAPL"]["status"] == "success"
+        assert results["DLSTD"]["error_class"] == PERMANENT
+        assert tool.negative_cache.get(("quote", "DLSTD")) is not None
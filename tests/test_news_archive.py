@@ -0,0 +1,66 @@
+"""
+뉴스 아카이브 테스트
+News Archive Tests
+"""
+import sys
+import os
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tools.news_archive import NewsArchive
+from utils.data_normalizer import DataNormalizer
+
+
+def _item(n, url=None):
+    return {
+        "title": f"Headline {n}",
+        "snippet": "shares rise" if n % 2 else "shares fall",
+        "url": url or f"https://reuters.com/{n}",
+        "sentiment": "positive" if n % 2 else "negative",
+        "sentiment_emoji": ""
+    }
+
+
+class TestNewsArchive:
+    """NewsArchive 테스트"""
+    
+    def test_append_skips_seen_urls(self, tmp_path):
+        archive = NewsArchive(str(tmp_path))
+        
+        assert archive.append("AAPL", [_item(1), _item(2)]) == 2
+        batch = [_item(2, "https://www.reuters.com/2/?utm_source=rss"), _item(3)]
+        assert [item["title"] for item in archive.unseen("AAPL", batch)] == ["Headline 3"]
+        assert archive.append("AAPL", batch) == 1
+        
+        assert archive.count("AAPL") == 3
+        assert archive.count("MSFT") == 0
+    
+    def test_latest_newest_first(self, tmp_path):
+        archive = NewsArchive(str(tmp_path))
+        archive.append("AAPL", [_item(1), _item(2)])
+        archive.append("AAPL", [_item(3)])
+        
+        assert [item["title"] for item in archive.latest("AAPL", 2)] == ["Headline 3", "Headline 2"]
+        assert len(archive.latest("AAPL", 10)) == 3
+        assert archive.latest("MSFT") == []
+    
+    def test_persists_across_instances(self, tmp_path):
+        NewsArchive(str(tmp_path)).append("AAPL", [_item(1)])
+        
+        archive = NewsArchive(str(tmp_path))
+        assert archive.unseen("aapl", [_item(1), _item(2)]) == [_item(2)]
+        assert archive.latest("AAPL")[0]["title"] == "Headline 1"
+        assert archive.is_fresh("AAPL", 60)
+        assert not archive.is_fresh("MSFT", 60)
+    
+    def test_summarize_archived_items(self, tmp_path):
+        """아카이브 항목은 다시 점수 매기지 않고 요약"""
+        archive = NewsArchive(str(tmp_path))
+        archive.append("AAPL", [_item(1), _item(2), _item(3)])
+        
+        normalized = DataNormalizer.summarize_news_items(archive.latest("AAPL"))
+        
+        assert normalized["status"] == "success"
+        assert normalized["news_overview"]["sentiment_breakdown"] == {"positive": 2, "negative": 1, "neutral": 0}
+        assert normalized["news_overview"]["overall_sentiment"] == "긍정적"
@@ -0,0 +1,73 @@
+"""
+뉴스 결과 병합 테스트
+News Result Merging Tests
+"""
+import sys
+import os
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tools.news_merge import merge_ranked, url_fingerprint
+from tools.stock_tools import FinancialNewsTool
+from tools.symbol_universe import SymbolUniverse
+from agents.financial_agents import ResearchAgent
+
+
+def _item(title, url):
+    return {"title": title, "url": url, "snippet": "", "published_date": "N/A"}
+
+
+class TestNewsMerge:
+    """merge_ranked 테스트"""
+    
+    def test_url_fingerprint_normalization(self):
+        base = url_fingerprint("https://www.reuters.com/markets/apple-earnings/")
+        assert url_fingerprint("http://reuters.com/markets/apple-earnings?utm_source=x#top") == base
+        assert url_fingerprint("https://reuters.com/markets/apple-earnings?id=2") != base
+    
+    def test_dedupes_by_url_and_similar_title(self):
+        ticker = [
+            _item("Apple beats earnings estimates", "https://reuters.com/a"),
+            _item("Apple shares rise after iPhone launch", "https://cnbc.com/b"),
+        ]
+        company = [
+            _item("Apple beats earnings estimates", "https://www.reuters.com/a/?utm_medium=rss"),
+            _item("Apple Shares Rise After iPhone Launch!", "https://marketwatch.com/c"),
+            _item("Apple supplier outlook cut", "https://bloomberg.com/d"),
+        ]
+        
+        merged = merge_ranked([ticker, company])
+        
+        assert merged["duplicates_removed"] == 2
+        assert [item["url"] for item in merged["results"]] == [
+            "https://reuters.com/a", "https://cnbc.com/b", "https://bloomberg.com/d"
+        ]
+    
+    def test_rank_fusion_prefers_items_found_by_many_queries(self):
+        first = [_item("Only in first query", "https://a.com/1"), _item("Common story", "https://a.com/2")]
+        second = [_item("Only in second query", "https://b.com/1"), _item("Common story", "https://a.com/2")]
+        third = [_item("Common story", "https://a.com/2")]
+        
+        merged = merge_ranked([first, second, third], limit=2)
+        
+        assert merged["results"][0]["url"] == "https://a.com/2"
+        assert len(merged["results"]) == 2
+    
+    def test_missing_urls_are_not_collapsed(self):
+        merged = merge_ranked([[_item("First headline", "N/A"), _item("Second different story", "N/A")]])
+        assert len(merged["results"]) == 2
+    
+    def test_run_many_without_api_key(self):
+        result = FinancialNewsTool().run_many(["AAPL stock news", "AAPL earnings"])
+        assert result["status"] == "error"
+        assert "API 키가 설정되지 않았습니다" in result["error"]
+    
+    def test_research_query_fanout(self):
+        """리서치 단계는 기본적으로 티커 쿼리 하나만 검색 (설정 시 회사명/실적 쿼리 추가)"""
+        universe = SymbolUniverse([("AAPL", "Apple Inc. - Common Stock")])
+        
+        assert ResearchAgent("dummy", symbol_universe=universe)._news_queries("AAPL") == ["AAPL stock news"]
+        assert ResearchAgent("dummy", symbol_universe=universe, news_query_fanout=3)._news_queries("AAPL") == [
+            "AAPL stock news", "Apple Inc. news", "AAPL earnings"
+        ]
@@ -0,0 +1,112 @@
+"""
+OHLCV 저장소 테스트
+OHLCV Store Tests
+"""
+import pytest
+import sys
+import os
+import numpy as np
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tools.ohlcv_store import OHLCVStore
+
+DAY = 86400
+
+
+def _bars(start_day, count):
+    """테스트용 일봉 생성"""
+    ts = np.arange(start_day, start_day + count) * DAY
+    close = np.arange(count, dtype=np.float64) + 100.0
+    return ts, close - 1, close + 1, close - 2, close, np.full(count, 1000.0)
+
+
+class TestOHLCVStore:
+    """OHLCVStore 테스트"""
+    
+    def test_append_and_read(self, tmp_path):
+        """추가 후 전체 조회"""
+        store = OHLCVStore(str(tmp_path))
+        assert store.append("AAPL", "1d", *_bars(0, 10)) == 10
+        
+        columns = store.read("AAPL", "1d")
+        assert len(columns["close"]) == 10
+        assert columns["close"][-1] == 109.0
+        assert isinstance(columns["close"].base, np.ndarray)  # 메모리 매핑 뷰
+    
+    def test_incremental_append_skips_old_and_overwrites_last(self, tmp_path):
+        """이전 봉은 무시하고 마지막 봉은 덮어씀"""
+        store = OHLCVStore(str(tmp_path))
+        store.append("AAPL", "1d", *_bars(0, 5))
+        
+        ts, o, h, l, c, v = _bars(3, 5)  # day 3~7: 3은 무시, 4는 덮어씀, 5~7 추가
+        c = c + 50
+        assert store.append("AAPL", "1d", ts, o, h, l, c, v) == 3
+        
+        columns = store.read("AAPL", "1d")
+        assert list(columns["timestamp"] // DAY) == [0, 1, 2, 3, 4, 5, 6, 7]
+        assert columns["close"][4] == 151.0
+    
+    def test_capacity_growth(self, tmp_path):
+        """capacity 초과 시 확장 후에도 데이터 유지"""
+        store = OHLCVStore(str(tmp_path), initial_capacity=4)
+        store.append("MSFT", "1d", *_bars(0, 3))
+        store.append("MSFT", "1d", *_bars(3, 10))
+        
+        meta = store.info("MSFT", "1d")
+        assert meta["rows"] == 13
+        assert meta["capacity"] >= 13
+        expected = np.concatenate([np.arange(3), np.arange(10)]) + 100.0
+        np.testing.assert_array_equal(store.read("MSFT", "1d")["close"], expected)
+    
+    def test_growth_keeps_existing_views(self, tmp_path):
+        """확장 전에 반환한 뷰는 이전 매핑을 계속 보고, 이전 파일은 정리됨"""
+        store = OHLCVStore(str(tmp_path), initial_capacity=4)
+        store.append("MSFT", "1d", *_bars(0, 4))
+        before = store.read("MSFT", "1d")["close"]
+        old_file = store.info("MSFT", "1d")["file"]
+        
+        store.append("MSFT", "1d", *_bars(4, 10))
+        
+        np.testing.assert_array_equal(before, np.arange(4) + 100.0)
+        assert store.info("MSFT", "1d")["file"] != old_file
+        assert not os.path.exists(tmp_path / old_file)
+    
+    def test_interrupted_growth_keeps_history(self, tmp_path, monkeypatch):
+        """인덱스 저장 전에 중단되어도 재시작 후 기존 데이터를 그대로 읽음"""
+        store = OHLCVStore(str(tmp_path), initial_capacity=4)
+        store.append("MSFT", "1d", *_bars(0, 4))
+        
+        def crash():
+            raise OSError("disk full")
+        monkeypatch.setattr(store, "_save_index", crash)
+        with pytest.raises(OSError):
+            store.append("MSFT", "1d", *_bars(4, 10))
+        
+        reopened = OHLCVStore(str(tmp_path), initial_capacity=4)
+        np.testing.assert_array_equal(reopened.read("MSFT", "1d")["close"], np.arange(4) + 100.0)
+        assert reopened.append("MSFT", "1d", *_bars(4, 10)) == 10
+        assert len(reopened.read("MSFT", "1d")["close"]) == 14
+    
+    def test_range_query(self, tmp_path):
+        """날짜 범위 조회"""
+        store = OHLCVStore(str(tmp_path))
+        store.append("AAPL", "1d", *_bars(0, 100))
+        
+        window = store.range("AAPL", "1d", start=10 * DAY, end=19 * DAY)
+        assert len(window["close"]) == 10
+        assert window["timestamp"][0] == 10 * DAY
+        assert store.range("TSLA", "1d") is None
+    
+    def test_index_persists(self, tmp_path):
+        """인덱스가 재시작 후에도 유지"""
+        OHLCVStore(str(tmp_path)).append("AAPL", "1d", *_bars(0, 5))
+        
+        store = OHLCVStore(str(tmp_path))
+        assert store.last_timestamp("AAPL", "1d") == 4 * DAY
+        assert len(store.read("AAPL", "1d")["open"]) == 5
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,73 @@
+"""
+시세 캐시 테스트
+Quote Cache Tests
+"""
+import pytest
+import sys
+import os
+import time
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tools.quote_cache import TTLCache, FRESH, STALE
+
+
+class TestTTLCache:
+    """TTLCache 테스트"""
+    
+    def test_fresh_hit_and_miss(self):
+        """신선한 히트와 미스 카운트"""
+        cache = TTLCache(ttl_seconds=60)
+        cache.set("AAPL", {"symbol": "AAPL", "current_price": 100})
+        
+        value, state = cache.get("AAPL")
+        assert state == FRESH
+        assert value["current_price"] == 100
+        
+        value, state = cache.get("MSFT")
+        assert value is None and state is None
+        
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+    
+    def test_stale_then_expired(self):
+        """TTL 경과 후 stale, stale 기간 경과 후 만료"""
+        cache = TTLCache(ttl_seconds=0.01, stale_ttl_seconds=0.05)
+        cache.set("AAPL", {"current_price": 100})
+        
+        time.sleep(0.02)
+        _, state = cache.get("AAPL")
+        assert state == STALE
+        
+        time.sleep(0.06)
+        _, state = cache.get("AAPL")
+        assert state is None
+        assert cache.stats()["expirations"] == 1
+    
+    def test_lru_eviction_by_count(self):
+        """항목 수 한도 초과 시 가장 오래 사용되지 않은 항목 축출"""
+        cache = TTLCache(max_entries=2)
+        cache.set("A", 1)
+        cache.set("B", 2)
+        cache.get("A")  # A를 최근 사용으로 갱신
+        cache.set("C", 3)
+        
+        assert cache.get("B") == (None, None)
+        assert cache.get("A")[1] == FRESH
+        assert cache.stats()["evictions"] == 1
+    
+    def test_eviction_by_bytes(self):
+        """바이트 한도 초과 시 축출"""
+        cache = TTLCache(max_entries=100, max_bytes=200)
+        for i in range(10):
+            cache.set(f"K{i}", "x" * 50)
+        
+        stats = cache.stats()
+        assert stats["bytes"] <= 200
+        assert stats["evictions"] > 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
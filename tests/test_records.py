@@ -0,0 +1,93 @@
+"""
+정규화 결과 레코드 테스트
+Normalized Result Record Tests
+"""
+import pytest
+import sys
+import os
+import json
+import dataclasses
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.data_normalizer import DataNormalizer
+from utils.records import (
+    QuoteRecord, NewsRecord, CalculationRecord, as_dict, json_default, to_serializable, deep_sizeof
+)
+
+RAW_QUOTE = {
+    "status": "success", "symbol": "AAPL", "current_price": 189.3, "change": 1.2,
+    "change_percent": 0.0064, "volume": 51234567, "market_cap": 2.9e12, "pe_ratio": 29.4,
+    "52w_high": 199.6, "52w_low": 164.1
+}
+RAW_NEWS = {
+    "status": "success",
+    "query": "AAPL",
+    "results": [
+        {"title": f"Apple shares rise {i}", "url": f"https://r.com/{i}", "snippet": "Strong demand " * 10}
+        for i in range(5)
+    ],
+    "total_results": 5
+}
+
+
+def _without_raw(normalized):
+    return {k: v for k, v in normalized.items() if k != "_raw"}
+
+
+class TestRecords:
+    """레코드 변환 테스트"""
+
+    def test_quote_round_trip(self):
+        normalized = DataNormalizer.normalize_stock_data(RAW_QUOTE, technical_summary={"bars": 10})
+        record = QuoteRecord.from_normalized(normalized)
+
+        assert record.to_dict() == _without_raw(normalized)
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            record.current = 0
+
+    def test_news_round_trip(self):
+        normalized = DataNormalizer.normalize_news_data(RAW_NEWS)
+        record = NewsRecord.from_normalized(normalized)
+
+        assert record.to_dict() == _without_raw(normalized)
+        assert record.items[0].sentiment == "positive"
+
+    def test_calculation_round_trip(self):
+        ok = {"status": "success", "result": 6.44, "expression": "189.3 / 29.4"}
+        failed = {"status": "error", "error": "0으로 나눌 수 없습니다.", "expression": "1/0",
+                  "retry_hint": "계산식을 확인해주세요."}
+
+        assert CalculationRecord.from_result(ok).to_dict() == ok
+        assert CalculationRecord.from_result(failed).to_dict() == failed
+
+    def test_serialization_boundary(self):
+        record = QuoteRecord.from_normalized(DataNormalizer.normalize_stock_data(RAW_QUOTE))
+        state = {"stock_data": record, "tool_history": [{"output": CalculationRecord("1+1", "success", 2)}]}
+
+        assert json.loads(json.dumps(record, default=json_default))["symbol"] == "AAPL"
+        assert as_dict({"status": "success"}) == {"status": "success"}
+        serialized = to_serializable(state)
+        assert serialized["stock_data"]["price_summary"]["current"] == 189.3
+        assert serialized["tool_history"][0]["output"]["result"] == 2
+
+    def test_state_memory_smaller_than_dicts(self):
+        """레코드 상태는 _raw 를 포함한 중첩 dict 상태보다 작음"""
+        stock = DataNormalizer.normalize_stock_data(RAW_QUOTE)
+        news = DataNormalizer.normalize_news_data(RAW_NEWS)
+        tool_history = [{"output": RAW_QUOTE}, {"output": RAW_NEWS}]
+
+        before = deep_sizeof({"stock_data": stock, "news_data": news, "tool_history": tool_history})
+        after = deep_sizeof({
+            "stock_data": QuoteRecord.from_normalized(stock),
+            "news_data": NewsRecord.from_normalized(news),
+            "tool_history": tool_history
+        })
+
+        assert after < before
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
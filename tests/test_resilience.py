@@ -0,0 +1,108 @@
+"""
+서킷 브레이커 및 재시도 예산 테스트
+Circuit Breaker and Retry Budget Tests
+"""
+import sys
+import os
+import time
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tools.resilience import (
+    CircuitBreaker, RetryBudget, CLOSED, OPEN, HALF_OPEN, TAVILY,
+    allow_attempt, get_circuit_breaker, set_circuit_breaker, get_retry_budget, set_retry_budget
+)
+from tools.stock_tools import FinancialNewsTool
+from tools.negative_cache import NegativeCache
+
+
+class TestCircuitBreaker:
+    """CircuitBreaker 테스트"""
+    
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout=60)
+        
+        for _ in range(2):
+            breaker.record_failure()
+        breaker.record_success()  # 성공하면 연속 실패 초기화
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.state == CLOSED
+        
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        assert not breaker.allow()
+        assert breaker.stats()["rejected"] == 1
+    
+    def test_half_open_trial(self):
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure()
+        assert not breaker.allow()
+        
+        time.sleep(0.1)
+        assert breaker.state == HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()  # 시험 호출은 하나만
+        
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        
+        time.sleep(0.1)
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CLOSED
+
+
+class TestRetryBudget:
+    """RetryBudget 테스트"""
+    
+    def test_retries_capped_by_traffic(self):
+        budget = RetryBudget(ratio=0.1, min_tokens=2, max_tokens=10)
+        
+        assert budget.try_acquire()
+        assert budget.try_acquire()
+        assert not budget.try_acquire()
+        
+        for _ in range(10):
+            budget.record_request()
+        assert budget.try_acquire()
+        assert not budget.try_acquire()
+        
+        assert budget.stats()["retries"] == 3
+        assert budget.stats()["denied"] == 2
+    
+    def test_allow_attempt(self):
+        previous = get_retry_budget()
+        set_retry_budget(RetryBudget(ratio=0.0, min_tokens=1))
+        try:
+            breaker = CircuitBreaker("test")
+            assert allow_attempt(breaker, 0)
+            assert allow_attempt(breaker, 1)
+            assert not allow_attempt(breaker, 2)  # 예산 소진
+            assert allow_attempt(breaker, 0)      # 첫 시도는 항상 허용
+        finally:
+            set_retry_budget(previous)
+
+
+class TestToolCircuit:
+    """도구 서킷 오픈 시 빠른 실패"""
+    
+    def test_news_tool_fails_fast_when_open(self):
+        previous = get_circuit_breaker(TAVILY)
+        breaker = CircuitBreaker(TAVILY, failure_threshold=1, reset_timeout=60)
+        breaker.record_failure()
+        set_circuit_breaker(breaker)
+        try:
+            tool = FinancialNewsTool("dummy-key", negative_cache=NegativeCache())
+            
+            start = time.perf_counter()
+            result = tool.run("circuit open test")
+            elapsed = time.perf_counter() - start
+            
+            assert result["status"] == "error"
+            assert "서킷 오픈" in result["error"]
+            assert result["error_class"] == "transient"
+            assert elapsed < 0.1
+        finally:
+            set_circuit_breaker(previous)
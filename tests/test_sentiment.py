@@ -0,0 +1,67 @@
+"""
+감성 점수기 테스트
+Sentiment Scorer Tests
+"""
+import sys
+import os
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.sentiment import (
+    SentimentScorer, POSITIVE, NEGATIVE, NEUTRAL, load_lexicon, _trie_regex
+)
+from utils.data_normalizer import DataNormalizer
+
+
+class TestSentimentScorer:
+    """SentimentScorer 테스트"""
+
+    def test_word_boundaries_for_english(self):
+        scorer = SentimentScorer({"gain": 1.0, "rise": 1.0, "fall": -1.0})
+        assert scorer.matches("Enterprise stands against the fallout") == []
+        assert scorer.matches("Shares gain as profits rise") == ["gain", "rise"]
+
+    def test_korean_terms_match_inside_words(self):
+        scorer = SentimentScorer({"상승": 1.0, "부진": -1.5})
+        assert scorer.matches("주가 상승세, 실적부진 우려") == ["상승", "부진"]
+        assert scorer.label("주가 상승세, 실적부진 우려") == NEGATIVE
+
+    def test_longest_match_and_phrases(self):
+        scorer = SentimentScorer({"rise": 1.0, "rises": 1.0, "cuts guidance": -2.0})
+        assert scorer.matches("Stock rises") == ["rises"]
+        assert scorer.matches("Company cuts   guidance") == ["cuts guidance"]
+
+    def test_weights_decide_label(self):
+        scorer = SentimentScorer({"beat": 1.0, "plunge": -3.0})
+        assert scorer.score("Beat estimates but shares plunge") == (1.0, 3.0)
+        assert scorer.label("Beat estimates but shares plunge") == NEGATIVE
+        assert scorer.label("nothing here") == NEUTRAL
+
+    def test_large_lexicon(self):
+        lexicon = {f"term{i}": 1.0 for i in range(5000)}
+        lexicon["crash"] = -10.0
+        scorer = SentimentScorer(lexicon)
+        assert len(scorer) == 5001
+        assert scorer.label_many(["term42 term4999", "term1 crash", "term"]) == [POSITIVE, NEGATIVE, NEUTRAL]
+
+    def test_trie_regex_shares_prefixes(self):
+        assert _trie_regex(["rise", "rises", "rising"]) == "ris(?:e(?:s)?|ing)"
+
+    def test_load_lexicon(self, tmp_path):
+        path = tmp_path / "lexicon.tsv"
+        path.write_text("# comment\n호재\t2\nsell-off\t-1.5\nupbeat\n", encoding="utf-8")
+        assert load_lexicon(str(path)) == {"호재": 2.0, "sell-off": -1.5, "upbeat": 1.0}
+
+    def test_normalize_news_data_uses_scorer(self):
+        normalized = DataNormalizer.normalize_news_data({
+            "status": "success",
+            "query": "AAPL",
+            "results": [
+                {"title": "Apple shares rise", "snippet": "", "url": "u1"},
+                {"title": "Apple stands against rivals", "snippet": "", "url": "u2"},
+                {"title": "애플 주가 급락", "snippet": "", "url": "u3"},
+            ]
+        })
+        labels = [item["sentiment"] for item in normalized["news_items"]]
+        assert labels == [POSITIVE, NEUTRAL, NEGATIVE]
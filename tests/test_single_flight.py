@@ -0,0 +1,106 @@
+"""
+요청 병합 테스트
+Single-Flight Coalescing Tests
+"""
+import pytest
+import sys
+import os
+import asyncio
+import threading
+import time
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tools.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """SingleFlight 테스트"""
+    
+    def test_threaded_callers_share_one_call(self):
+        """동시 스레드 호출은 한 번만 실행"""
+        flight = SingleFlight()
+        calls = []
+        
+        def fetch():
+            calls.append(1)
+            time.sleep(0.1)
+            return {"symbol": "NVDA", "status": "success"}
+        
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(flight.do("NVDA", fetch)))
+            for _ in range(10)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert len(calls) == 1
+        assert len(results) == 10
+        assert all(r["symbol"] == "NVDA" for r in results)
+        assert flight.stats()["coalesced_calls"] == 9
+    
+    def test_threaded_error_propagates_to_all(self):
+        """예외는 모든 대기자에게 전파"""
+        flight = SingleFlight()
+        errors = []
+        
+        def fetch():
+            time.sleep(0.1)
+            raise RuntimeError("upstream down")
+        
+        def caller():
+            try:
+                flight.do("NVDA", fetch)
+            except RuntimeError as e:
+                errors.append(str(e))
+        
+        threads = [threading.Thread(target=caller) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert errors == ["upstream down"] * 5
+    
+    def test_async_callers_share_one_call(self):
+        """동시 코루틴 호출은 한 번만 실행"""
+        flight = SingleFlight()
+        calls = []
+        
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "result"
+        
+        async def main():
+            return await asyncio.gather(*(flight.ado("AAPL", fetch) for _ in range(20)))
+        
+        results = asyncio.run(main())
+        
+        assert len(calls) == 1
+        assert results == ["result"] * 20
+    
+    def test_async_error_propagates_to_all(self):
+        """코루틴 호출 예외 전파"""
+        flight = SingleFlight()
+        
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise ValueError("bad symbol")
+        
+        async def main():
+            return await asyncio.gather(
+                *(flight.ado("BAD", fetch) for _ in range(3)),
+                return_exceptions=True
+            )
+        
+        results = asyncio.run(main())
+        assert all(isinstance(r, ValueError) for r in results)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
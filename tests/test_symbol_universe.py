@@ -0,0 +1,71 @@
+"""
+심볼 유니버스 인덱스 테스트
+Symbol Universe Index Tests
+"""
+import sys
+import os
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tools.symbol_universe import SymbolUniverse, is_valid_symbol_format, load_symbol_universe
+
+NASDAQ_LISTING = """Symbol|Security Name|Market Category|Test Issue|Financial Status|Round Lot Size|ETF|NextShares
+AAPL|Apple Inc. - Common Stock|Q|N|N|100|N|N
+AMZN|Amazon.com, Inc. - Common Stock|Q|N|N|100|N|N
+AAL|American Airlines Group, Inc. - Common Stock|Q|N|N|100|N|N
+ZXZZT|NASDAQ TEST STOCK|G|Y|N|100|N|N
+File Creation Time: 1017202608:30|||||||
+"""
+
+
+class TestSymbolUniverse:
+    """SymbolUniverse 테스트"""
+    
+    def test_format_check(self):
+        """네트워크 없는 형식 검사"""
+        for symbol in ["AAPL", "brk.b", "BF-B", "^GSPC", "005930.KS"]:
+            assert is_valid_symbol_format(symbol), symbol
+        for symbol in ["", "___", "INVALID_SYMBOL_12345", "A B"]:
+            assert not is_valid_symbol_format(symbol), symbol
+    
+    def test_load_nasdaq_listing(self, tmp_path):
+        """NASDAQ Trader 형식 로드 (테스트 종목/푸터 제외)"""
+        path = tmp_path / "nasdaqlisted.txt"
+        path.write_text(NASDAQ_LISTING, encoding="utf-8")
+        
+        universe = SymbolUniverse.load(str(path))
+        
+        assert len(universe) == 3
+        assert "aapl" in universe
+        assert "ZXZZT" not in universe
+        assert universe.name("AMZN").startswith("Amazon")
+    
+    def test_suggest_prefix(self):
+        """접두사 검색은 사전순, limit 개까지"""
+        universe = SymbolUniverse.from_symbols(["MSFT", "AAPL", "AAL", "AMZN", "AA"])
+        
+        assert [s["symbol"] for s in universe.suggest("AA")] == ["AA", "AAL", "AAPL"]
+        assert [s["symbol"] for s in universe.suggest("a", limit=2)] == ["AA", "AAL"]
+        assert universe.suggest("Q") == []
+    
+    def test_validate_unknown_symbol(self):
+        """상장 목록에 없는 심볼은 비슷한 심볼과 함께 실패"""
+        universe = SymbolUniverse.from_symbols(["AAPL", "AAL", "MSFT"])
+        
+        assert universe.validate("aapl")["status"] == "success"
+        
+        result = universe.validate("AAPX")
+        assert result["status"] == "error"
+        assert "retry_hint" in result
+        assert result["suggestions"] == ["AAPL"]
+        
+        assert universe.validate("___")["status"] == "error"
+    
+    def test_empty_universe_checks_format_only(self, tmp_path):
+        """유니버스가 없으면 형식만 검사"""
+        assert load_symbol_universe(str(tmp_path / "missing.txt")) is None
+        
+        universe = SymbolUniverse()
+        assert universe.validate("ANYTHING")["status"] == "success"
+        assert universe.validate("INVALID_SYMBOL_12345")["status"] == "error"
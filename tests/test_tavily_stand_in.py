@@ -0,0 +1,93 @@
+"""
+로컬 Tavily 호환 서버 테스트
+Local Tavily Stand-In Server Tests
+"""
+import pytest
+import sys
+import os
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tools.tavily_stand_in import TavilyStandInServer, UNIFORM
+from tools.http_client import HTTPClientPool
+from tools.negative_cache import NegativeCache, PERMANENT
+from tools.resilience import CircuitBreaker, TAVILY, set_circuit_breaker
+from tools.stock_tools import FinancialNewsTool
+
+
+@pytest.fixture(autouse=True)
+def fresh_breaker():
+    set_circuit_breaker(CircuitBreaker(TAVILY))
+    yield
+    set_circuit_breaker(CircuitBreaker(TAVILY))
+
+
+def make_tool(server):
+    return FinancialNewsTool(
+        "test-key",
+        negative_cache=NegativeCache(),
+        http_pool=HTTPClientPool(pool_size=4),
+        search_url=server.url
+    )
+
+
+class TestTavilyStandInServer:
+    """TavilyStandInServer 테스트"""
+
+    def test_synthetic_results_are_deterministic(self):
+        with TavilyStandInServer(seed=1) as server:
+            tool = make_tool(server)
+            first = tool.run("AAPL earnings", max_results=3)
+            second = tool.run("AAPL earnings", max_results=3)
+
+        assert first["status"] == "success"
+        assert first["total_results"] == 3
+        assert [r["url"] for r in first["results"]] == [r["url"] for r in second["results"]]
+        assert server.stats()["status_counts"] == {200: 2}
+
+    def test_recorded_results(self, tmp_path):
+        recorded = tmp_path / "recorded.json"
+        recorded.write_text(
+            '{"financial news aapl": [{"title": "Recorded", "url": "https://r.com/1", "content": "x"}]}'
+        )
+        with TavilyStandInServer(recorded_path=str(recorded)) as server:
+            result = make_tool(server).run("AAPL")
+
+        assert result["results"][0]["title"] == "Recorded"
+
+    def test_client_errors_are_permanent(self):
+        with TavilyStandInServer(error_rate_4xx=1.0) as server:
+            result = make_tool(server).run("AAPL", max_retries=3)
+
+        assert result["status"] == "error"
+        assert result["error_class"] == PERMANENT
+        assert server.stats()["requests"] == 1
+
+    def test_rate_limit_returns_429(self):
+        with TavilyStandInServer(max_rps=2) as server:
+            pool = HTTPClientPool(pool_size=1)
+            statuses = [pool.post(server.url, json={"query": "q"}).status_code for _ in range(4)]
+
+        assert statuses[:2] == [200, 200]
+        assert 429 in statuses[2:]
+
+    def test_latency_distribution(self):
+        with TavilyStandInServer(latency_ms=20, latency_jitter_ms=5, latency_distribution=UNIFORM,
+                                 seed=3) as server:
+            make_tool(server).run("MSFT", max_results=1)
+
+        assert server.stats()["p50_ms"] >= 15
+
+    def test_latency_window_is_bounded(self):
+        with TavilyStandInServer(latency_window=3) as server:
+            for elapsed in (0.5, 0.5, 0.001, 0.002, 0.003):
+                server._record(200, elapsed)
+
+        stats = server.stats()
+        assert stats["requests"] == 5
+        assert stats["p99_ms"] == 3.0
+
+    def test_unknown_distribution(self):
+        with pytest.raises(ValueError):
+            TavilyStandInServer(latency_distribution="gamma")
@@ -0,0 +1,133 @@
+"""
+LLM 토큰 스트리밍 테스트
+LLM Token Streaming Tests
+"""
+import pytest
+import sys
+import os
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tools.llm_cache import LLMResponseCache
+from utils.analysis_reuse import AnalysisReuseCache
+from agents import financial_agents
+from agents.financial_agents import FinancialAgent
+from workflows.financial_workflow import FinancialWorkflow
+
+MESSAGES = [{"role": "user", "content": "AAPL 분석"}]
+
+
+class Chunk:
+    usage_metadata = None
+
+    def __init__(self, text):
+        self.text = text
+
+
+class FinalChunk:
+    """Part 없이 종료 사유만 담긴 마지막 조각 (.text 접근 시 ValueError)"""
+    usage_metadata = None
+
+    @property
+    def text(self):
+        raise ValueError("The `response.text` quick accessor requires the response to contain a valid `Part`")
+
+
+class StreamingClient:
+    """stream_content 로 조각을 내보내는 LLMClient 대역 (fail_after 조각 이후 예외)"""
+
+    model_name = "fake-model"
+
+    def __init__(self, pieces=("1. 보유", " - ", "근거"), fail_after=None, final_chunk=False):
+        self.pieces = pieces
+        self.fail_after = fail_after
+        self.final_chunk = final_chunk
+        self.calls = 0
+
+    def stream_content(self, prompt, **kwargs):
+        self.calls += 1
+        for i, piece in enumerate(self.pieces):
+            if self.fail_after is not None and i == self.fail_after:
+                raise RuntimeError("connection reset")
+            yield Chunk(piece)
+        if self.final_chunk:
+            yield FinalChunk()
+
+    def generate_content(self, prompt, **kwargs):
+        raise AssertionError("스트리밍 호출이어야 합니다")
+
+
+class TestCallLLMStreaming:
+    """_call_llm 스트리밍 테스트"""
+
+    def test_tokens_forwarded_and_cached(self):
+        client, cache = StreamingClient(), LLMResponseCache()
+        agent = FinancialAgent("dummy", llm_client=client, llm_cache=cache)
+        tokens = []
+
+        assert agent._call_llm(MESSAGES, on_token=tokens.append) == "1. 보유 - 근거"
+        assert tokens == ["1. 보유", " - ", "근거"]
+
+        # 캐시 히트는 전체 응답을 한 조각으로 전달
+        tokens.clear()
+        assert agent._call_llm(MESSAGES, on_token=tokens.append) == "1. 보유 - 근거"
+        assert tokens == ["1. 보유 - 근거"]
+        assert client.calls == 1
+
+    def test_final_chunk_without_parts(self):
+        client = StreamingClient(final_chunk=True)
+        agent = FinancialAgent("dummy", llm_client=client, llm_cache=LLMResponseCache())
+        tokens = []
+
+        assert agent._call_llm(MESSAGES, on_token=tokens.append) == "1. 보유 - 근거"
+        assert tokens == ["1. 보유", " - ", "근거"]
+        assert client.calls == 1
+
+    def test_no_retry_after_partial_output(self):
+        client = StreamingClient(fail_after=1)
+        agent = FinancialAgent("dummy", llm_client=client, llm_cache=LLMResponseCache())
+        tokens = []
+
+        try:
+            result = agent._call_llm(MESSAGES, on_token=tokens.append)
+        finally:
+            financial_agents.get_circuit_breaker(financial_agents.GEMINI).reset()
+
+        assert "LLM 호출 중 오류" in result
+        assert tokens == ["1. 보유"]
+        assert client.calls == 1
+
+
+class TestWorkflowStreaming:
+    """FinancialWorkflow.stream 토큰 이벤트 테스트"""
+
+    def test_token_events_precede_node_completion(self, monkeypatch):
+        monkeypatch.setenv("AUTO_APPROVE", "true")
+        workflow = FinancialWorkflow("dummy_key", llm_cache=LLMResponseCache())
+        client = StreamingClient()
+        for agent in (workflow.analysis_agent, workflow.recommendation_agent, workflow.review_agent):
+            agent.llm_client = client
+            agent._reuse_cache = AnalysisReuseCache()
+
+        quote = {
+            "status": "success", "symbol": "AAPL", "current_price": 189.3, "change": 1.2,
+            "change_percent": 0.0064, "volume": 100, "market_cap": 2.9e12, "pe_ratio": 29.4,
+            "52w_high": 199.6, "52w_low": 164.1
+        }
+        research = workflow.research_agent
+        monkeypatch.setattr(research.stock_tool, "run", lambda symbol, tier="full": dict(quote))
+        monkeypatch.setattr(research.news_tool, "run_many",
+                            lambda queries, max_results=3: {"status": "success", "results": []})
+
+        events = list(workflow.stream({"stock_symbol": "AAPL", "user_query": "AAPL 분석", "max_iterations": 1}))
+        sequence = [(event["type"], event["node"]) for event in events]
+
+        analyze_done = sequence.index(("node", "analyze"))
+        assert sequence[analyze_done - 3:analyze_done] == [("token", "analyze")] * 3
+        assert ("token", "review") in sequence
+        assert events[-1]["node"] == "review"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -5,11 +5,19 @@ Tool Unit Tests
 import pytest
 import sys
 import os
+import asyncio
+import threading
+
+import pandas as pd
 
 # 프로젝트 루트를 파이썬 경로에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from tools.stock_tools import StockDataTool, FinancialNewsTool
+from tools import stock_tools
+from tools.stock_tools import StockDataTool, FinancialNewsTool, news_cache_key
+from tools.quote_cache import TTLCache
+from tools.negative_cache import NegativeCache, PERMANENT
+from tools.resilience import CircuitBreaker, YFINANCE, set_circuit_breaker
 from tools.calculator_tool import CalculatorTool
 
 
@@ -41,6 +49,206 @@ class TestStockDataTool:
         assert result["status"] == "error"
         assert "error" in result
         assert "retry_hint" in result
+    
+    def test_stock_data_tool_quote_tier(self):
+        """시세 계층 테스트 (펀더멘털 필드 없음)"""
+        result = self.tool.run("AAPL", tier="quote")
+        
+        assert result["symbol"] == "AAPL"
+        if result["status"] == "success":
+            assert result["tier"] == "quote"
+            assert "current_price" in result
+            assert "pe_ratio" not in result
+    
+    def test_stock_data_tool_merge_without_fundamentals(self):
+        """펀더멘털 조회 실패 시 시세만 유지하고 N/A 로 채움"""
+        quote = StockDataTool._quote_result("AAPL", 110.0, 100.0, 1000)
+        merged = StockDataTool._merge(quote, {"symbol": "AAPL", "status": "error", "error": "x"})
+        
+        assert merged["status"] == "success"
+        assert "tier" not in merged
+        assert merged["change"] == pytest.approx(10.0)
+        assert merged["change_percent"] == pytest.approx(10.0)
+        assert merged["pe_ratio"] == "N/A"
+        assert merged["52w_high"] == "N/A"
+
+    def test_full_tier_fetches_tiers_concurrently(self, monkeypatch):
+        """full 계층은 시세와 펀더멘털을 동시에 조회 (두 조회가 서로를 기다려야 끝남)"""
+        tool = StockDataTool(cache=TTLCache(), fundamentals_cache=TTLCache())
+        both_started = threading.Barrier(2, timeout=5)
+        
+        def fetch(tier, symbol, max_retries):
+            both_started.wait()
+            if tier == "quote":
+                return StockDataTool._quote_result(symbol, 110.0, 100.0, 1000)
+            return {"status": "success", "symbol": symbol, "market_cap": 1e9, "pe_ratio": 20.0,
+                    "52w_high": 120.0, "52w_low": 90.0}
+        monkeypatch.setattr(tool, "_fetch", fetch)
+        
+        result = tool.run("ZZZQ")
+        
+        assert result["pe_ratio"] == 20.0
+        assert result["current_price"] == 110.0
+
+def _ohlcv(closes, highs=None, lows=None):
+    """yf.download 일봉 프레임 (한 심볼)"""
+    return pd.DataFrame({
+        "Open": closes,
+        "High": highs or closes,
+        "Low": lows or closes,
+        "Close": closes,
+        "Volume": [1000 + i for i in range(len(closes))]
+    }, index=pd.date_range("2024-01-01", periods=len(closes)))
+
+
+class TestStockDataToolRunMany:
+    """run_many 일괄 조회 테스트 (yf.download 대역)"""
+    
+    def setup_method(self):
+        set_circuit_breaker(CircuitBreaker(YFINANCE))
+        self.tool = StockDataTool(cache=TTLCache(), fundamentals_cache=TTLCache(), negative_cache=NegativeCache())
+        self.calls = []
+    
+    def teardown_method(self):
+        set_circuit_breaker(CircuitBreaker(YFINANCE))
+    
+    def _download(self, monkeypatch, history):
+        def download(symbols, **kwargs):
+            self.calls.append(list(symbols))
+            return history
+        monkeypatch.setattr(stock_tools.yf, "download", download)
+    
+    def test_multi_index_columns(self, monkeypatch):
+        self._download(monkeypatch, pd.concat({
+            "AAPL": _ohlcv([100.0, 110.0]),
+            "MSFT": _ohlcv([200.0, 190.0])
+        }, axis=1))
+        
+        results = self.tool.run_many(["AAPL", "MSFT"])
+        
+        assert results["AAPL"]["current_price"] == 110.0
+        assert results["AAPL"]["change_percent"] == pytest.approx(10.0)
+        assert results["AAPL"]["volume"] == 1001
+        assert results["MSFT"]["change"] == pytest.approx(-10.0)
+        assert self.calls == [["AAPL", "MSFT"]]
+    
+    def test_single_symbol_single_level_columns(self, monkeypatch):
+        self._download(monkeypatch, _ohlcv([50.0]))
+        
+        result = self.tool.run_many(["IBM"])["IBM"]
+        
+        assert result["status"] == "success"
+        assert result["current_price"] == 50.0
+        assert result["change"] == "N/A"
+    
+    def test_duplicates_fetched_once_and_cached(self, monkeypatch):
+        self._download(monkeypatch, pd.concat({"AAPL": _ohlcv([100.0, 110.0])}, axis=1))
+        
+        results = self.tool.run_many(["AAPL", "AAPL"])
+        again = self.tool.run_many(["AAPL"])
+        
+        assert list(results) == ["AAPL"]
+        assert again["AAPL"]["current_price"] == 110.0
+        assert self.calls == [["AAPL"]]
+    
+    def test_errors_mixed_with_successes(self, monkeypatch):
+        self._download(monkeypatch, pd.concat({"AAPL": _ohlcv([100.0, 110.0])}, axis=1))
+        
+        results = self.tool.run_many(["", "AAPL", "DLSTD"])
+        
+        assert results[""]["status"] == "error"
+        assert "retry_hint" in results[""]
+        assert results["AAPL"]["status"] == "success"
+        assert results["DLSTD"]["status"] == "error"
+        assert results["DLSTD"]["error_class"] == PERMANENT
+        assert self.calls == [["AAPL", "DLSTD"]]
+    
+    def test_52_week_range_fallback(self, monkeypatch):
+        """펀더멘털이 캐시에 없으면 1년치 일봉의 고가/저가로 52주 범위를 채움"""
+        self._download(monkeypatch, pd.concat({
+            "AAPL": _ohlcv([100.0, 110.0, 105.0], highs=[120.0, 115.0, 108.0], lows=[95.0, 99.0, 101.0])
+        }, axis=1))
+        
+        result = self.tool.run_many(["AAPL"])["AAPL"]
+        
+        assert result["52w_high"] == 120.0
+        assert result["52w_low"] == 95.0
+        assert result["pe_ratio"] == "N/A"
+        assert "tier" not in result
+
+
+class FakeSearchPool:
+    """쿼리별 Tavily 응답을 돌려주는 HTTPClientPool 대역 (동기/비동기)"""
+    
+    class Response:
+        status_code = 200
+        
+        def __init__(self, payload):
+            self.payload = payload
+        
+        def json(self):
+            return self.payload
+    
+    def _respond(self, json):
+        query = json["query"]
+        return self.Response({"results": [
+            {"title": f"{query} headline {i}", "url": f"https://reuters.com/{abs(hash(query))}/{i}",
+             "content": "snippet"}
+            for i in range(json["max_results"])
+        ]})
+    
+    def post(self, url, headers=None, json=None):
+        return self._respond(json)
+    
+    async def apost(self, url, headers=None, json=None):
+        return self._respond(json)
+
+
+class TestAsyncSuccessPaths:
+    """비동기 진입점 성공 경로: 동기 run 과 같은 결과"""
+    
+    def setup_method(self):
+        set_circuit_breaker(CircuitBreaker(YFINANCE))
+    
+    def _stock_tool(self, monkeypatch):
+        tool = StockDataTool(cache=TTLCache(), fundamentals_cache=TTLCache(), negative_cache=NegativeCache())
+        
+        def fetch_once(tier, symbol, attempt, start_time):
+            if tier == "quote":
+                return StockDataTool._quote_result(symbol, 110.0, 100.0, 1000)
+            return {"status": "success", "symbol": symbol, "market_cap": 1e9, "pe_ratio": 20.0,
+                    "52w_high": 120.0, "52w_low": 90.0}
+        monkeypatch.setattr(tool, "_fetch_once", fetch_once)
+        return tool
+    
+    def _news_tool(self):
+        return FinancialNewsTool("key", negative_cache=NegativeCache(), http_pool=FakeSearchPool())
+    
+    def test_stock_arun_matches_run(self, monkeypatch):
+        for tier in ("full", "quote"):
+            expected = self._stock_tool(monkeypatch).run("ZZZQ", tier=tier)
+            result = asyncio.run(self._stock_tool(monkeypatch).arun("ZZZQ", tier=tier))
+            
+            assert result["status"] == "success"
+            assert result == expected
+    
+    def test_news_arun_matches_run(self):
+        expected = self._news_tool().run("AAPL earnings", max_results=2)
+        result = asyncio.run(self._news_tool().arun("AAPL earnings", max_results=2))
+        
+        assert result["status"] == "success"
+        assert len(result["results"]) == 2
+        assert result == expected
+    
+    def test_news_arun_many_matches_run_many(self):
+        queries = ["AAPL stock news", "Apple news", "aapl  STOCK news"]
+        expected = self._news_tool().run_many(queries, max_results=2)
+        result = asyncio.run(self._news_tool().arun_many(queries, max_results=2))
+        
+        assert result["status"] == "success"
+        assert result["queries"] == ["AAPL stock news", "Apple news"]
+        assert len(result["results"]) == 4
+        assert result == expected
 
 
 class TestCalculatorTool:
@@ -72,6 +280,13 @@ class TestCalculatorTool:
         
         assert isinstance(result, dict)
         assert result["status"] == "error"
+    
+    def test_calculator_arun(self):
+        """비동기 계산 테스트"""
+        result = asyncio.run(self.tool.arun("5*8"))
+        
+        assert result["status"] == "success"
+        assert result["result"] == 40
 
 
 class TestFinancialNewsTool:
@@ -90,6 +305,33 @@ class TestFinancialNewsTool:
         assert result["status"] == "error"
         assert "API 키가 설정되지 않았습니다" in result["error"]
     
+    def test_news_tool_arun_no_api_key(self):
+        """비동기 검색 - API 키 없음 테스트"""
+        result = asyncio.run(self.tool.arun("AAPL earnings"))
+        
+        assert result["status"] == "error"
+        assert "API 키가 설정되지 않았습니다" in result["error"]
+    
+    def test_news_cache_key_normalization(self):
+        """쿼리 대소문자/공백, 도메인 순서와 무관한 캐시 키"""
+        assert news_cache_key("  AAPL   Stock news ", 3, ["cnbc.com", "Reuters.com"]) == \
+            news_cache_key("aapl stock news", 3, ["reuters.com", "cnbc.com"])
+        assert news_cache_key("aapl", 3) != news_cache_key("aapl", 5)
+        assert news_cache_key("aapl", 3, ["cnbc.com"]) != news_cache_key("aapl", 3, ["reuters.com"])
+    
+    def test_normalized_news_cache(self):
+        """정규화된 뉴스 결과 저장/조회 (성공 결과만 저장)"""
+        tool = FinancialNewsTool(normalized_cache=TTLCache(ttl_seconds=60))
+        normalized = {"status": "success", "news_items": [{"title": "t"}]}
+        
+        assert tool.cached_normalized("AAPL stock news", 3) is None
+        tool.store_normalized("AAPL stock news", 3, normalized)
+        tool.store_normalized("MSFT stock news", 3, {"status": "error"})
+        
+        assert tool.cached_normalized("aapl  stock news", 3) == normalized
+        assert tool.cached_normalized("MSFT stock news", 3) is None
+        assert tool.cache_stats()["normalized"]["hits"] == 1
+    
     @pytest.mark.skip(reason="API 키가 필요한 테스트")
     def test_news_tool_with_api_key(self):
         """API 키 있는 경우 테스트 (실제 API 키 필요)"""